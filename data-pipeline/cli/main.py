@@ -20,11 +20,22 @@ from dotenv import load_dotenv
 _env_path = _Path(__file__).parent.parent.parent / ".env"
 load_dotenv(_env_path)
 
-import asyncio
+import atexit
+import base64
 import csv
+import itertools
+import json
 import logging
-import sys
+import secrets
+import socket
+import subprocess
+import time
+import urllib.error
+import urllib.request
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Annotated
 
@@ -72,6 +83,7 @@ def collect(
     workers: Annotated[int | None, typer.Option("--workers", help="Number of concurrent workers")] = None,
     timeout: Annotated[float | None, typer.Option("--timeout", help="Request timeout in seconds")] = None,
     jitter: Annotated[float | None, typer.Option("--jitter", help="Random jitter range in seconds")] = None,
+    no_cache: Annotated[bool, typer.Option("--no-cache", help="Ignore cached US metrics / KR history and re-fetch")] = False,
 ) -> None:
     """Collect stock data for specified market(s).
 
@@ -119,41 +131,55 @@ def collect(
     rate_limit_hit = False
     markets_to_collect = ["kr", "us"] if market == "all" else [market]
 
-    for m in markets_to_collect:
-        if not quiet:
-            console.print(f"\n[bold blue]Collecting {m.upper()} stocks...[/bold blue]")
-
-        try:
-            result = _run_collection(
-                market=m,
-                resume=resume,
-                save_db=save_db,
-                test=test,
-                quiet=quiet,
-                batch_size=batch_size,
-                tickers_file=tickers_file,
-                limit=limit,
-                delay=delay,
-                workers=workers,
-                timeout=timeout,
-                jitter=jitter,
-            )
-
-            if result.rate_limit_hit:
-                rate_limit_hit = True
-                console.print(f"[yellow]Rate limit hit for {m.upper()}[/yellow]")
-                console.print("[yellow]Progress saved. Run with --resume to continue.[/yellow]")
-            else:
-                console.print(f"[green]{m.upper()} collection completed![/green]")
-                console.print(f"  Success: {result.success}/{result.total}")
-                if result.missing_tickers:
-                    console.print(f"  Missing: {len(result.missing_tickers)}")
+    # Markets are independent and network-bound, so collect them concurrently.
+    # Output interleaves, so every line is prefixed with its market.
+    with ThreadPoolExecutor(max_workers=len(markets_to_collect)) as executor:
+        futures = {}
+        for m in markets_to_collect:
+            if not quiet:
+                console.print(f"\n[bold blue]Collecting {m.upper()} stocks...[/bold blue]")
+            futures[
+                executor.submit(
+                    _run_collection,
+                    market=m,
+                    resume=resume,
+                    save_db=save_db,
+                    test=test,
+                    quiet=quiet,
+                    batch_size=batch_size,
+                    tickers_file=tickers_file,
+                    limit=limit,
+                    delay=delay,
+                    workers=workers,
+                    timeout=timeout,
+                    jitter=jitter,
+                    no_cache=no_cache,
+                )
+            ] = m
+
+        for future in as_completed(futures):
+            m = futures[future]
+            prefix = f"[{m.upper()}]"
+            try:
+                result = future.result()
+
+                if result.rate_limit_hit:
+                    rate_limit_hit = True
+                    console.print(f"[yellow]{prefix} Rate limit hit[/yellow]")
+                    console.print(
+                        f"[yellow]{prefix} Progress saved. Run with --resume to continue.[/yellow]"
+                    )
+                else:
+                    console.print(f"[green]{prefix} Collection completed![/green]")
+                    console.print(f"  {prefix} Success: {result.success}/{result.total}")
+                    if result.missing_tickers:
+                        console.print(f"  {prefix} Missing: {len(result.missing_tickers)}")
 
-        except Exception as e:
-            logger.error(f"{m.upper()} collection failed: {e}")
-            console.print(f"[red]{m.upper()} collection failed: {e}[/red]")
-            if "rate limit" in str(e).lower():
-                rate_limit_hit = True
+            except Exception as e:
+                logger.error(f"{m.upper()} collection failed: {e}")
+                console.print(f"[red]{prefix} Collection failed: {e}[/red]")
+                if "rate limit" in str(e).lower():
+                    rate_limit_hit = True
 
     # Backup phase
     if not no_backup and not rate_limit_hit:
@@ -238,10 +264,13 @@ def version() -> None:
 def update_tickers(
     market: Annotated[str, typer.Argument(help="Market to update: us, kr, or all")] = "all",
     dry_run: Annotated[bool, typer.Option("--dry-run", "-n", help="Show changes without saving")] = False,
+    force: Annotated[bool, typer.Option("--force", "-f", help="Fetch even if ticker list is fresh")] = False,
     quiet: Annotated[bool, typer.Option("--quiet", "-q", help="Minimal output")] = False,
 ) -> None:
     """Update ticker universe from official sources.
 
+    Lists refreshed within the last 24 hours are kept as-is unless --force.
+
     Sources:
         US: NASDAQ FTP (nasdaqlisted.txt, otherlisted.txt)
         KR: FDR KRX-DESC (FinanceDataReader)
@@ -250,6 +279,7 @@ def update_tickers(
         stock-pipeline update-tickers all
         stock-pipeline update-tickers kr --dry-run
         stock-pipeline update-tickers us -q
+        stock-pipeline update-tickers all --force
     """
     setup_logging(quiet=quiet)
     from cli.tickers import update_tickers as do_update
@@ -266,7 +296,7 @@ def update_tickers(
             console.print(f"\n[bold blue]Updating {m.upper()} tickers...[/bold blue]")
 
         try:
-            result = do_update(m, dry_run=dry_run)
+            result = do_update(m, dry_run=dry_run, force=force)
 
             if result.errors:
                 console.print(f"[red]Error: {result.errors[0]}[/red]")
@@ -275,25 +305,19 @@ def update_tickers(
             # Show results
             console.print(f"  Total: {result.total} tickers")
 
+            if result.cached:
+                console.print("  [dim](up to date - use --force to re-fetch)[/dim]")
+                continue
+
             if result.added:
                 console.print(f"  [green]+ Added: {len(result.added)}[/green]")
-                if not quiet and len(result.added) <= 20:
-                    for t in result.added[:20]:
-                        console.print(f"    + {t}")
-                elif not quiet:
-                    console.print("    (showing first 20)")
-                    for t in result.added[:20]:
-                        console.print(f"    + {t}")
+                if not quiet:
+                    _print_ticker_list(result.added, "+")
 
             if result.removed:
                 console.print(f"  [yellow]- Removed: {len(result.removed)}[/yellow]")
-                if not quiet and len(result.removed) <= 20:
-                    for t in result.removed[:20]:
-                        console.print(f"    - {t}")
-                elif not quiet:
-                    console.print("    (showing first 20)")
-                    for t in result.removed[:20]:
-                        console.print(f"    - {t}")
+                if not quiet:
+                    _print_ticker_list(result.removed, "-")
 
             if dry_run:
                 console.print("  [dim](dry run - no changes saved)[/dim]")
@@ -310,6 +334,14 @@ def update_tickers(
 # ==================== Helper Functions ====================
 
 
+def _print_ticker_list(tickers: list[str], sign: str, max_shown: int = 20) -> None:
+    """Print up to max_shown tickers in a single console write."""
+    lines = [f"    {sign} {t}" for t in tickers[:max_shown]]
+    if len(tickers) > max_shown:
+        lines.insert(0, f"    (showing first {max_shown})")
+    console.print("\n".join(lines), markup=False)
+
+
 @dataclass
 class CollectionResultAdapter:
     """Adapter to match the old collector result interface."""
@@ -333,6 +365,7 @@ def _run_collection(
     workers: int | None = None,
     timeout: float | None = None,
     jitter: float | None = None,
+    no_cache: bool = False,
 ) -> CollectionResultAdapter:
     """Run collection for a single market using the new pipeline architecture."""
     logger = logging.getLogger(__name__)
@@ -341,17 +374,23 @@ def _run_collection(
     # Load tickers from file if provided
     tickers: list[str] | None = None
     if tickers_file and tickers_file.exists():
-        with open(tickers_file) as f:
-            tickers = [
-                line.strip()
-                for line in f
-                if line.strip() and not line.startswith("#")
-            ]
+        # Stop reading early when limited (test mode filters the full list)
+        tickers = list(
+            itertools.islice(_iter_tickers_file(tickers_file), None if test else limit)
+        )
 
     # Load default tickers if not provided
     if tickers is None:
         tickers = _load_default_tickers(market, settings)
 
+    # Drop repeated rows (stale or dual-listed entries) so each is fetched once
+    unique_tickers = list(dict.fromkeys(tickers))
+    if len(unique_tickers) != len(tickers):
+        logger.warning(
+            f"Dropped {len(tickers) - len(unique_tickers)} duplicate tickers"
+        )
+        tickers = unique_tickers
+
     # Apply test mode
     if test:
         if market.lower() == "us":
@@ -378,6 +417,7 @@ def _run_collection(
             delay=delay,
             timeout=timeout,
             jitter=jitter,
+            no_cache=no_cache,
         )
     else:  # kr
         result = _run_kr_collection(
@@ -385,6 +425,7 @@ def _run_collection(
             resume=resume,
             batch_size=batch_size,
             timeout=timeout,
+            no_cache=no_cache,
         )
 
     # Save to CSV
@@ -408,6 +449,15 @@ def _run_collection(
     )
 
 
+def _iter_tickers_file(path: Path) -> Iterator[str]:
+    """Yield tickers from a plain text file, skipping blanks and comments."""
+    with open(path) as f:
+        for line in f:
+            ticker = line.strip()
+            if ticker and not ticker.startswith("#"):
+                yield ticker
+
+
 def _load_default_tickers(market: str, settings) -> list[str]:
     """Load default tickers from CSV file."""
     if market.lower() == "us":
@@ -435,8 +485,10 @@ def _run_us_collection(
     delay: float | None = None,
     timeout: float | None = None,
     jitter: float | None = None,
+    no_cache: bool = False,
 ):
     """Run US collection using the new pipeline."""
+    from core.event_loop import run_async
     from us import USConfig, collect_us
 
     # Build config with overrides
@@ -449,11 +501,13 @@ def _run_us_collection(
         config_kwargs["download_timeout"] = timeout
     if jitter is not None:
         config_kwargs["batch_jitter"] = jitter
+    if no_cache:
+        config_kwargs["metrics_cache_ttl"] = 0
 
     config = USConfig(**config_kwargs) if config_kwargs else None
 
     # Run async collection
-    return asyncio.run(collect_us(tickers=tickers, config=config, resume=resume))
+    return run_async(collect_us(tickers=tickers, config=config, resume=resume))
 
 
 def _run_kr_collection(
@@ -461,12 +515,14 @@ def _run_kr_collection(
     resume: bool = False,  # Ignored - KR doesn't need resume (no rate limiting)
     batch_size: int | None = None,
     timeout: float | None = None,
+    no_cache: bool = False,
 ):
     """Run KR collection using the new pipeline.
 
     Note: resume parameter is ignored for KR as it completes quickly
     without rate limiting concerns.
     """
+    from core.event_loop import run_async
     from kr import KRConfig, collect_kr
 
     # Build config with overrides
@@ -475,11 +531,13 @@ def _run_kr_collection(
         config_kwargs["history_batch_size"] = batch_size
     if timeout is not None:
         config_kwargs["fdr_timeout"] = timeout
+    if no_cache:
+        config_kwargs["history_cache_ttl"] = 0
 
     config = KRConfig(**config_kwargs) if config_kwargs else None
 
     # Run async collection (resume not supported for KR)
-    return asyncio.run(collect_kr(tickers=tickers, config=config))
+    return run_async(collect_kr(tickers=tickers, config=config))
 
 
 def _save_to_csv(market: str, data: list[dict], settings) -> None:
@@ -521,19 +579,24 @@ def _save_to_csv(market: str, data: list[dict], settings) -> None:
         "bb_upper", "bb_middle", "bb_lower", "bb_percent", "volume_change",
     ]
 
-    # Write prices.csv
+    # Write prices.csv and metrics.csv together in a single pass over the rows
     prices_file = versioned.version_dir / "prices.csv"
-    with open(prices_file, "w", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=price_fields, extrasaction="ignore")
-        writer.writeheader()
-        writer.writerows(data)
-
-    # Write metrics.csv
     metrics_file = versioned.version_dir / "metrics.csv"
-    with open(metrics_file, "w", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=metrics_fields, extrasaction="ignore")
-        writer.writeheader()
-        writer.writerows(data)
+    with (
+        open(prices_file, "w", newline="") as prices_f,
+        open(metrics_file, "w", newline="") as metrics_f,
+    ):
+        prices_writer = csv.DictWriter(
+            prices_f, fieldnames=price_fields, extrasaction="ignore"
+        )
+        metrics_writer = csv.DictWriter(
+            metrics_f, fieldnames=metrics_fields, extrasaction="ignore"
+        )
+        prices_writer.writeheader()
+        metrics_writer.writeheader()
+        for row in data:
+            prices_writer.writerow(row)
+            metrics_writer.writerow(row)
 
     # Update symlinks
     versioned.update_symlinks()
@@ -619,6 +682,9 @@ COLUMN_MAX_VALUES = {
     "market_cap": 1e18,
 }
 
+# Rows per upsert request (same chunking as SupabaseStorage)
+DB_UPSERT_CHUNK_SIZE = 1000
+
 
 def _save_to_db(market: str, data: list[dict]) -> None:
     """Save collected data to Supabase.
@@ -795,8 +861,8 @@ def _save_to_db(market: str, data: list[dict]) -> None:
 
     # Upsert metrics
     if metrics_data:
-        for i in range(0, len(metrics_data), 100):
-            batch = metrics_data[i:i + 100]
+        for i in range(0, len(metrics_data), DB_UPSERT_CHUNK_SIZE):
+            batch = metrics_data[i:i + DB_UPSERT_CHUNK_SIZE]
             try:
                 client.table("metrics").upsert(
                     batch, on_conflict="company_id,date"
@@ -828,8 +894,8 @@ def _save_to_db(market: str, data: list[dict]) -> None:
 
     # Upsert prices
     if prices_data:
-        for i in range(0, len(prices_data), 100):
-            batch = prices_data[i:i + 100]
+        for i in range(0, len(prices_data), DB_UPSERT_CHUNK_SIZE):
+            batch = prices_data[i:i + DB_UPSERT_CHUNK_SIZE]
             try:
                 client.table("prices").upsert(
                     batch, on_conflict="company_id,date"
@@ -874,14 +940,117 @@ def _fetch_company_mapping(client, market: str) -> dict[tuple[str, str], str]:
     return {(r["ticker"], r["market"]): r["id"] for r in all_companies}
 
 
+RCLONE_RC_TIMEOUT = 10  # Seconds for control calls (noop)
+RCLONE_COPY_TIMEOUT = 3600  # Seconds for a sync/copy call to return
+
+
+def _free_local_addr() -> str:
+    """Return a localhost address with a port no one is listening on."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        host, port = sock.getsockname()
+    return f"{host}:{port}"
+
+
+@lru_cache(maxsize=1)
+def _rclone_daemon() -> tuple[str, str]:
+    """Start a persistent `rclone rcd` and return its (url, auth header).
+
+    Reusing one daemon for every copy avoids paying rclone's config load,
+    token refresh and connection setup per invocation. The daemon is bound
+    to a free localhost port (so it can't collide with another rcd),
+    protected by per-process credentials, and stopped at exit.
+    """
+    addr = _free_local_addr()
+    user, password = "pipeline", secrets.token_urlsafe(16)
+    proc = subprocess.Popen(
+        [
+            "rclone", "rcd",
+            f"--rc-addr={addr}",
+            f"--rc-user={user}",
+            f"--rc-pass={password}",
+        ],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    atexit.register(proc.terminate)
+
+    url = f"http://{addr}"
+    auth = "Basic " + base64.b64encode(f"{user}:{password}".encode()).decode()
+
+    # Wait for the RC server to accept requests
+    deadline = time.monotonic() + 10
+    while True:
+        try:
+            _rclone_rc(url, auth, "rc/noop", {})
+            return url, auth
+        except OSError:
+            if proc.poll() is not None or time.monotonic() > deadline:
+                proc.terminate()
+                raise RuntimeError("rclone rcd failed to start") from None
+            time.sleep(0.2)
+
+
+def _rclone_rc(
+    url: str,
+    auth: str,
+    command: str,
+    params: dict,
+    timeout: float = RCLONE_RC_TIMEOUT,
+) -> dict:
+    """Call an rclone remote-control command and return its JSON response."""
+    request = urllib.request.Request(
+        f"{url}/{command}",
+        data=json.dumps(params).encode(),
+        headers={"Content-Type": "application/json", "Authorization": auth},
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            return json.loads(response.read() or b"{}")
+    except urllib.error.HTTPError as e:
+        detail = json.loads(e.read() or b"{}").get("error", e.reason)
+        raise RuntimeError(f"rclone {command} failed: {detail}") from None
+
+
+def _rclone_copy(src: Path, dst: str) -> None:
+    """Copy a local directory to Google Drive through the rclone daemon."""
+    url, auth = _rclone_daemon()
+    _rclone_rc(
+        url,
+        auth,
+        "sync/copy",
+        {"srcFs": str(src), "dstFs": f"gdrive:{dst}"},
+        timeout=RCLONE_COPY_TIMEOUT,
+    )
+
+
+BACKUP_STATE_FILE = ".last_backup"
+
+
+def _load_backup_state(data_dir: Path) -> dict:
+    """Load what the previous backup uploaded (empty if never backed up)."""
+    try:
+        return json.loads((data_dir / BACKUP_STATE_FILE).read_text())
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def _save_backup_state(data_dir: Path, state: dict) -> None:
+    """Persist backup state so unchanged data is skipped next time."""
+    (data_dir / BACKUP_STATE_FILE).write_text(json.dumps(state, indent=2))
+
+
 def _run_backup() -> None:
-    """Run Google Drive backup using rclone."""
-    import subprocess
+    """Run Google Drive backup using rclone.
 
+    Versions and companies already uploaded by a previous run (recorded in
+    ``data_dir/.last_backup``) are skipped without spawning rclone.
+    """
     from storage.base import VersionedPath
 
     settings = get_settings()
-    backed_up = False
+    state = _load_backup_state(settings.data_dir)
+    found = False
 
     # Backup each market's latest data
     for market in ["us", "kr"]:
@@ -890,26 +1059,36 @@ def _run_backup() -> None:
         if latest is None:
             console.print(f"[yellow]No {market.upper()} data to backup (no 'latest' symlink)[/yellow]")
             continue
+        found = True
 
         # Backup versioned data (e.g., us/2026-01-03/v1/)
         latest_path = f"{market}/{latest.date_str}/v{latest.version}"
+        if state.get(market) == latest_path:
+            console.print(f"[dim]No new {market.upper()} data since last backup ({latest_path})[/dim]")
+            continue
+
         console.print(f"[blue]Backing up {market.upper()} data: {latest_path}[/blue]")
-        subprocess.run(
-            ["rclone", "copy", str(latest.version_dir), f"gdrive:{latest_path}", "--progress"],
-            check=True,
-        )
-        backed_up = True
+        _rclone_copy(latest.version_dir, latest_path)
+        state[market] = latest_path
+        _save_backup_state(settings.data_dir, state)
 
-    if not backed_up:
+    if not found:
         raise RuntimeError("No data to backup (no 'latest' symlinks found)")
 
     # Backup companies
     companies_dir = settings.companies_dir
     if companies_dir.exists():
-        subprocess.run(
-            ["rclone", "copy", str(companies_dir), "gdrive:companies/", "--progress"],
-            check=True,
+        companies_mtime = max(
+            (p.stat().st_mtime for p in companies_dir.iterdir() if p.is_file()),
+            default=0.0,
         )
+        if companies_mtime <= state.get("companies_mtime", -1.0):
+            console.print("[dim]No company list changes since last backup[/dim]")
+            return
+
+        _rclone_copy(companies_dir, "companies/")
+        state["companies_mtime"] = companies_mtime
+        _save_backup_state(settings.data_dir, state)
 
 
 def _run_db_load(
@@ -918,26 +1097,14 @@ def _run_db_load(
     version: str | None = None,
 ) -> None:
     """Run CSV to Supabase loading."""
-    # Import and run the existing loader
     from loaders.csv_to_db import main as csv_to_db_main
 
-    args = []
-    if market == "us":
-        args.append("--us-only")
-    elif market == "kr":
-        args.append("--kr-only")
-    if date_str:
-        args.extend(["--date", date_str])
-    if version:
-        args.extend(["--version", version])
-
-    # The loader uses argparse, so we need to set sys.argv
-    old_argv = sys.argv
-    sys.argv = ["csv_to_db"] + args
-    try:
-        csv_to_db_main()
-    finally:
-        sys.argv = old_argv
+    csv_to_db_main(
+        us_only=market == "us",
+        kr_only=market == "kr",
+        target_date=date_str,
+        version=version,
+    )
 
 
 if __name__ == "__main__":
@@ -5,12 +5,15 @@ import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import date
-from enum import Enum
-from typing import Any
+from enum import StrEnum
+from itertools import filterfalse
 
 import pandas as pd
 
+from common.indicators import calculate_technicals_batch
 from config import Settings, get_settings
+from core.errors import is_rate_limit_error
+from core.event_loop import new_runner
 from processors.validators import MetricsValidator
 from rate_limit import (
     AdaptiveRateLimitStrategy,
@@ -24,7 +27,7 @@ from storage import Storage
 logger = logging.getLogger(__name__)
 
 
-class CollectionPhase(Enum):
+class CollectionPhase(StrEnum):
     """Phases of the collection process."""
 
     INIT = "init"
@@ -38,7 +41,10 @@ class CollectionPhase(Enum):
     COMPLETE = "complete"
 
 
-@dataclass
+_PHASE_LOG_MESSAGES = {phase: f"=== Phase: {phase} ===" for phase in CollectionPhase}
+
+
+@dataclass(slots=True)
 class CollectionResult:
     """Result of a collection operation."""
 
@@ -81,6 +87,11 @@ class BaseCollector(ABC):
     8. quality_check_phase() - Check data quality
     """
 
+    # Set when fetch_metrics_phase doesn't read ``history`` and uses a
+    # different provider than fetch_history_phase. Metrics are then fetched
+    # concurrently with history and receive an empty history dict.
+    concurrent_history_metrics: bool = False
+
     def __init__(
         self,
         market: str,
@@ -115,6 +126,12 @@ class BaseCollector(ABC):
         # Progress tracking
         self._progress_tracker: ProgressTracker | None = None
 
+        # Fallback record date, refreshed once per collect() run
+        self._today_iso = date.today().isoformat()
+
+        # Event loop runner, reused across collect() calls
+        self._runner: asyncio.Runner | None = None
+
     @property
     def progress_tracker(self) -> ProgressTracker:
         """Lazy initialization of progress tracker."""
@@ -140,16 +157,18 @@ class BaseCollector(ABC):
     @abstractmethod
     async def fetch_prices_phase(
         self, tickers: list[str]
-    ) -> tuple[dict[str, dict], list[str]]:
+    ) -> tuple[dict[str, dict], list[str], str | None]:
         """Fetch latest prices for tickers.
 
         Args:
             tickers: List of tickers to fetch
 
         Returns:
-            Tuple of (prices dict, valid tickers list)
+            Tuple of (prices dict, valid tickers list, trading date)
             - prices: {ticker: {close, open, high, low, volume, date}}
             - valid_tickers: tickers that have valid price data
+            - trading_date: date (YYYY-MM-DD) of the first valid price,
+              or None if no price carried a date
         """
         ...
 
@@ -171,12 +190,18 @@ class BaseCollector(ABC):
         ...
 
     @abstractmethod
-    def build_company_record(self, ticker: str, data: dict) -> dict:
+    def build_company_record(
+        self,
+        ticker: str,
+        metrics: dict,
+        price_data: dict,
+    ) -> dict:
         """Build company record from collected data.
 
         Args:
             ticker: Ticker symbol
-            data: Collected data for the ticker
+            metrics: Fundamental metrics (name, sector, industry, ...)
+            price_data: Price data
 
         Returns:
             Company record dict for storage
@@ -247,6 +272,12 @@ class BaseCollector(ABC):
         """Calculate technical indicators from history.
 
         Default implementation calculates RSI, MACD, Bollinger Bands, etc.
+        for all tickers in one vectorized pass. This is called from a worker
+        thread, so it must not touch the event loop.
+
+        The pass is not split across processes. Most of its time goes to
+        pulling columns out of the DataFrames, and a process pool would have
+        to pickle those same DataFrames first.
 
         Args:
             history: OHLCV history for each ticker
@@ -254,62 +285,16 @@ class BaseCollector(ABC):
         Returns:
             Dict mapping ticker to technical indicators dict
         """
-        from common.indicators import (
-            calculate_beta,
-            calculate_bollinger_bands,
-            calculate_macd,
-            calculate_mfi,
-            calculate_moving_averages,
-            calculate_rsi,
-            calculate_volume_change,
-        )
-
-        technicals = {}
-        for ticker, df in history.items():
-            if df is None or df.empty:
-                continue
-
-            try:
-                tech = {}
-
-                # RSI
-                rsi = calculate_rsi(df)
-                if rsi is not None:
-                    tech["rsi"] = rsi
-
-                # MFI
-                mfi = calculate_mfi(df)
-                if mfi is not None:
-                    tech["mfi"] = mfi
-
-                # MACD
-                macd_data = calculate_macd(df)
-                if macd_data:
-                    tech.update(macd_data)
-
-                # Bollinger Bands
-                bb_data = calculate_bollinger_bands(df)
-                if bb_data:
-                    tech.update(bb_data)
-
-                # Volume Change
-                vol_change = calculate_volume_change(df)
-                if vol_change is not None:
-                    tech["volume_change"] = vol_change
-
-                # Moving Averages (returns tuple)
-                ma_short, ma_long = calculate_moving_averages(df)
-                if ma_short is not None:
-                    tech["fifty_day_average"] = ma_short
-                if ma_long is not None:
-                    tech["two_hundred_day_average"] = ma_long
-
-                technicals[ticker] = tech
-
-            except Exception as e:
-                self.logger.warning(f"Failed to calculate technicals for {ticker}: {e}")
+        try:
+            batch = calculate_technicals_batch(history)
+        except Exception as e:
+            self.logger.warning(f"Failed to calculate technicals: {e}")
+            return {}
 
-        return technicals
+        return {
+            ticker: {key: value for key, value in tech.items() if value is not None}
+            for ticker, tech in batch.items()
+        }
 
     def validate_phase(self, metrics: dict[str, dict]) -> dict[str, dict]:
         """Validate metrics and filter invalid values.
@@ -349,7 +334,9 @@ class BaseCollector(ABC):
         Returns:
             CollectionResult with collection statistics
         """
-        return asyncio.run(
+        if self._runner is None:
+            self._runner = new_runner()
+        return self._runner.run(
             self._collect_async(
                 tickers=tickers,
                 resume=resume,
@@ -358,6 +345,12 @@ class BaseCollector(ABC):
             )
         )
 
+    def close(self) -> None:
+        """Close the event loop used by collect()."""
+        if self._runner is not None:
+            self._runner.close()
+            self._runner = None
+
     async def _collect_async(
         self,
         tickers: list[str] | None = None,
@@ -365,8 +358,13 @@ class BaseCollector(ABC):
         auto_retry: bool = True,
         max_retry_missing: int = 100,
     ) -> CollectionResult:
-        """Async implementation of collect."""
+        """Async implementation of collect.
+
+        Missing tickers are retried once by looping over them as a new
+        worklist, so the retry skips universe loading and resume handling.
+        """
         result = CollectionResult()
+        self._today_iso = date.today().isoformat()
 
         try:
             # Phase 0: Get tickers
@@ -385,87 +383,121 @@ class BaseCollector(ABC):
                 self.logger.info("No tickers to collect")
                 return result
 
-            # Phase 1: Fetch prices
-            self._log_phase(CollectionPhase.FETCH_PRICES)
-            prices, valid_tickers = await self.fetch_prices_phase(all_tickers)
-            self.logger.info(f"Valid tickers after price fetch: {len(valid_tickers)}")
-
-            if not valid_tickers:
-                self.logger.warning("No valid tickers after price fetch")
-                result.missing_tickers = all_tickers
-                return result
-
-            # Phase 2: Fetch history
-            self._log_phase(CollectionPhase.FETCH_HISTORY)
-            history = await self.fetch_history_phase(valid_tickers)
-            self.logger.info(f"History fetched for {len(history)} tickers")
-
-            # Phase 3: Fetch metrics
-            self._log_phase(CollectionPhase.FETCH_METRICS)
-            metrics = await self.fetch_metrics_phase(valid_tickers, history)
-            self.logger.info(f"Metrics fetched for {len(metrics)} tickers")
-
-            # Phase 4: Calculate technicals
-            self._log_phase(CollectionPhase.CALCULATE_TECHNICALS)
-            technicals = self.calculate_technicals_phase(history)
-            self.logger.info(f"Technicals calculated for {len(technicals)} tickers")
-
-            # Phase 5: Validate
-            self._log_phase(CollectionPhase.VALIDATE)
-            validated_metrics = self.validate_phase(metrics)
-
-            # Phase 6: Save
-            self._log_phase(CollectionPhase.SAVE)
-            save_result = await self._save_all(
-                valid_tickers, prices, validated_metrics, technicals
-            )
-            result.success = save_result["saved"]
-            result.failed = save_result["failed"]
-
-            # Mark completed
-            self.progress_tracker.mark_batch_completed(valid_tickers)
-            self.progress_tracker.save()
-
-            # Phase 7: Quality check
-            self._log_phase(CollectionPhase.QUALITY_CHECK)
-            result.missing_tickers = self._check_quality(all_tickers, valid_tickers)
-
-            # Auto-retry missing tickers
-            if auto_retry and 0 < len(result.missing_tickers) <= max_retry_missing:
-                self.logger.info(
-                    f"Auto-retrying {len(result.missing_tickers)} missing tickers"
+            pending = all_tickers
+            is_retry = False
+            while True:
+                valid_tickers = await self._collect_tickers(pending, result)
+
+                if not valid_tickers:
+                    self.logger.warning("No valid tickers after price fetch")
+                    result.missing_tickers = pending
+                    if not is_retry:
+                        return result
+                    break
+
+                # Phase 7: Quality check
+                self._log_phase(CollectionPhase.QUALITY_CHECK)
+                # valid_tickers is a subset of pending, so equal size means
+                # nothing is missing
+                result.missing_tickers = (
+                    []
+                    if len(valid_tickers) == len(pending)
+                    else self._check_quality(pending, valid_tickers)
                 )
-                retry_result = await self._collect_async(
-                    tickers=result.missing_tickers,
-                    resume=False,
-                    auto_retry=False,
-                )
-                result.success += retry_result.success
-                result.missing_tickers = retry_result.missing_tickers
+
+                # Auto-retry missing tickers (once)
+                missing = result.missing_tickers
+                retry_allowed = auto_retry and 0 < len(missing) <= max_retry_missing
+                if is_retry or not retry_allowed:
+                    break
+                self.logger.info(f"Auto-retrying {len(missing)} missing tickers")
+                pending = missing
+                is_retry = True
 
             result.phase = CollectionPhase.COMPLETE
 
         except Exception as e:
             self.logger.error(f"Collection failed: {e}", exc_info=True)
             result.errors.append(str(e))
-            if "rate limit" in str(e).lower():
+            if is_rate_limit_error(e):
                 result.rate_limit_hit = True
 
+        finally:
+            # Saves during the run are throttled; write whatever was done
+            # so a failed or interrupted run can resume from it
+            await asyncio.to_thread(self.progress_tracker.save, flush=True)
+
         return result
 
-    def _extract_trading_date(self, prices: dict[str, dict]) -> str | None:
-        """Extract trading date from prices data.
+    async def _collect_tickers(
+        self, tickers: list[str], result: CollectionResult
+    ) -> list[str]:
+        """Run the fetch, calculate, validate and save phases for tickers.
 
-        Args:
-            prices: Dict mapping ticker to price data
+        Adds saved/failed counts to ``result``.
 
         Returns:
-            Trading date string (YYYY-MM-DD) or None if not found
+            Tickers that had valid prices (empty if none did)
         """
-        for ticker, price_data in prices.items():
-            if price_data and "date" in price_data:
-                return price_data["date"]
-        return None
+        # Phase 1: Fetch prices
+        self._log_phase(CollectionPhase.FETCH_PRICES)
+        prices, valid_tickers, trading_date = await self.fetch_prices_phase(tickers)
+        self.logger.info(f"Valid tickers after price fetch: {len(valid_tickers)}")
+
+        if not valid_tickers:
+            return []
+
+        # Phase 2: Fetch history. Technicals only need history, so they are
+        # calculated in a worker thread while the metrics phase runs
+        self._log_phase(CollectionPhase.FETCH_HISTORY)
+        history_task = asyncio.ensure_future(self.fetch_history_phase(valid_tickers))
+        technicals_task = asyncio.ensure_future(
+            self._calculate_technicals_after(history_task)
+        )
+
+        try:
+            # Phase 3: Fetch metrics
+            metrics_history: dict[str, pd.DataFrame] = {}
+            if not self.concurrent_history_metrics:
+                metrics_history = await history_task
+            self._log_phase(CollectionPhase.FETCH_METRICS)
+            metrics = await self.fetch_metrics_phase(valid_tickers, metrics_history)
+            self.logger.info(f"Metrics fetched for {len(metrics)} tickers")
+
+            # Phase 4: Calculate technicals
+            self._log_phase(CollectionPhase.CALCULATE_TECHNICALS)
+            technicals = await technicals_task
+        except BaseException:
+            history_task.cancel()
+            technicals_task.cancel()
+            raise
+        self.logger.info(f"Technicals calculated for {len(technicals)} tickers")
+
+        # Phase 5: Validate
+        self._log_phase(CollectionPhase.VALIDATE)
+        validated_metrics = self.validate_phase(metrics)
+
+        # Phase 6: Save
+        self._log_phase(CollectionPhase.SAVE)
+        save_result = await self._save_all(
+            valid_tickers, prices, validated_metrics, technicals, trading_date
+        )
+        result.success += save_result["saved"]
+        result.failed += save_result["failed"]
+
+        # Mark completed
+        self.progress_tracker.mark_batch_completed(valid_tickers)
+        await asyncio.to_thread(self.progress_tracker.save)
+
+        return valid_tickers
+
+    async def _calculate_technicals_after(
+        self, history_task: asyncio.Future[dict[str, pd.DataFrame]]
+    ) -> dict[str, dict]:
+        """Wait for the history fetch, then calculate technicals off the loop."""
+        history = await history_task
+        self.logger.info(f"History fetched for {len(history)} tickers")
+        return await asyncio.to_thread(self.calculate_technicals_phase, history)
 
     async def _save_all(
         self,
@@ -473,60 +505,49 @@ class BaseCollector(ABC):
         prices: dict[str, dict],
         metrics: dict[str, dict],
         technicals: dict[str, dict],
+        trading_date: str | None,
     ) -> dict[str, int]:
-        """Save all collected data."""
+        """Save all collected data.
+
+        Every ticker in ``tickers`` must have price data in ``prices``, as
+        guaranteed by ``fetch_prices_phase``.
+        """
         # Set trading date for CSV storage before saving
         # This ensures directory is named by trading date, not collection date
-        trading_date = self._extract_trading_date(prices)
-        if trading_date and hasattr(self.storage, "set_trading_date"):
-            getattr(self.storage, "set_trading_date")(self.market, trading_date)  # noqa: B009
-        elif not trading_date:
+        if trading_date:
+            self.storage.set_trading_date(self.market, trading_date)
+        else:
             self.logger.warning(
                 "Could not extract trading date from prices, "
                 "using today's date as fallback"
             )
 
-        companies = []
-        metrics_records = []
-        price_records = []
-
-        for ticker in tickers:
-            price_data = prices.get(ticker, {})
-            metric_data = metrics.get(ticker, {})
-            tech_data = technicals.get(ticker, {})
-
-            # Build records
-            company = self.build_company_record(ticker, {**metric_data, **price_data})
-            companies.append(company)
-
-            metrics_rec = self.build_metrics_record(
-                ticker, metric_data, tech_data, price_data
+        # Build records, one comprehension per record type
+        companies = [
+            self.build_company_record(t, metrics.get(t, {}), prices[t])
+            for t in tickers
+        ]
+        metrics_records = [
+            self.build_metrics_record(
+                t, metrics.get(t, {}), technicals.get(t, {}), prices[t]
             )
-            metrics_records.append(metrics_rec)
-
-            price_rec = self.build_price_record(ticker, price_data)
-            if price_rec:
-                price_records.append(price_rec)
-
-        # Save to storage
-        saved = 0
-        failed = 0
-
-        result = self.storage.save_companies(companies, self.market)
-        saved += result.saved
-        failed += len(result.errors)
-
-        result = self.storage.save_metrics(metrics_records, self.market)
-        saved += result.saved
-        failed += len(result.errors)
-
-        result = self.storage.save_prices(price_records, self.market)
-        saved += result.saved
-        failed += len(result.errors)
+            for t in tickers
+        ]
+        price_records = [self.build_price_record(t, prices[t]) for t in tickers]
+
+        # Save to storage (blocking file/network I/O, so off the event loop)
+        result = await asyncio.to_thread(
+            self.storage.save_all,
+            companies,
+            metrics_records,
+            price_records,
+            self.market,
+        )
+        saved = result.saved
+        failed = len(result.errors)
 
         # Finalize storage (update symlinks for CSV)
-        if hasattr(self.storage, "finalize"):
-            getattr(self.storage, "finalize")(self.market)  # noqa: B009
+        self.storage.finalize(self.market)
 
         return {"saved": saved, "failed": failed}
 
@@ -534,8 +555,8 @@ class BaseCollector(ABC):
         self, all_tickers: list[str], collected_tickers: list[str]
     ) -> list[str]:
         """Check quality and return missing tickers."""
-        collected_set = set(collected_tickers)
-        missing = [t for t in all_tickers if t not in collected_set]
+        # Order-preserving difference; the membership test runs in C
+        missing = list(filterfalse(set(collected_tickers).__contains__, all_tickers))
         coverage = len(collected_tickers) / len(all_tickers) * 100
 
         self.logger.info(f"Coverage: {coverage:.1f}% ({len(collected_tickers)}/{len(all_tickers)})")
@@ -546,5 +567,5 @@ class BaseCollector(ABC):
 
     def _log_phase(self, phase: CollectionPhase) -> None:
         """Log phase transition."""
-        if not self.quiet:
-            self.logger.info(f"=== Phase: {phase.value} ===")
+        if not self.quiet and self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(_PHASE_LOG_MESSAGES[phase])
@@ -9,14 +9,14 @@ Data sources:
 - Naver scraper: Fundamentals (fallback)
 """
 
+import asyncio
 import logging
 from dataclasses import dataclass
-from datetime import date
 from pathlib import Path
-from typing import Any
 
 import pandas as pd
 
+from common.indicators import calculate_beta_batch, calculate_graham_number
 from config import Settings, get_settings
 from processors.validators import MetricsValidator
 from rate_limit import RateLimitStrategy
@@ -27,6 +27,9 @@ from .base import BaseCollector
 
 logger = logging.getLogger(__name__)
 
+# Days of FDR history per ticker (latest price, technicals, Beta)
+KR_HISTORY_DAYS = 300
+
 
 # Field mapping for KR metrics
 # Maps target field names to possible source field names (in priority order)
@@ -47,6 +50,39 @@ KR_FIELD_MAPPING: dict[str, list[str]] = {
     "debt_equity": ["debt_equity"],
 }
 
+# Source names consumed by KR_FIELD_MAPPING (everything else is copied as-is)
+KR_MAPPED_SOURCES = frozenset(
+    source for sources in KR_FIELD_MAPPING.values() for source in sources
+)
+
+# Frozen (target, sources) pairs walked once per ticker by _normalize_kr_metrics
+_KR_MAPPING_ITEMS = tuple(
+    (target, tuple(sources)) for target, sources in KR_FIELD_MAPPING.items()
+)
+
+# Normalized fields copied as-is into the metrics record
+METRICS_FIELDS = (
+    # Valuation
+    "pe_ratio",
+    "pb_ratio",
+    # Profitability
+    "roe",
+    "roa",
+    # Dividend
+    "dividend_yield",
+    # Per share
+    "eps",
+    "book_value_per_share",
+    # Price levels
+    "fifty_two_week_high",
+    "fifty_two_week_low",
+    # Market data
+    "market_cap",
+    # Financial health
+    "debt_equity",
+    "current_ratio",
+)
+
 
 def _normalize_kr_metrics(metrics: dict) -> dict:
     """Normalize KR metrics using field mapping.
@@ -59,19 +95,17 @@ def _normalize_kr_metrics(metrics: dict) -> dict:
     """
     normalized = {}
 
-    for target, sources in KR_FIELD_MAPPING.items():
+    get = metrics.get
+    for target, sources in _KR_MAPPING_ITEMS:
         for source in sources:
-            if source in metrics and metrics[source] is not None:
-                normalized[target] = metrics[source]
+            value = get(source)
+            if value is not None:
+                normalized[target] = value
                 break
 
     # Copy non-mapped fields directly
-    mapped_sources = set()
-    for sources in KR_FIELD_MAPPING.values():
-        mapped_sources.update(sources)
-
     for key, value in metrics.items():
-        if key not in mapped_sources and key not in normalized:
+        if key not in KR_MAPPED_SOURCES and key not in normalized:
             normalized[key] = value
 
     return normalized
@@ -83,17 +117,31 @@ def load_kr_tickers(companies_file: Path) -> tuple[list[str], dict[str, str], di
     Returns:
         Tuple of (ticker_list, ticker_to_name, ticker_to_market)
     """
-    tickers = []
-    ticker_names = {}
-    ticker_markets = {}
+    tickers: list[str] = []
+    ticker_names: dict[str, str] = {}
+    ticker_markets: dict[str, str] = {}
 
     try:
-        df = pd.read_csv(companies_file, dtype={"ticker": str})
-        for _, row in df.iterrows():
-            ticker = str(row["ticker"]).strip()
-            tickers.append(ticker)
-            ticker_names[ticker] = row.get("name", ticker)
-            ticker_markets[ticker] = row.get("market", "KOSPI")
+        df = pd.read_csv(
+            companies_file,
+            usecols=lambda c: c in ("ticker", "name", "market"),
+            dtype=str,
+        )
+        ticker_col = df["ticker"].astype(str).str.strip()
+        name_col = df["name"].fillna(ticker_col) if "name" in df else ticker_col
+        if "market" in df:
+            market_col = df["market"].fillna("KOSPI")
+        else:
+            market_col = pd.Series("KOSPI", index=df.index)
+
+        rows = ticker_col.tolist()
+        ticker_names = dict(zip(rows, name_col.tolist(), strict=True))
+        ticker_markets = dict(zip(rows, market_col.tolist(), strict=True))
+
+        # Drop repeated rows (stale or dual-listed entries) so each is fetched once
+        tickers = list(dict.fromkeys(rows))
+        if len(tickers) != len(rows):
+            logger.warning(f"Dropped {len(rows) - len(tickers)} duplicate KR tickers")
 
         logger.info(f"Loaded {len(tickers)} KR tickers from {companies_file}")
 
@@ -111,6 +159,9 @@ class NewKRCollector(BaseCollector):
     Inherits common workflow from BaseCollector.
     """
 
+    # Metrics come from Naver/KIS without history, so they overlap FDR
+    concurrent_history_metrics = True
+
     def __init__(
         self,
         storage: Storage | None = None,
@@ -159,6 +210,7 @@ class NewKRCollector(BaseCollector):
         self._ticker_names: dict[str, str] = {}
         self._ticker_markets: dict[str, str] = {}
         self._kospi_history: pd.DataFrame | None = None
+        self._history: dict[str, pd.DataFrame] = {}
 
     def get_tickers(self) -> list[str]:
         """Get KR ticker universe from companies CSV."""
@@ -173,36 +225,49 @@ class NewKRCollector(BaseCollector):
 
     async def fetch_prices_phase(
         self, tickers: list[str]
-    ) -> tuple[dict[str, dict], list[str]]:
-        """Fetch latest prices using FDR."""
-        result = await self._fdr_source.fetch_prices(tickers)
+    ) -> tuple[dict[str, dict], list[str], str | None]:
+        """Fetch history using FDR and take latest prices from its last rows.
 
-        prices = {}
-        valid_tickers = []
-        for ticker, data in result.succeeded.items():
-            if data.prices:
-                prices[ticker] = data.prices
-                valid_tickers.append(ticker)
+        FDR has no latest-price API, so a separate short fetch here would
+        download every ticker twice. The full history is kept for
+        fetch_history_phase instead.
+        """
+        result = await self._fdr_source.fetch_history(tickers, days=KR_HISTORY_DAYS)
+
+        prices = {
+            ticker: data.prices
+            for ticker, data in result.succeeded.items()
+            if data.prices
+        }
+        self._history = {
+            ticker: data.history
+            for ticker, data in result.succeeded.items()
+            if data.history is not None and not data.history.empty
+        }
+        valid_tickers = list(prices)
+        trading_date = next(
+            (d for p in prices.values() if (d := p.get("date")) is not None), None
+        )
 
         self.logger.info(
             f"Prices: {len(valid_tickers)} valid, {result.failure_count} failed"
         )
-        return prices, valid_tickers
+        return prices, valid_tickers, trading_date
 
     async def fetch_history_phase(
         self, tickers: list[str]
     ) -> dict[str, pd.DataFrame]:
-        """Fetch OHLCV history using FDR."""
-        result = await self._fdr_source.fetch_history(tickers, days=300)
-
-        history = {}
-        for ticker, data in result.succeeded.items():
-            if data.history is not None and not data.history.empty:
-                history[ticker] = data.history
+        """Return the history downloaded by fetch_prices_phase."""
+        history = {
+            ticker: self._history[ticker] for ticker in tickers if ticker in self._history
+        }
+        self._history = {}
 
         # Also fetch KOSPI index for Beta calculation
         # Note: Use ^KS11 (Yahoo format) as FDR's KS11 source changed
-        self._kospi_history = await self._fdr_source.fetch_index_history("^KS11", days=300)
+        self._kospi_history = await self._fdr_source.fetch_index_history(
+            "^KS11", days=KR_HISTORY_DAYS
+        )
 
         self.logger.info(f"History: {len(history)} tickers")
         return history
@@ -215,30 +280,49 @@ class NewKRCollector(BaseCollector):
         """Fetch fundamental metrics using Naver (base) and KIS (supplement).
 
         Strategy:
-        1. Naver first: EPS, BPS, PER, PBR (good coverage)
+        1. Naver: EPS, BPS, PER, PBR (good coverage)
         2. KIS supplement: 52-week high/low, more accurate PER/PBR
         3. Merge: KIS overwrites Naver for overlapping fields
+
+        Both sources are independent, so they are fetched concurrently.
         """
         metrics = {}
 
+        fetches = [self._naver_source.fetch_metrics(tickers)]
+        if self._kis_source.is_available:
+            self.logger.info(
+                f"Fetching {len(tickers)} tickers from Naver and KIS API..."
+            )
+            fetches.append(self._kis_source.fetch_metrics(tickers))
+        else:
+            self.logger.info(f"Fetching {len(tickers)} tickers from Naver...")
+
+        naver_result, *kis_results = await asyncio.gather(
+            *fetches, return_exceptions=True
+        )
+
         # Step 1: Naver for base data (EPS, BPS, etc.)
-        self.logger.info(f"Fetching {len(tickers)} tickers from Naver...")
-        naver_result = await self._naver_source.fetch_metrics(tickers)
-        for ticker, data in naver_result.succeeded.items():
-            if data.metrics:
-                metrics[ticker] = data.metrics
+        if isinstance(naver_result, BaseException):
+            self.logger.warning(f"Naver metrics fetch failed: {naver_result}")
+        else:
+            for ticker, data in naver_result.succeeded.items():
+                if data.metrics:
+                    metrics[ticker] = data.metrics
 
         # Step 2: KIS for supplemental data (52-week high/low)
-        if self._kis_source.is_available:
-            self.logger.info("Supplementing with KIS API (52-week high/low)...")
-            kis_result = await self._kis_source.fetch_metrics(tickers)
+        for kis_result in kis_results:
+            if isinstance(kis_result, BaseException):
+                self.logger.warning(f"KIS metrics fetch failed: {kis_result}")
+                continue
             for ticker, data in kis_result.succeeded.items():
                 if data.metrics:
                     if ticker in metrics:
                         # Merge: KIS overwrites Naver, but only for non-None values
-                        for key, value in data.metrics.items():
-                            if value is not None:
-                                metrics[ticker][key] = value
+                        metrics[ticker] |= {
+                            key: value
+                            for key, value in data.metrics.items()
+                            if value is not None
+                        }
                     else:
                         metrics[ticker] = data.metrics
 
@@ -252,26 +336,26 @@ class NewKRCollector(BaseCollector):
         # First get standard technicals from base class
         technicals = super().calculate_technicals_phase(history)
 
-        # Add Beta calculation using KOSPI index
+        # Add Beta vs KOSPI for all tickers in one vectorized pass
         if self._kospi_history is not None and not self._kospi_history.empty:
-            from common.indicators import calculate_beta
-
-            for ticker, df in history.items():
-                if ticker in technicals and df is not None and not df.empty:
-                    beta = calculate_beta(df, self._kospi_history)
-                    if beta is not None:
-                        technicals[ticker]["beta"] = beta
+            betas = calculate_beta_batch(history, self._kospi_history)
+            for ticker, tech in technicals.items():
+                beta = betas.get(ticker)
+                if beta is not None:
+                    tech["beta"] = beta
 
         return technicals
 
-    def build_company_record(self, ticker: str, data: dict) -> dict:
+    def build_company_record(
+        self, ticker: str, metrics: dict, price_data: dict
+    ) -> dict:
         """Build company record from collected data."""
         return {
             "ticker": ticker,
-            "name": self._ticker_names.get(ticker, data.get("name", ticker)),
+            "name": self._ticker_names.get(ticker, metrics.get("name", ticker)),
             "market": self._ticker_markets.get(ticker, "KOSPI"),
-            "sector": data.get("sector"),
-            "industry": data.get("industry"),
+            "sector": metrics.get("sector"),
+            "industry": metrics.get("industry"),
         }
 
     def build_metrics_record(
@@ -286,36 +370,15 @@ class NewKRCollector(BaseCollector):
         Uses KR_FIELD_MAPPING to normalize field names from different sources
         (KIS uses per/pbr/bps, Naver uses pe_ratio/pb_ratio/book_value_per_share).
         """
-        from common.indicators import calculate_graham_number
-
         # Normalize metrics using field mapping
         normalized = _normalize_kr_metrics(metrics)
 
-        record = {
-            "ticker": ticker,
-            # Valuation
-            "pe_ratio": normalized.get("pe_ratio"),
-            "pb_ratio": normalized.get("pb_ratio"),
-            # Profitability
-            "roe": normalized.get("roe"),
-            "roa": normalized.get("roa"),
-            # Dividend
-            "dividend_yield": normalized.get("dividend_yield"),
-            # Per share
-            "eps": normalized.get("eps"),
-            "book_value_per_share": normalized.get("book_value_per_share"),
-            # Price levels
-            "fifty_two_week_high": normalized.get("fifty_two_week_high"),
-            "fifty_two_week_low": normalized.get("fifty_two_week_low"),
-            # Market data
-            "market_cap": normalized.get("market_cap"),
-            "latest_price": price_data.get("close"),
-            # Financial health
-            "debt_equity": normalized.get("debt_equity"),
-            "current_ratio": normalized.get("current_ratio"),
-            # Technical indicators
-            **technicals,
-        }
+        record = {"ticker": ticker}
+        record.update(
+            zip(METRICS_FIELDS, map(normalized.get, METRICS_FIELDS), strict=True)
+        )
+        record["latest_price"] = price_data.get("close")
+        record.update(technicals)
 
         # Calculate Graham Number
         eps = record.get("eps")
@@ -334,7 +397,7 @@ class NewKRCollector(BaseCollector):
 
         return {
             "ticker": ticker,
-            "date": price_data.get("date", date.today().isoformat()),
+            "date": price_data.get("date", self._today_iso),
             "open": price_data.get("open"),
             "high": price_data.get("high"),
             "low": price_data.get("low"),
@@ -4,13 +4,13 @@ This is the new implementation using BaseCollector pattern.
 Target: < 300 lines (vs 1,270 lines in legacy us_stocks.py)
 """
 
-import ftplib
-import io
 import logging
 from dataclasses import dataclass
-from datetime import date
+from pathlib import Path
 
 import pandas as pd
+from common.indicators import calculate_graham_number
+from common.tickers import fetch_us_tickers, is_fresh
 from config import Settings, get_settings
 from processors.validators import MetricsValidator
 from rate_limit import RateLimitStrategy
@@ -22,61 +22,75 @@ from .base import BaseCollector
 logger = logging.getLogger(__name__)
 
 
-# NASDAQ FTP for full universe
-NASDAQ_FTP_HOST = "ftp.nasdaqtrader.com"
-NASDAQ_FTP_DIR = "symboldirectory"
+# Fundamental fields copied as-is from fetched metrics into the metrics record
+METRICS_FIELDS = (
+    # Valuation
+    "pe_ratio",
+    "forward_pe",
+    "pb_ratio",
+    "ps_ratio",
+    "peg_ratio",
+    "ev_ebitda",
+    # Profitability
+    "roe",
+    "roa",
+    "gross_margin",
+    "net_margin",
+    "operating_margin",
+    # Financial health
+    "debt_equity",
+    "current_ratio",
+    "quick_ratio",
+    # Dividend
+    "dividend_yield",
+    "payout_ratio",
+    # Per share
+    "eps",
+    "book_value_per_share",
+    # Price levels
+    "fifty_two_week_high",
+    "fifty_two_week_low",
+    "fifty_day_average",
+    "two_hundred_day_average",
+    # Market data
+    "market_cap",
+    "beta",
+)
+
+
+def get_all_us_tickers(
+    companies_file: Path | None = None, ttl_seconds: int = 0
+) -> dict[str, list[str]]:
+    """Fetch all US stock tickers (ETFs excluded) from NASDAQ FTP.
+
+    If ``companies_file`` was written within ``ttl_seconds`` (e.g. by
+    ``update-tickers``), the tickers are read from it instead.
 
-
-def get_all_us_tickers() -> dict[str, list[str]]:
-    """Fetch all US tickers from NASDAQ FTP.
+    Args:
+        companies_file: US companies CSV to reuse while fresh
+        ttl_seconds: Maximum age of ``companies_file`` to reuse
 
     Returns:
         Dict mapping ticker to list of index memberships (empty for most)
     """
-    tickers = {}
-
     try:
-        ftp = ftplib.FTP(NASDAQ_FTP_HOST, timeout=30)
-        ftp.login()
-        ftp.cwd(NASDAQ_FTP_DIR)
-
-        # Fetch NASDAQ-listed symbols
-        nasdaq_data = io.BytesIO()
-        ftp.retrbinary("RETR nasdaqlisted.txt", nasdaq_data.write)
-        nasdaq_data.seek(0)
-
-        for line in nasdaq_data.read().decode("utf-8").splitlines()[1:]:
-            if "|" in line:
-                parts = line.split("|")
-                ticker = parts[0].strip()
-                if ticker and not ticker.startswith("File"):
-                    # Skip test symbols
-                    if parts[6].strip() == "Y":  # Test Issue
-                        continue
-                    tickers[ticker] = []
-
-        # Fetch other-listed symbols (NYSE, etc.)
-        other_data = io.BytesIO()
-        ftp.retrbinary("RETR otherlisted.txt", other_data.write)
-        other_data.seek(0)
-
-        for line in other_data.read().decode("utf-8").splitlines()[1:]:
-            if "|" in line:
-                parts = line.split("|")
-                ticker = parts[0].strip()
-                if ticker and not ticker.startswith("File"):
-                    # Skip test symbols
-                    if parts[5].strip() == "Y":  # Test Issue
-                        continue
-                    tickers[ticker] = []
-
-        ftp.quit()
-        logger.info(f"Loaded {len(tickers)} US tickers from NASDAQ FTP")
-
+        if companies_file is not None and is_fresh(companies_file, ttl_seconds):
+            # keep_default_na: "NA" (National Bank Holdings) is a real ticker
+            df = pd.read_csv(
+                companies_file,
+                usecols=["ticker", "is_etf"],
+                dtype=str,
+                keep_default_na=False,
+            )
+        else:
+            df = fetch_us_tickers()
     except Exception as e:
-        logger.error(f"Failed to fetch tickers from NASDAQ FTP: {e}")
+        logger.error(f"Failed to load US tickers: {e}")
+        return {}
 
-    return tickers
+    # The CSV stores is_etf as "True"/"False"
+    stocks = df.loc[df["is_etf"].astype(str) != "True", "ticker"]
+    return {ticker: [] for ticker in stocks}
 
 
 @dataclass
@@ -157,29 +171,35 @@ class NewUSCollector(BaseCollector):
         self._ticker_membership: dict[str, list[str]] = {}
 
     def get_tickers(self) -> list[str]:
-        """Get US ticker universe from NASDAQ FTP."""
-        self._ticker_membership = get_all_us_tickers()
+        """Get US ticker universe from NASDAQ FTP (or the fresh companies CSV)."""
+        self._ticker_membership = get_all_us_tickers(
+            self.settings.companies_dir / "us_companies.csv",
+            self.settings.ticker_ttl_seconds,
+        )
         tickers = list(self._ticker_membership.keys())
         self.logger.info(f"Loaded {len(tickers)} US tickers")
         return tickers
 
     async def fetch_prices_phase(
         self, tickers: list[str]
-    ) -> tuple[dict[str, dict], list[str]]:
+    ) -> tuple[dict[str, dict], list[str], str | None]:
         """Fetch latest prices using YFinance."""
         result = await self.source.fetch_prices(tickers)
 
-        prices = {}
-        valid_tickers = []
-        for ticker, data in result.succeeded.items():
-            if data.prices:
-                prices[ticker] = data.prices
-                valid_tickers.append(ticker)
+        prices = {
+            ticker: data.prices
+            for ticker, data in result.succeeded.items()
+            if data.prices
+        }
+        valid_tickers = list(prices)
+        trading_date = next(
+            (d for p in prices.values() if (d := p.get("date")) is not None), None
+        )
 
         self.logger.info(
             f"Prices: {len(valid_tickers)} valid, {result.failure_count} failed"
         )
-        return prices, valid_tickers
+        return prices, valid_tickers, trading_date
 
     async def fetch_metrics_phase(
         self,
@@ -189,24 +209,27 @@ class NewUSCollector(BaseCollector):
         """Fetch fundamental metrics using YFinance."""
         result = await self.source.fetch_metrics(tickers)
 
-        metrics = {}
-        for ticker, data in result.succeeded.items():
-            if data.metrics:
-                metrics[ticker] = data.metrics
+        metrics = {
+            ticker: data.metrics
+            for ticker, data in result.succeeded.items()
+            if data.metrics
+        }
 
         self.logger.info(
             f"Metrics: {len(metrics)} valid, {result.failure_count} failed"
         )
         return metrics
 
-    def build_company_record(self, ticker: str, data: dict) -> dict:
+    def build_company_record(
+        self, ticker: str, metrics: dict, price_data: dict
+    ) -> dict:
         """Build company record from collected data."""
         return {
             "ticker": ticker,
-            "name": data.get("name", ticker),
+            "name": metrics.get("name", ticker),
             "market": "US",
-            "sector": data.get("sector"),
-            "industry": data.get("industry"),
+            "sector": metrics.get("sector"),
+            "industry": metrics.get("industry"),
         }
 
     def build_metrics_record(
@@ -217,45 +240,12 @@ class NewUSCollector(BaseCollector):
         price_data: dict,
     ) -> dict:
         """Build metrics record from collected data."""
-        from common.indicators import calculate_graham_number
-
-        record = {
-            "ticker": ticker,
-            # Valuation
-            "pe_ratio": metrics.get("pe_ratio"),
-            "forward_pe": metrics.get("forward_pe"),
-            "pb_ratio": metrics.get("pb_ratio"),
-            "ps_ratio": metrics.get("ps_ratio"),
-            "peg_ratio": metrics.get("peg_ratio"),
-            "ev_ebitda": metrics.get("ev_ebitda"),
-            # Profitability
-            "roe": metrics.get("roe"),
-            "roa": metrics.get("roa"),
-            "gross_margin": metrics.get("gross_margin"),
-            "net_margin": metrics.get("net_margin"),
-            "operating_margin": metrics.get("operating_margin"),
-            # Financial health
-            "debt_equity": metrics.get("debt_equity"),
-            "current_ratio": metrics.get("current_ratio"),
-            "quick_ratio": metrics.get("quick_ratio"),
-            # Dividend
-            "dividend_yield": metrics.get("dividend_yield"),
-            "payout_ratio": metrics.get("payout_ratio"),
-            # Per share
-            "eps": metrics.get("eps"),
-            "book_value_per_share": metrics.get("book_value_per_share"),
-            # Price levels
-            "fifty_two_week_high": metrics.get("fifty_two_week_high"),
-            "fifty_two_week_low": metrics.get("fifty_two_week_low"),
-            "fifty_day_average": metrics.get("fifty_day_average"),
-            "two_hundred_day_average": metrics.get("two_hundred_day_average"),
-            # Market data
-            "market_cap": metrics.get("market_cap"),
-            "beta": metrics.get("beta"),
-            "latest_price": price_data.get("close"),
-            # Technical indicators
-            **technicals,
-        }
+        record = {"ticker": ticker}
+        record.update(
+            zip(METRICS_FIELDS, map(metrics.get, METRICS_FIELDS), strict=True)
+        )
+        record["latest_price"] = price_data.get("close")
+        record.update(technicals)
 
         # Calculate Graham Number
         eps = metrics.get("eps")
@@ -274,7 +264,7 @@ class NewUSCollector(BaseCollector):
 
         return {
             "ticker": ticker,
-            "date": price_data.get("date", date.today().isoformat()),
+            "date": price_data.get("date", self._today_iso),
             "open": price_data.get("open"),
             "high": price_data.get("high"),
             "low": price_data.get("low"),
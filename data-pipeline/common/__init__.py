@@ -4,31 +4,41 @@ Modules:
 - indicators: Technical indicator calculations (RSI, MACD, etc.)
 - naver_finance: Naver Finance scraper for KR fundamentals
 - kis_client: KIS API client for KR fundamentals
+- tickers: Ticker universe sources (NASDAQ FTP, FDR KRX-DESC)
+- ttl_cache: TTL'd on-disk cache shared by the US metrics and KR history caches
 - utils: Utility functions (safe_float, get_supabase_client)
 """
 
 from .indicators import (
     calculate_52_week_high_low,
+    calculate_52_week_high_low_batch,
     calculate_all_technicals,
     calculate_beta,
+    calculate_beta_batch,
     calculate_bollinger_bands,
     calculate_graham_number,
     calculate_macd,
     calculate_mfi,
     calculate_moving_averages,
+    calculate_moving_averages_batch,
     calculate_rsi,
+    calculate_technicals_batch,
     calculate_volume_change,
 )
 
 __all__ = [
     "calculate_52_week_high_low",
+    "calculate_52_week_high_low_batch",
     "calculate_all_technicals",
     "calculate_beta",
+    "calculate_beta_batch",
     "calculate_bollinger_bands",
     "calculate_graham_number",
     "calculate_macd",
     "calculate_mfi",
     "calculate_moving_averages",
+    "calculate_moving_averages_batch",
     "calculate_rsi",
+    "calculate_technicals_batch",
     "calculate_volume_change",
 ]
@@ -0,0 +1,33 @@
+"""Optional Numba JIT decorator.
+
+Numba is an optional dependency (``pip install .[jit]``). Without it, ``njit``
+is a no-op and the decorated kernels run as plain Python/NumPy.
+"""
+
+from collections.abc import Callable
+from typing import Any
+
+try:
+    from numba import njit as _numba_njit
+
+    HAS_NUMBA = True
+except ImportError:
+    _numba_njit = None
+    HAS_NUMBA = False
+
+
+def njit(*args: Any, **kwargs: Any) -> Any:
+    """Compile with ``numba.njit`` when available, otherwise return as-is.
+
+    Supports both ``@njit`` and ``@njit(cache=True)`` forms.
+    """
+    if _numba_njit is not None:
+        return _numba_njit(*args, **kwargs)
+
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return args[0]
+
+    def decorator(func: Callable) -> Callable:
+        return func
+
+    return decorator
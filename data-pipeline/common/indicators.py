@@ -2,16 +2,266 @@
 
 This module contains all technical indicator functions used by both US and KR collectors.
 All functions are pure and only depend on pandas DataFrames.
+
+Only the latest indicator value is ever used, so the numeric cores work on
+NumPy arrays and reduce just the trailing window instead of building full
+rolling series. The EMA recurrence behind MACD is JIT-compiled with Numba
+when it is installed.
 """
 
 import logging
 import math
 
+import numpy as np
 import pandas as pd
 
+from ._njit import njit
+
 logger = logging.getLogger(__name__)
 
 
+# ==================== Array Kernels ====================
+
+
+@njit(cache=True)
+def _ewm_mean(values: np.ndarray, span: int) -> np.ndarray:
+    """Exponential moving average, equivalent to ``ewm(span, adjust=False).mean()``.
+
+    NaNs are skipped but still decay the previous value's weight
+    (``ignore_na=False``), so a value after a k-bar gap gets weight
+    ``1 - (1 - alpha) ** (k + 1)``.
+    """
+    n = len(values)
+    out = np.empty(n)
+    if n == 0:
+        return out
+
+    decay = 1.0 - 2.0 / (span + 1.0)
+    weighted = values[0]
+    old_wt = 1.0
+    out[0] = weighted
+    for i in range(1, n):
+        cur = values[i]
+        if weighted == weighted:
+            old_wt *= decay
+            if cur == cur:
+                if weighted != cur:
+                    weighted = old_wt * weighted + (1.0 - old_wt) * cur
+                old_wt = 1.0
+        elif cur == cur:
+            weighted = cur
+        out[i] = weighted
+    return out
+
+
+def _ewm_mean_columns(values: np.ndarray, span: int) -> np.ndarray:
+    """Column-wise ``_ewm_mean`` of a ``(bars, tickers)`` matrix.
+
+    Steps through the bars once, updating every ticker at the same time.
+    Leading NaN padding is skipped exactly like ``_ewm_mean`` does.
+    """
+    out = np.empty(values.shape)
+    if len(values) == 0:
+        return out
+
+    decay = 1.0 - 2.0 / (span + 1.0)
+    weighted = values[0].copy()
+    old_wt = np.ones(values.shape[1])
+    out[0] = weighted
+    for i in range(1, len(values)):
+        cur = values[i]
+        started = ~np.isnan(weighted)
+        observed = ~np.isnan(cur)
+        old_wt = np.where(started, old_wt * decay, old_wt)
+        update = started & observed & (weighted != cur)
+        weighted = np.where(
+            update,
+            old_wt * weighted + (1.0 - old_wt) * cur,
+            np.where(started | ~observed, weighted, cur),
+        )
+        old_wt = np.where(started & observed, 1.0, old_wt)
+        out[i] = weighted
+    return out
+
+
+# The kernels below reduce along axis 0, so they accept either one ticker's
+# series (1-D) or a ``(bars, tickers)`` matrix and return one value per ticker.
+
+
+def _rsi_last(close: np.ndarray, period: int) -> np.ndarray:
+    """RSI of the last bar using simple averages of the trailing deltas."""
+    delta = np.diff(close[-(period + 1) :], axis=0)
+    gain = np.where(delta > 0, delta, 0.0).mean(axis=0)
+    loss = np.where(delta < 0, -delta, 0.0).mean(axis=0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rsi = 100 - (100 / (1 + gain / loss))
+    return np.where(loss == 0, np.where(gain > 0, 100.0, 50.0), rsi)
+
+
+def _volume_change_last(volume: np.ndarray, period: int) -> np.ndarray:
+    """Last volume relative to its trailing average, in percent (NaN if no volume)."""
+    avg_volume = volume[-period:].mean(axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        change = ((volume[-1] / avg_volume) - 1) * 100
+    return np.where(avg_volume == 0, np.nan, change)
+
+
+def _macd_last(
+    close: np.ndarray, fast: int, slow: int, signal: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """MACD line, signal line and histogram of the last bar."""
+    ewm = _ewm_mean if close.ndim == 1 else _ewm_mean_columns
+    macd_line = ewm(close, fast) - ewm(close, slow)
+    signal_line = ewm(macd_line, signal)
+    return macd_line[-1], signal_line[-1], macd_line[-1] - signal_line[-1]
+
+
+def _bollinger_last(
+    close: np.ndarray, period: int, std_dev: float
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Bollinger (upper, middle, lower, %B) of the last bar."""
+    window = close[-period:]
+    middle = window.mean(axis=0)
+    std = window.std(axis=0, ddof=1)
+    upper = middle + std_dev * std
+    lower = middle - std_dev * std
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        percent_b = (close[-1] - lower) / (upper - lower)
+    return upper, middle, lower, np.where(upper == lower, 0.5, percent_b)
+
+
+def _mfi_last(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    volume: np.ndarray,
+    period: int,
+) -> np.ndarray:
+    """Money Flow Index of the last bar."""
+    n = period + 1
+    typical_price = (high[-n:] + low[-n:] + close[-n:]) / 3
+    raw_money_flow = (typical_price * volume[-n:])[1:]
+    tp_diff = np.diff(typical_price, axis=0)
+
+    positive_mf = np.where(tp_diff > 0, raw_money_flow, 0.0).sum(axis=0)
+    negative_mf = np.where(tp_diff < 0, raw_money_flow, 0.0).sum(axis=0)
+
+    # Zero negative flow divides by inf, as the pandas formulation did
+    mf_ratio = positive_mf / np.where(negative_mf != 0, negative_mf, np.inf)
+    return 100 - (100 / (1 + mf_ratio))
+
+
+def _sma_last(close: np.ndarray, period: int) -> np.ndarray:
+    """Mean of the trailing window, skipping NaNs like ``Series.mean``."""
+    window = close[-period:]
+    count = (~np.isnan(window)).sum(axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.nansum(window, axis=0) / count
+
+
+def _stack_tail(frames: list[pd.DataFrame], name: str, length: int) -> np.ndarray:
+    """Right-align one column of each frame into a NaN-padded ``(length, N)`` matrix."""
+    matrix = np.full((length, len(frames)), np.nan)
+    for j, hist in enumerate(frames):
+        if name in hist.columns:
+            values = _column(hist, name)[-length:]
+            matrix[length - len(values) :, j] = values
+    return matrix
+
+
+def _is_stackable(hist: pd.DataFrame) -> bool:
+    """Whether a frame can go into the stacked ``(bars, tickers)`` matrices.
+
+    Columns must be flat and unique with a numeric Close; High/Low/Volume
+    may be missing but must be numeric when present.
+    """
+    columns = hist.columns
+    if isinstance(columns, pd.MultiIndex) or not columns.is_unique:
+        return False
+    if "Close" not in columns:
+        return False
+    return all(
+        pd.api.types.is_numeric_dtype(hist[name])
+        for name in ("Open", "High", "Low", "Close", "Volume")
+        if name in columns
+    )
+
+
+def _split_stackable(
+    history: dict[str, pd.DataFrame],
+) -> tuple[list[str], list[str]]:
+    """Split non-empty histories into stackable and per-ticker tickers.
+
+    Frames that can't be stacked go through the per-ticker functions, so one
+    malformed frame can't fail the whole batch.
+    """
+    stackable: list[str] = []
+    per_ticker: list[str] = []
+    for ticker, df in history.items():
+        if df is None or df.empty:
+            continue
+        (stackable if _is_stackable(df) else per_ticker).append(ticker)
+    return stackable, per_ticker
+
+
+def _rounded(value: float, ndigits: int) -> float | None:
+    """Round a kernel output, mapping non-finite values to None."""
+    return round(float(value), ndigits) if math.isfinite(value) else None
+
+
+def _column(hist: pd.DataFrame, name: str) -> np.ndarray:
+    """Extract a column as a float64 ndarray."""
+    return hist[name].to_numpy(dtype=np.float64)
+
+
+def _close(df: pd.DataFrame) -> pd.Series:
+    """Extract the Close column (handles MultiIndex from yfinance)."""
+    if "Close" in df.columns:
+        close = df["Close"]
+        # If it's a DataFrame (MultiIndex), get first column
+        if isinstance(close, pd.DataFrame):
+            close = close.iloc[:, 0]
+        return close
+    return pd.Series(dtype=float)
+
+
+def _returns(df: pd.DataFrame, period: int) -> tuple[np.ndarray, pd.Index]:
+    """Daily returns over the last ``period`` closes and their dates.
+
+    Same values as ``pct_change()`` minus the leading NaN.
+    """
+    close = _close(df)
+    start = max(len(close) - period, 0)
+    values = close.to_numpy(dtype=np.float64)[start:]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        returns = values[1:] / values[:-1] - 1
+    return returns, close.index[start + 1 :]
+
+
+def _date_rows(market_dates: pd.Index, dates: pd.Index) -> np.ndarray:
+    """Row of each date in ``market_dates``, or -1 if absent (like ``get_indexer``).
+
+    Datetime indexes with the same timezone are matched on their int64 values,
+    which avoids ``get_indexer``'s per-call overhead.
+    """
+    if (
+        isinstance(market_dates, pd.DatetimeIndex)
+        and isinstance(dates, pd.DatetimeIndex)
+        and market_dates.tz == dates.tz
+        and market_dates.is_monotonic_increasing
+    ):
+        market_keys = market_dates.as_unit("ns").asi8
+        keys = dates.as_unit("ns").asi8
+        pos = np.searchsorted(market_keys, keys).clip(max=len(market_keys) - 1)
+        return np.where(market_keys[pos] == keys, pos, -1)
+    return market_dates.get_indexer(dates)
+
+
+# ==================== Public API ====================
+
+
 def calculate_graham_number(eps: float | None, bvps: float | None) -> float | None:
     """
     Calculate Graham Number = sqrt(22.5 * EPS * BVPS).
@@ -51,16 +301,7 @@ def calculate_rsi(hist: pd.DataFrame, period: int = 14) -> float | None:
         if hist.empty or len(hist) < period + 1:
             return None
 
-        delta = hist["Close"].diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-
-        if loss.iloc[-1] == 0:
-            return 100.0 if gain.iloc[-1] > 0 else 50.0
-
-        rs = gain.iloc[-1] / loss.iloc[-1]
-        rsi = 100 - (100 / (1 + rs))
-        return round(rsi, 2)
+        return round(float(_rsi_last(_column(hist, "Close"), period)), 2)
     except Exception as e:
         logger.debug(f"RSI calculation failed: {e}")
         return None
@@ -81,13 +322,9 @@ def calculate_volume_change(hist: pd.DataFrame, period: int = 20) -> float | Non
         if hist.empty or len(hist) < period:
             return None
 
-        avg_volume = hist["Volume"].iloc[-period:].mean()
-        current_volume = hist["Volume"].iloc[-1]
-
-        if avg_volume == 0:
+        change_rate = float(_volume_change_last(_column(hist, "Volume"), period))
+        if math.isnan(change_rate):
             return None
-
-        change_rate = ((current_volume / avg_volume) - 1) * 100
         return round(change_rate, 2)
     except Exception as e:
         logger.debug(f"Volume change calculation failed: {e}")
@@ -119,25 +356,13 @@ def calculate_macd(
         if hist.empty or len(hist) < slow + signal:
             return None
 
-        close = hist["Close"]
-
-        # Calculate EMAs
-        ema_fast = close.ewm(span=fast, adjust=False).mean()
-        ema_slow = close.ewm(span=slow, adjust=False).mean()
-
-        # MACD Line
-        macd_line = ema_fast - ema_slow
-
-        # Signal Line (9-day EMA of MACD)
-        signal_line = macd_line.ewm(span=signal, adjust=False).mean()
-
-        # Histogram
-        histogram = macd_line - signal_line
-
+        macd, macd_signal, histogram = _macd_last(
+            _column(hist, "Close"), fast, slow, signal
+        )
         return {
-            "macd": round(macd_line.iloc[-1], 4),
-            "macd_signal": round(signal_line.iloc[-1], 4),
-            "macd_histogram": round(histogram.iloc[-1], 4),
+            "macd": round(float(macd), 4),
+            "macd_signal": round(float(macd_signal), 4),
+            "macd_histogram": round(float(histogram), 4),
         }
     except Exception as e:
         logger.debug(f"MACD calculation failed: {e}")
@@ -167,34 +392,14 @@ def calculate_bollinger_bands(
         if hist.empty or len(hist) < period:
             return None
 
-        close = hist["Close"]
-
-        # Middle Band (SMA)
-        middle = close.rolling(window=period).mean()
-
-        # Standard Deviation
-        std = close.rolling(window=period).std()
-
-        # Upper and Lower Bands
-        upper = middle + (std_dev * std)
-        lower = middle - (std_dev * std)
-
-        # %B indicator: (Price - Lower) / (Upper - Lower)
-        current_price = close.iloc[-1]
-        upper_val = upper.iloc[-1]
-        lower_val = lower.iloc[-1]
-        middle_val = middle.iloc[-1]
-
-        if upper_val == lower_val:
-            percent_b = 0.5
-        else:
-            percent_b = (current_price - lower_val) / (upper_val - lower_val)
-
+        upper, middle, lower, percent_b = _bollinger_last(
+            _column(hist, "Close"), period, std_dev
+        )
         return {
-            "bb_upper": round(upper_val, 2),
-            "bb_middle": round(middle_val, 2),
-            "bb_lower": round(lower_val, 2),
-            "bb_percent": round(percent_b * 100, 2),  # As percentage
+            "bb_upper": round(float(upper), 2),
+            "bb_middle": round(float(middle), 2),
+            "bb_lower": round(float(lower), 2),
+            "bb_percent": round(float(percent_b) * 100, 2),  # As percentage
         }
     except Exception as e:
         logger.debug(f"Bollinger Bands calculation failed: {e}")
@@ -219,30 +424,16 @@ def calculate_mfi(hist: pd.DataFrame, period: int = 14) -> float | None:
         if hist.empty or len(hist) < period + 1:
             return None
 
-        # Typical Price = (High + Low + Close) / 3
-        typical_price = (hist["High"] + hist["Low"] + hist["Close"]) / 3
-
-        # Raw Money Flow = Typical Price x Volume
-        raw_money_flow = typical_price * hist["Volume"]
-
-        # Determine positive/negative money flow
-        tp_diff = typical_price.diff()
-
-        positive_flow = raw_money_flow.where(tp_diff > 0, 0)
-        negative_flow = raw_money_flow.where(tp_diff < 0, 0)
-
-        # Sum over period
-        positive_mf = positive_flow.rolling(window=period).sum()
-        negative_mf = negative_flow.rolling(window=period).sum()
-
-        # Money Flow Ratio
-        mf_ratio = positive_mf / negative_mf.replace(0, float("inf"))
-
-        # MFI = 100 - (100 / (1 + MFR))
-        mfi = 100 - (100 / (1 + mf_ratio))
-
-        result = mfi.iloc[-1]
-        if pd.isna(result) or result == float("inf") or result == float("-inf"):
+        result = float(
+            _mfi_last(
+                _column(hist, "High"),
+                _column(hist, "Low"),
+                _column(hist, "Close"),
+                _column(hist, "Volume"),
+                period,
+            )
+        )
+        if not math.isfinite(result):
             return None
 
         return round(result, 2)
@@ -320,16 +511,16 @@ def calculate_moving_averages(
         if hist.empty:
             return None, None
 
-        close = hist["Close"]
+        close = _column(hist, "Close")
 
         short_ma = None
         long_ma = None
 
         if len(close) >= short_period:
-            short_ma = round(close.iloc[-short_period:].mean(), 2)
+            short_ma = _rounded(_sma_last(close, short_period), 2)
 
         if len(close) >= long_period:
-            long_ma = round(close.iloc[-long_period:].mean(), 2)
+            long_ma = _rounded(_sma_last(close, long_period), 2)
 
         return short_ma, long_ma
     except Exception as e:
@@ -337,6 +528,52 @@ def calculate_moving_averages(
         return None, None
 
 
+def calculate_moving_averages_batch(
+    history: dict[str, pd.DataFrame],
+    short_period: int = 50,
+    long_period: int = 200,
+) -> dict[str, tuple[float | None, float | None]]:
+    """
+    Calculate short and long-term moving averages for many tickers at once.
+
+    Closes are right-aligned into one NaN-padded ``(bars, tickers)`` matrix
+    and both averages are reduced column-wise. Values match
+    ``calculate_moving_averages``.
+
+    Args:
+        history: Mapping of ticker to DataFrame with 'Close' column
+                 (empty frames are skipped, frames that can't be stacked
+                 are calculated one at a time)
+        short_period: Short-term MA period (default 50 days)
+        long_period: Long-term MA period (default 200 days)
+
+    Returns:
+        Mapping of ticker to (short_ma, long_ma), None where the history is
+        too short
+    """
+    tickers, per_ticker = _split_stackable(history)
+    averages = {
+        ticker: calculate_moving_averages(history[ticker], short_period, long_period)
+        for ticker in per_ticker
+    }
+    if tickers:
+        frames = [history[t] for t in tickers]
+        lengths = np.array([len(df) for df in frames])
+        length = min(int(lengths.max()), max(short_period, long_period))
+
+        close = _stack_tail(frames, "Close", length)
+        short_ma = _sma_last(close, short_period)
+        long_ma = _sma_last(close, long_period)
+
+        for j, ticker in enumerate(tickers):
+            averages[ticker] = (
+                _rounded(short_ma[j], 2) if lengths[j] >= short_period else None,
+                _rounded(long_ma[j], 2) if lengths[j] >= long_period else None,
+            )
+
+    return {t: averages[t] for t in history if t in averages}
+
+
 def calculate_beta(
     stock_hist: pd.DataFrame,
     market_hist: pd.DataFrame,
@@ -363,18 +600,8 @@ def calculate_beta(
         if stock_hist.empty or market_hist.empty:
             return None
 
-        # Helper to extract Close column (handles MultiIndex from yfinance)
-        def get_close(df: pd.DataFrame) -> pd.Series:
-            if "Close" in df.columns:
-                close = df["Close"]
-                # If it's a DataFrame (MultiIndex), get first column
-                if isinstance(close, pd.DataFrame):
-                    close = close.iloc[:, 0]
-                return close
-            return pd.Series(dtype=float)
-
-        stock_close = get_close(stock_hist)
-        market_close = get_close(market_hist)
+        stock_close = _close(stock_hist)
+        market_close = _close(market_hist)
 
         if stock_close.empty or market_close.empty:
             return None
@@ -409,6 +636,68 @@ def calculate_beta(
         return None
 
 
+def calculate_beta_batch(
+    history: dict[str, pd.DataFrame],
+    market_hist: pd.DataFrame,
+    period: int = 252,
+) -> dict[str, float | None]:
+    """
+    Calculate Beta for many tickers against one market index.
+
+    Each ticker's returns are placed on the market's dates in one
+    ``(dates, tickers)`` matrix, and covariance/variance are reduced
+    column-wise over the dates both have. Values match ``calculate_beta``.
+
+    Args:
+        history: Mapping of ticker to DataFrame with 'Close' column
+                 (empty frames are skipped)
+        market_hist: Market index DataFrame with 'Close' column
+        period: Number of trading days to use (default 252 = 1 year)
+
+    Returns:
+        Mapping of ticker to Beta (None when fewer than 30 common dates)
+    """
+    if market_hist.empty:
+        return {}
+
+    tickers = [t for t, df in history.items() if df is not None and not df.empty]
+    market_returns, market_dates = _returns(market_hist, period)
+    if not tickers or len(market_dates) == 0:
+        return {}
+
+    # Scatter each ticker's returns onto the market's dates
+    stock_returns = np.full((len(market_dates), len(tickers)), np.nan)
+    for j, ticker in enumerate(tickers):
+        try:
+            returns, dates = _returns(history[ticker], period)
+            rows = _date_rows(market_dates, dates)
+        except Exception as e:
+            # Leave the column empty (-> None) rather than fail every ticker
+            logger.debug(f"Beta calculation failed for {ticker}: {e}")
+            continue
+        hit = rows >= 0
+        stock_returns[rows[hit], j] = returns[hit]
+    market_returns = market_returns[:, None]
+
+    # Dates where both the ticker and the market have a return
+    valid = ~np.isnan(stock_returns) & ~np.isnan(market_returns)
+    count = valid.sum(axis=0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        s = np.where(valid, stock_returns, 0.0)
+        m = np.where(valid, market_returns, 0.0)
+        s_dev = np.where(valid, s - s.sum(axis=0) / count, 0.0)
+        m_dev = np.where(valid, m - m.sum(axis=0) / count, 0.0)
+        covariance = (s_dev * m_dev).sum(axis=0) / (count - 1)
+        variance = (m_dev * m_dev).sum(axis=0) / (count - 1)
+        beta = covariance / variance
+
+    return {
+        ticker: _rounded(beta[j], 4) if count[j] >= 30 and variance[j] != 0 else None
+        for j, ticker in enumerate(tickers)
+    }
+
+
 def calculate_52_week_high_low(hist: pd.DataFrame) -> tuple[float | None, float | None]:
     """
     Calculate 52-week high and low from history DataFrame.
@@ -445,6 +734,45 @@ def calculate_52_week_high_low(hist: pd.DataFrame) -> tuple[float | None, float
         return None, None
 
 
+def calculate_52_week_high_low_batch(
+    history: dict[str, pd.DataFrame],
+    period: int = 252,
+) -> dict[str, tuple[float | None, float | None]]:
+    """
+    Calculate 52-week high and low for many tickers at once.
+
+    The last ``period`` highs and lows are right-aligned into NaN-padded
+    ``(bars, tickers)`` matrices and reduced column-wise, ignoring NaNs.
+    Values match ``calculate_52_week_high_low``.
+
+    Args:
+        history: Mapping of ticker to DataFrame with 'High' and 'Low' columns
+                 (empty frames are skipped, frames that can't be stacked
+                 are calculated one at a time)
+        period: Number of trading days to use (default 252 = 1 year)
+
+    Returns:
+        Mapping of ticker to (high_52w, low_52w)
+    """
+    tickers, per_ticker = _split_stackable(history)
+    extremes = {
+        ticker: calculate_52_week_high_low(history[ticker].iloc[-period:])
+        for ticker in per_ticker
+    }
+    if tickers:
+        frames = [history[t] for t in tickers]
+        length = min(max(len(df) for df in frames), period)
+
+        # fmax/fmin skip NaN padding and give NaN (-> None) for a missing column
+        high = np.fmax.reduce(_stack_tail(frames, "High", length), axis=0)
+        low = np.fmin.reduce(_stack_tail(frames, "Low", length), axis=0)
+
+        for j, ticker in enumerate(tickers):
+            extremes[ticker] = (_rounded(high[j], 2), _rounded(low[j], 2))
+
+    return {t: extremes[t] for t in history if t in extremes}
+
+
 def calculate_all_technicals(hist: pd.DataFrame) -> dict:
     """
     Calculate all technical indicators from a single history DataFrame.
@@ -492,3 +820,75 @@ def calculate_all_technicals(hist: pd.DataFrame) -> dict:
         )
 
     return result
+
+
+def calculate_technicals_batch(history: dict[str, pd.DataFrame]) -> dict[str, dict]:
+    """
+    Calculate technical indicators for many tickers at once.
+
+    Every ticker's history is right-aligned into one NaN-padded
+    ``(bars, tickers)`` matrix per column, and each indicator is computed for
+    all tickers with a single column-wise NumPy pass. Values match the
+    per-ticker ``calculate_*`` functions.
+
+    Frames that can't be stacked (e.g. MultiIndex or non-numeric columns)
+    are calculated one at a time instead.
+
+    Args:
+        history: Mapping of ticker to OHLCV DataFrame (empty frames are skipped)
+
+    Returns:
+        Mapping of ticker to the ``calculate_all_technicals`` keys plus
+        ``fifty_day_average`` and ``two_hundred_day_average`` (None when the
+        history is too short)
+    """
+    tickers, per_ticker = _split_stackable(history)
+
+    technicals: dict[str, dict] = {}
+    for ticker in per_ticker:
+        hist = history[ticker]
+        ma_short, ma_long = calculate_moving_averages(hist)
+        technicals[ticker] = calculate_all_technicals(hist) | {
+            "fifty_day_average": ma_short,
+            "two_hundred_day_average": ma_long,
+        }
+    if not tickers:
+        return technicals
+
+    frames = [history[t] for t in tickers]
+    lengths = np.array([len(df) for df in frames])
+    length = int(lengths.max())
+
+    close = _stack_tail(frames, "Close", length)
+    high = _stack_tail(frames, "High", length)
+    low = _stack_tail(frames, "Low", length)
+    volume = _stack_tail(frames, "Volume", length)
+
+    rsi = _rsi_last(close, 14)
+    volume_change = _volume_change_last(volume, 20)
+    mfi = _mfi_last(high, low, close, volume, 14)
+    macd, macd_signal, macd_histogram = _macd_last(close, 12, 26, 9)
+    bb_upper, bb_middle, bb_lower, bb_percent = _bollinger_last(close, 20, 2.0)
+    ma_short = _sma_last(close, 50)
+    ma_long = _sma_last(close, 200)
+
+    for j, ticker in enumerate(tickers):
+        n = lengths[j]
+        has_macd = n >= 35
+        has_bb = n >= 20
+        technicals[ticker] = {
+            "rsi": round(float(rsi[j]), 2) if n >= 15 else None,
+            "volume_change": _rounded(volume_change[j], 2) if n >= 20 else None,
+            "mfi": _rounded(mfi[j], 2) if n >= 15 else None,
+            "macd": round(float(macd[j]), 4) if has_macd else None,
+            "macd_signal": round(float(macd_signal[j]), 4) if has_macd else None,
+            "macd_histogram": round(float(macd_histogram[j]), 4) if has_macd else None,
+            "bb_upper": round(float(bb_upper[j]), 2) if has_bb else None,
+            "bb_middle": round(float(bb_middle[j]), 2) if has_bb else None,
+            "bb_lower": round(float(bb_lower[j]), 2) if has_bb else None,
+            "bb_percent": round(float(bb_percent[j]) * 100, 2) if has_bb else None,
+            "fifty_day_average": _rounded(ma_short[j], 2) if n >= 50 else None,
+            "two_hundred_day_average": _rounded(ma_long[j], 2) if n >= 200 else None,
+        }
+
+    return {t: technicals[t] for t in history if t in technicals}
@@ -28,6 +28,8 @@ from typing import Any, ClassVar
 import aiohttp
 
 from config import get_settings
+from core.event_loop import run_async
+from core.fast_json import loads
 
 logger = logging.getLogger(__name__)
 
@@ -181,7 +183,7 @@ class KISClient:
                     text = await resp.text()
                     raise KISAuthError(f"Failed to get access token: {resp.status} {text}")
 
-                data = await resp.json()
+                data = await resp.json(loads=loads)
 
                 if "access_token" not in data:
                     raise KISAuthError(f"No access token in response: {data}")
@@ -244,7 +246,7 @@ class KISClient:
 
     async def _handle_response(self, resp: aiohttp.ClientResponse) -> dict[str, Any]:
         """Handle API response and errors."""
-        data = await resp.json()
+        data = await resp.json(loads=loads)
 
         # Check for rate limit
         if resp.status == 429:
@@ -371,24 +373,19 @@ class KISClient:
             dict mapping ticker to financial ratio data
         """
         results: dict[str, dict[str, Any]] = {}
-        completed = 0
         total = len(tickers)
 
-        for ticker in tickers:
+        for completed, ticker in enumerate(tickers, 1):
             try:
                 ratio = await self.get_financial_ratio(ticker)
                 if ratio.get("roe") is not None or ratio.get("debt_ratio") is not None:
                     results[ticker] = ratio
 
-                completed += 1
-                if progress_callback:
-                    progress_callback(completed, total)
-
             except Exception as e:
                 logger.debug(f"Failed to fetch financial ratio for {ticker}: {e}")
-                completed += 1
-                if progress_callback:
-                    progress_callback(completed, total)
+
+            if progress_callback:
+                progress_callback(completed, total)
 
             # Rate limiting delay
             await asyncio.sleep(delay)
@@ -413,24 +410,19 @@ class KISClient:
             dict mapping ticker to quote data
         """
         results: dict[str, dict[str, Any]] = {}
-        completed = 0
         total = len(tickers)
 
-        for ticker in tickers:
+        for completed, ticker in enumerate(tickers, 1):
             try:
                 quote = await self.get_domestic_quote(ticker)
                 if quote.get("current_price") is not None:
                     results[ticker] = quote
 
-                completed += 1
-                if progress_callback:
-                    progress_callback(completed, total)
-
             except Exception as e:
                 logger.debug(f"Failed to fetch {ticker}: {e}")
-                completed += 1
-                if progress_callback:
-                    progress_callback(completed, total)
+
+            if progress_callback:
+                progress_callback(completed, total)
 
             # Rate limiting delay
             await asyncio.sleep(delay)
@@ -561,4 +553,4 @@ def get_domestic_quotes_sync(tickers: list[str]) -> dict[str, dict[str, Any]]:
         async with KISClient() as client:
             return await client.get_domestic_quotes_bulk(tickers)
 
-    return asyncio.run(_run())
+    return run_async(_run())
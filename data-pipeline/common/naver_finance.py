@@ -18,14 +18,39 @@ import asyncio
 import contextlib
 import logging
 import re
+import time
 from collections.abc import Callable
+from html import unescape
 from typing import Any, ClassVar
 
 import aiohttp
 from bs4 import BeautifulSoup
+from core.event_loop import run_async
 
 logger = logging.getLogger(__name__)
 
+# Main page fields are three id'd <em> tags and one table, so they are read
+# with regexes instead of building a DOM for every ticker's page
+_MAIN_EM_PATTERNS = tuple(
+    (key, re.compile(rf'<em\b[^>]*\bid="{em_id}"[^>]*>([^<]*)</em>'))
+    for key, em_id in (("pe_ratio", "_per"), ("eps", "_eps"), ("pb_ratio", "_pbr"))
+)
+_PER_TABLE_RE = re.compile(
+    r'<table\b[^>]*\bclass="[^"]*\bper_table\b[^"]*"[^>]*>(.*?)</table>', re.DOTALL
+)
+_TAG_RE = re.compile(r"<[^>]+>")
+_BPS_RE = re.compile(r"PBR.*?l\s*BPS.*?([\d,.]+)배.*?l\s*([\d,]+)원", re.DOTALL)
+
+# Financial ratio fields in the page text
+_ROE_RE = re.compile(r"ROE[^\d]*?([\d.]+)\s*%?", re.IGNORECASE)
+_ROA_RE = re.compile(r"ROA[^\d]*?([\d.]+)\s*%?", re.IGNORECASE)
+_DEBT_RATIO_RE = re.compile(r"부채비율[^\d]*?([\d.]+)\s*%?")
+_CURRENT_RATIO_RE = re.compile(r"유동비율[^\d]*?([\d.]+)\s*%?")
+
+# Market data fields in the sise page text
+_MARKET_CAP_RE = re.compile(r"시가총액[^\d]*([\d,]+)\s*억")
+_DIVIDEND_YIELD_RE = re.compile(r"배당수익률[^\d]*([\d.]+)\s*%")
+
 
 class NaverFinanceClient:
     """Naver Finance web scraper for Korean stock fundamentals."""
@@ -56,12 +81,21 @@ class NaverFinanceClient:
             concurrency: Maximum concurrent requests (semaphore limit)
             timeout: Request timeout in seconds
             delay_between_requests: Delay between requests to be polite
+                (per concurrent slot, so the rate is capped at
+                concurrency / delay requests per second)
         """
         self.concurrency = concurrency
         self.timeout = timeout
         self.delay = delay_between_requests
         self._session: aiohttp.ClientSession | None = None
 
+        # Rate limiting (token bucket). Same ceiling as every slot pausing
+        # for ``delay`` after each ticker, without holding the slot meanwhile.
+        self._rate_limit = concurrency / self.delay if self.delay > 0 else 0.0
+        self._tokens = float(concurrency)
+        self._last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create aiohttp session."""
         if self._session is None or self._session.closed:
@@ -74,6 +108,30 @@ class NaverFinanceClient:
             )
         return self._session
 
+    async def _acquire_rate_limit(self) -> None:
+        """Acquire a token from the rate limiter (token bucket algorithm)."""
+        if self._rate_limit <= 0:
+            return
+
+        async with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._last_refill
+
+            # Refill tokens based on elapsed time
+            self._tokens = min(
+                float(self.concurrency),
+                self._tokens + elapsed * self._rate_limit,
+            )
+            self._last_refill = now
+
+            if self._tokens < 1:
+                # Wait for a token; it is used up as soon as it refills
+                await asyncio.sleep((1 - self._tokens) / self._rate_limit)
+                self._tokens = 0
+                self._last_refill = time.monotonic()
+            else:
+                self._tokens -= 1
+
     async def close(self) -> None:
         """Close the session."""
         if self._session and not self._session.closed:
@@ -115,43 +173,23 @@ class NaverFinanceClient:
 
     def _parse_fundamentals(self, html: str) -> dict[str, float | None]:
         """Parse PER, EPS, PBR, BPS from main page HTML."""
-        soup = BeautifulSoup(html, "html.parser")
         data: dict[str, float | None] = {}
 
-        # Extract PER from em#_per
-        per_em = soup.find("em", id="_per")
-        if per_em:
-            with contextlib.suppress(ValueError, TypeError):
-                text = per_em.get_text().replace(",", "").strip()
-                if text and text != "-":
-                    data["pe_ratio"] = float(text)
-
-        # Extract EPS from em#_eps
-        eps_em = soup.find("em", id="_eps")
-        if eps_em:
-            with contextlib.suppress(ValueError, TypeError):
-                text = eps_em.get_text().replace(",", "").strip()
-                if text and text != "-":
-                    data["eps"] = float(text)
-
-        # Extract PBR from em#_pbr
-        pbr_em = soup.find("em", id="_pbr")
-        if pbr_em:
-            with contextlib.suppress(ValueError, TypeError):
-                text = pbr_em.get_text().replace(",", "").strip()
-                if text and text != "-":
-                    data["pb_ratio"] = float(text)
+        # Extract PER, EPS, PBR from em#_per, em#_eps, em#_pbr
+        for key, pattern in _MAIN_EM_PATTERNS:
+            em_match = pattern.search(html)
+            if em_match:
+                with contextlib.suppress(ValueError, TypeError):
+                    text = unescape(em_match.group(1)).replace(",", "").strip()
+                    if text and text != "-":
+                        data[key] = float(text)
 
         # Extract BPS from per_table
-        per_table = soup.find("table", class_="per_table")
-        if per_table:
-            table_text = per_table.get_text()
+        table_match = _PER_TABLE_RE.search(html)
+        if table_match:
+            table_text = unescape(_TAG_RE.sub("", table_match.group(1)))
             # Pattern: "PBR ... l BPS ... 배 l N원"
-            bps_match = re.search(
-                r"PBR.*?l\s*BPS.*?([\d,.]+)배.*?l\s*([\d,]+)원",
-                table_text,
-                re.DOTALL,
-            )
+            bps_match = _BPS_RE.search(table_text)
             if bps_match:
                 with contextlib.suppress(ValueError, TypeError):
                     data["book_value_per_share"] = float(
@@ -201,7 +239,7 @@ class NaverFinanceClient:
             # Skip first few values if they're dates/headers
             # Look for numeric values from the recent columns
             for val in values:
-                if val and val not in ["-", "", "IFRS연결", "IFRS별도"]:
+                if val and val not in {"-", "", "IFRS연결", "IFRS별도"}:
                     try:
                         # Remove commas and convert
                         return float(val.replace(",", ""))
@@ -270,25 +308,25 @@ class NaverFinanceClient:
         text = soup.get_text()
 
         # ROE pattern: "ROE(%) N.NN" or "ROE N.NN%"
-        roe_match = re.search(r"ROE[^\d]*?([\d.]+)\s*%?", text, re.IGNORECASE)
+        roe_match = _ROE_RE.search(text)
         if roe_match:
             with contextlib.suppress(ValueError):
                 data["roe"] = float(roe_match.group(1)) / 100  # Convert to decimal
 
         # ROA pattern
-        roa_match = re.search(r"ROA[^\d]*?([\d.]+)\s*%?", text, re.IGNORECASE)
+        roa_match = _ROA_RE.search(text)
         if roa_match:
             with contextlib.suppress(ValueError):
                 data["roa"] = float(roa_match.group(1)) / 100
 
         # 부채비율 (Debt to Equity)
-        debt_match = re.search(r"부채비율[^\d]*?([\d.]+)\s*%?", text)
+        debt_match = _DEBT_RATIO_RE.search(text)
         if debt_match:
             with contextlib.suppress(ValueError):
                 data["debt_equity"] = float(debt_match.group(1))  # Keep as percentage
 
         # 유동비율 (Current Ratio)
-        current_match = re.search(r"유동비율[^\d]*?([\d.]+)\s*%?", text)
+        current_match = _CURRENT_RATIO_RE.search(text)
         if current_match:
             with contextlib.suppress(ValueError):
                 data["current_ratio"] = float(current_match.group(1)) / 100
@@ -326,10 +364,7 @@ class NaverFinanceClient:
         text = soup.get_text()
 
         # 시가총액 (Market Cap)
-        market_cap_match = re.search(
-            r"시가총액[^\d]*([\d,]+)\s*억",
-            text,
-        )
+        market_cap_match = _MARKET_CAP_RE.search(text)
         if market_cap_match:
             with contextlib.suppress(ValueError):
                 # Convert 억원 to actual value (1억 = 100,000,000)
@@ -337,7 +372,7 @@ class NaverFinanceClient:
                 data["market_cap"] = cap_in_billion * 100_000_000
 
         # 배당수익률 (Dividend Yield)
-        div_match = re.search(r"배당수익률[^\d]*([\d.]+)\s*%", text)
+        div_match = _DIVIDEND_YIELD_RE.search(text)
         if div_match:
             with contextlib.suppress(ValueError):
                 data["dividend_yield"] = float(div_match.group(1)) / 100
@@ -472,23 +507,18 @@ class NaverFinanceClient:
             nonlocal completed
             async with semaphore:
                 try:
+                    await self._acquire_rate_limit()
                     data = await self.get_all_data(ticker)
-
-                    # Small delay to be polite
-                    await asyncio.sleep(self.delay)
-
-                    completed += 1
-                    if progress_callback:
-                        progress_callback(completed, total)
-
                     return ticker, data
 
                 except Exception as e:
                     logger.debug(f"Failed to fetch {ticker}: {e}")
+                    return ticker, {}
+
+                finally:
                     completed += 1
                     if progress_callback:
                         progress_callback(completed, total)
-                    return ticker, {}
 
         # Ensure session is created (will be reused by fetch_one)
         await self._get_session()
@@ -496,27 +526,24 @@ class NaverFinanceClient:
         # Process in batches to avoid memory issues and allow partial progress
         for i in range(0, len(tickers), batch_size):
             batch = tickers[i : i + batch_size]
-            tasks = [fetch_one(ticker) for ticker in batch]
+            tasks = [asyncio.create_task(fetch_one(ticker)) for ticker in batch]
 
-            # Run batch with overall timeout protection
+            # Store each result as it completes, with overall timeout protection
             try:
-                responses = await asyncio.wait_for(
-                    asyncio.gather(*tasks, return_exceptions=True),
-                    timeout=120.0,  # 2 minutes per batch
-                )
-
-                for response in responses:
-                    if isinstance(response, BaseException):
-                        continue
-                    if isinstance(response, tuple):
-                        ticker, data = response
-                        if data:  # Only add if we got some data
-                            results[ticker] = data
+                for next_done in asyncio.as_completed(
+                    tasks, timeout=120.0  # 2 minutes per batch
+                ):
+                    ticker, data = await next_done
+                    if data:  # Only add if we got some data
+                        results[ticker] = data
 
             except asyncio.TimeoutError:
                 logger.warning(f"Batch {i // batch_size + 1} timed out, continuing...")
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
                 # Update completed count for timed out batch
-                completed += len(batch) - (completed - i)
+                completed = i + len(batch)
                 if progress_callback:
                     progress_callback(completed, total)
 
@@ -535,4 +562,4 @@ def fetch_naver_fundamentals_sync(tickers: list[str]) -> dict[str, dict[str, Any
         async with NaverFinanceClient() as client:
             return await client.fetch_bulk(tickers)
 
-    return asyncio.run(_run())
+    return run_async(_run())
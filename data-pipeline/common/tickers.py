@@ -0,0 +1,147 @@
+"""Ticker universe sources.
+
+Fetches the ticker lists the collectors and ``update-tickers`` start from:
+- US: NASDAQ FTP (nasdaqlisted.txt, otherlisted.txt)
+- KR: FDR KRX-DESC (FinanceDataReader)
+"""
+
+import ftplib
+import io
+import logging
+import time
+from pathlib import Path
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# NASDAQ FTP settings
+NASDAQ_FTP_HOST = "ftp.nasdaqtrader.com"
+NASDAQ_FTP_DIR = "symboldirectory"
+US_TICKER_COLUMNS = ["ticker", "name", "market", "exchange", "is_etf"]
+
+
+def fetch_us_tickers() -> pd.DataFrame:
+    """Fetch all US tickers from NASDAQ FTP.
+
+    Returns:
+        DataFrame with columns: ticker, name, market, exchange, is_etf
+    """
+    # Keyed by ticker so a symbol listed in both files is kept once (first wins)
+    records: dict[str, tuple[str, str, str, str, bool]] = {}
+
+    try:
+        ftp = ftplib.FTP(NASDAQ_FTP_HOST, timeout=30)
+        ftp.login()
+        ftp.cwd(NASDAQ_FTP_DIR)
+
+        # Fetch NASDAQ-listed symbols
+        nasdaq_data = io.BytesIO()
+        ftp.retrbinary("RETR nasdaqlisted.txt", nasdaq_data.write)
+        nasdaq_data.seek(0)
+
+        # Symbol|Security Name|Market Category|Test Issue|Financial Status|
+        # Round Lot Size|ETF|NextShares
+        for line in nasdaq_data.read().decode("utf-8").splitlines()[1:]:
+            try:
+                ticker, name, _category, test_issue, _status, _lot, etf, *_ = (
+                    line.split("|")
+                )
+            except ValueError:
+                continue  # Malformed line
+            ticker = ticker.strip()
+            # Skip footer and test symbols
+            if not ticker or ticker.startswith("File") or test_issue.strip() == "Y":
+                continue
+
+            records.setdefault(
+                ticker, (ticker, name.strip(), "NASDAQ", "NASDAQ", etf.strip() == "Y")
+            )
+
+        # Fetch other-listed symbols (NYSE, etc.)
+        other_data = io.BytesIO()
+        ftp.retrbinary("RETR otherlisted.txt", other_data.write)
+        other_data.seek(0)
+
+        exchange_map = {
+            "N": "NYSE",
+            "P": "NYSE ARCA",
+            "Z": "BATS",
+            "V": "IEX",
+            "A": "NYSE MKT",
+        }
+
+        # ACT Symbol|Security Name|Exchange|CQS Symbol|ETF|Round Lot Size|
+        # Test Issue|NASDAQ Symbol
+        for line in other_data.read().decode("utf-8").splitlines()[1:]:
+            try:
+                ticker, name, exchange_code, _cqs, etf, _lot, test_issue, *_ = (
+                    line.split("|")
+                )
+            except ValueError:
+                continue  # Malformed line
+            ticker = ticker.strip()
+            # Skip footer and test symbols
+            if not ticker or ticker.startswith("File") or test_issue.strip() == "Y":
+                continue
+
+            exchange_code = exchange_code.strip()
+            exchange = exchange_map.get(exchange_code, exchange_code)
+
+            records.setdefault(
+                ticker, (ticker, name.strip(), "US", exchange, etf.strip() == "Y")
+            )
+
+        ftp.quit()
+        logger.info(f"Fetched {len(records)} US tickers from NASDAQ FTP")
+
+    except Exception as e:
+        logger.error(f"Failed to fetch US tickers: {e}")
+        raise
+
+    return pd.DataFrame.from_records(list(records.values()), columns=US_TICKER_COLUMNS)
+
+
+def fetch_kr_tickers() -> pd.DataFrame:
+    """Fetch all KR tickers from FDR (KRX-DESC).
+
+    Returns:
+        DataFrame with columns: ticker, name, market, sector, industry
+    """
+    import FinanceDataReader as fdr
+
+    try:
+        df = fdr.StockListing("KRX-DESC")
+
+        if df.empty:
+            raise RuntimeError("FDR returned empty ticker list")
+
+        # Rename and select columns
+        result = pd.DataFrame(
+            {
+                "ticker": df["Code"],
+                "name": df["Name"],
+                "market": df["Market"],
+                "sector": df.get("Sector", ""),
+                "industry": df.get("Industry", ""),
+            }
+        )
+
+        # Filter out non-standard tickers (ETFs, ETNs, etc.)
+        # Standard KR tickers are 6 digits
+        result = result[result["ticker"].str.match(r"^\d{6}$")]
+
+        logger.info(f"Fetched {len(result)} KR tickers from FDR")
+        return result
+
+    except Exception as e:
+        logger.error(f"Failed to fetch KR tickers: {e}")
+        raise
+
+
+def is_fresh(path: Path, ttl_seconds: int) -> bool:
+    """Check if a file exists and was modified within the TTL."""
+    try:
+        return time.time() - path.stat().st_mtime < ttl_seconds
+    except FileNotFoundError:
+        return False
@@ -0,0 +1,155 @@
+"""TTL'd on-disk cache keyed by ticker.
+
+Shared by the US metrics cache (JSON) and the KR history cache (pickle):
+- Entries are keyed by ticker with the time they were fetched
+- Expired entries are not served by ``get``
+- Entries older than ``max(ttl, max_age)`` are dropped on the next save
+- A TTL of 0 disables the cache
+
+The file format is a ``Serializer`` passed in by the caller.
+"""
+
+from __future__ import annotations
+
+import json
+import pickle
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Generic, TypeVar
+
+from observability.logger import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class Serializer:
+    """Reads and writes the entries mapping to a file."""
+
+    load: Callable[[Path], dict[str, dict[str, Any]]]
+    dump: Callable[[dict[str, dict[str, Any]], Path], None]
+    errors: tuple[type[Exception], ...]  # Raised by load on a corrupt file
+
+
+def _load_json(path: Path) -> dict[str, dict[str, Any]]:
+    with open(path) as f:
+        return json.load(f)
+
+
+def _dump_json(entries: dict[str, dict[str, Any]], path: Path) -> None:
+    with open(path, "w") as f:
+        json.dump(entries, f)
+
+
+def _load_pickle(path: Path) -> dict[str, dict[str, Any]]:
+    with open(path, "rb") as f:
+        return pickle.load(f)
+
+
+def _dump_pickle(entries: dict[str, dict[str, Any]], path: Path) -> None:
+    with open(path, "wb") as f:
+        pickle.dump(entries, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+JSON_SERIALIZER = Serializer(_load_json, _dump_json, (OSError, ValueError))
+PICKLE_SERIALIZER = Serializer(
+    _load_pickle,
+    _dump_pickle,
+    (OSError, ValueError, EOFError, pickle.UnpicklingError),
+)
+
+
+@dataclass
+class TTLFileCache(Generic[T]):
+    """TTL'd on-disk cache of values keyed by ticker.
+
+    Usage:
+        cache = TTLFileCache(path=Path("data/cache.json"), ttl=3600)
+
+        value = cache.get("AAPL")
+        if value is None:
+            value = fetch("AAPL")
+            cache.put("AAPL", value)
+        cache.save()
+    """
+
+    path: Path
+    ttl: float
+    max_age: float = 0.0  # Seconds expired entries are kept on disk
+    serializer: Serializer = JSON_SERIALIZER
+    name: str = "cache"  # Used in log messages
+
+    # State
+    _entries: dict[str, dict[str, Any]] = field(default_factory=dict, init=False)
+
+    def __post_init__(self) -> None:
+        """Load existing entries from disk."""
+        if not self.enabled or not self.path.exists():
+            return
+
+        try:
+            self._entries = self.serializer.load(self.path)
+        except self.serializer.errors as e:
+            logger.warning(f"Failed to load {self.name}: {e}")
+            self._entries = {}
+
+    @property
+    def enabled(self) -> bool:
+        """Whether caching is enabled."""
+        return self.ttl > 0
+
+    def _is_fresh(self, entry: dict[str, Any], now: float) -> bool:
+        return now - entry["fetched_at"] < self.ttl
+
+    def _is_kept(self, entry: dict[str, Any], now: float) -> bool:
+        return now - entry["fetched_at"] < max(self.ttl, self.max_age)
+
+    def get(self, ticker: str) -> T | None:
+        """Get the cached value for a ticker, or None if missing or expired."""
+        entry = self._entries.get(ticker)
+        if entry is None or not self._is_fresh(entry, time.time()):
+            return None
+        return entry["data"]
+
+    def get_expired(self, ticker: str) -> T | None:
+        """Get an expired value still within max_age, or None."""
+        entry = self._entries.get(ticker)
+        if entry is None:
+            return None
+
+        now = time.time()
+        if self._is_fresh(entry, now) or not self._is_kept(entry, now):
+            return None
+        return entry["data"]
+
+    def put(self, ticker: str, data: T) -> None:
+        """Cache a value for a ticker."""
+        if self.enabled:
+            self._entries[ticker] = {"fetched_at": time.time(), "data": data}
+
+    def put_all(self, items: Iterable[tuple[str, T]]) -> None:
+        """Cache values for several tickers."""
+        for ticker, data in items:
+            self.put(ticker, data)
+
+    def save(self) -> None:
+        """Write entries still within max(ttl, max_age) back to disk."""
+        if not self.enabled:
+            return
+
+        now = time.time()
+        kept = {
+            ticker: entry
+            for ticker, entry in self._entries.items()
+            if self._is_kept(entry, now)
+        }
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.serializer.dump(kept, self.path)
+        except OSError as e:
+            logger.warning(f"Failed to save {self.name}: {e}")
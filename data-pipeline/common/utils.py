@@ -2,16 +2,15 @@
 
 This module provides shared utilities used across the data pipeline:
 - safe_float, safe_int: Type conversion with NaN/Inf handling
+- downcast_ohlcv: Compact dtypes for KRX OHLCV frames
 - get_supabase_client: Supabase client initialization
-- socket_timeout: Context manager for temporary socket timeout
 """
 
 import math
 import os
-import socket
-from contextlib import contextmanager
-from typing import Any, Generator
+from typing import Any
 
+import numpy as np
 import pandas as pd
 from dotenv import load_dotenv
 from supabase import Client, create_client
@@ -19,28 +18,6 @@ from supabase import Client, create_client
 load_dotenv()
 
 
-@contextmanager
-def socket_timeout(timeout: float) -> Generator[None, None, None]:
-    """Context manager to temporarily set socket timeout.
-
-    Safely sets and restores socket timeout to avoid affecting other code.
-
-    Usage:
-        with socket_timeout(10.0):
-            # code that needs timeout
-            pass
-
-    Args:
-        timeout: Timeout in seconds
-    """
-    old_timeout = socket.getdefaulttimeout()
-    try:
-        socket.setdefaulttimeout(timeout)
-        yield
-    finally:
-        socket.setdefaulttimeout(old_timeout)
-
-
 def get_supabase_client() -> Client:
     """Initialize and return Supabase client."""
     url = os.environ.get("SUPABASE_URL")
@@ -110,3 +87,16 @@ def safe_int(value: Any) -> int | None:
         return int(value)
     except (ValueError, TypeError):
         return None
+
+
+def downcast_ohlcv(df: pd.DataFrame) -> pd.DataFrame:
+    """Store prices as float32 and volume as the smallest fitting integer.
+
+    KRX prices are whole won well below float32's 2**24 exact-integer limit,
+    so this halves the memory held per ticker without changing any value.
+    """
+    prices = [col for col in ("Open", "High", "Low", "Close") if col in df.columns]
+    df[prices] = df[prices].astype(np.float32)
+    if "Volume" in df.columns:
+        df["Volume"] = pd.to_numeric(df["Volume"], downcast="unsigned")
+    return df
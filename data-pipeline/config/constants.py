@@ -38,6 +38,9 @@ MAX_BACKOFFS = 5  # Maximum backoff attempts before giving up
 DEFAULT_HISTORY_DAYS = 300  # ~10 months of history for technical indicators
 HISTORY_PERIOD = "10mo"  # yfinance period string
 
+# === Ticker Universe ===
+DEFAULT_TICKER_TTL_SECONDS = 86400  # Re-fetch ticker lists at most once a day
+
 # === Quality Check ===
 MIN_COVERAGE_THRESHOLD = 0.95  # 95% coverage required
 
@@ -15,6 +15,7 @@ from .constants import (
     DEFAULT_JITTER,
     DEFAULT_MAX_WORKERS,
     DEFAULT_REQUEST_TIMEOUT,
+    DEFAULT_TICKER_TTL_SECONDS,
     MAX_RETRIES,
 )
 
@@ -51,6 +52,9 @@ class Settings(BaseSettings):
     max_retries: Annotated[int, Field(ge=0)] = MAX_RETRIES
     max_workers: Annotated[int, Field(gt=0)] = DEFAULT_MAX_WORKERS
 
+    # === Ticker Universe ===
+    ticker_ttl_seconds: Annotated[int, Field(ge=0)] = DEFAULT_TICKER_TTL_SECONDS
+
     # === Paths ===
     data_dir: Path = DATA_DIR
 
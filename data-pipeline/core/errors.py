@@ -6,9 +6,29 @@ Use `is_retryable` property to determine if an error can be retried.
 
 from __future__ import annotations
 
+import re
 from datetime import datetime
 from typing import Any
 
+# yfinance raises a dedicated type on HTTP 429 (0.2.54+); match it by type
+# before falling back to message indicators
+try:
+    from yfinance.exceptions import YFRateLimitError
+
+    _RATE_LIMIT_TYPES: tuple[type[Exception], ...] = (YFRateLimitError,)
+except ImportError:
+    _RATE_LIMIT_TYPES = ()
+
+# Message indicators, compiled once (case-insensitive)
+_RATE_LIMIT_PATTERN = re.compile(
+    r"429|rate limit|too many requests|throttl", re.IGNORECASE
+)
+_TIMEOUT_PATTERN = re.compile(r"timeout|timed out|deadline exceeded", re.IGNORECASE)
+_NETWORK_PATTERN = re.compile(
+    r"connection|network|unreachable|refused|reset|broken pipe", re.IGNORECASE
+)
+_NOT_FOUND_PATTERN = re.compile(r"not found|no data|empty|missing", re.IGNORECASE)
+
 
 class PipelineError(Exception):
     """Base error for all pipeline errors.
@@ -191,6 +211,13 @@ class ValidationError(PipelineError):
         return d
 
 
+def is_rate_limit_error(error: BaseException) -> bool:
+    """Whether an exception indicates rate limiting (by type, then message)."""
+    if isinstance(error, (RateLimitError, *_RATE_LIMIT_TYPES)):
+        return True
+    return _RATE_LIMIT_PATTERN.search(str(error)) is not None
+
+
 def classify_exception(error: Exception, source: str | None = None) -> PipelineError:
     """Classify a generic exception into a PipelineError.
 
@@ -201,34 +228,19 @@ def classify_exception(error: Exception, source: str | None = None) -> PipelineE
     Returns:
         Appropriate PipelineError subclass
     """
-    error_str = str(error).lower()
-
-    # Rate limit indicators
-    rate_limit_indicators = ["429", "rate limit", "too many requests", "throttl"]
-    if any(indicator in error_str for indicator in rate_limit_indicators):
-        return RateLimitError(str(error), source=source)
-
-    # Timeout indicators
-    timeout_indicators = ["timeout", "timed out", "deadline exceeded"]
-    if any(indicator in error_str for indicator in timeout_indicators):
-        return TimeoutError(str(error), source=source)
-
-    # Network indicators
-    network_indicators = [
-        "connection",
-        "network",
-        "unreachable",
-        "refused",
-        "reset",
-        "broken pipe",
-    ]
-    if any(indicator in error_str for indicator in network_indicators):
-        return NetworkError(str(error), source=source)
-
-    # Data not found indicators
-    not_found_indicators = ["not found", "no data", "empty", "missing"]
-    if any(indicator in error_str for indicator in not_found_indicators):
-        return DataNotFoundError(str(error), source=source)
+    message = str(error)
+
+    if is_rate_limit_error(error):
+        return RateLimitError(message, source=source)
+
+    if _TIMEOUT_PATTERN.search(message):
+        return TimeoutError(message, source=source)
+
+    if _NETWORK_PATTERN.search(message):
+        return NetworkError(message, source=source)
+
+    if _NOT_FOUND_PATTERN.search(message):
+        return DataNotFoundError(message, source=source)
 
     # Default to base PipelineError
-    return PipelineError(str(error), source=source)
+    return PipelineError(message, source=source)
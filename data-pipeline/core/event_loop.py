@@ -0,0 +1,36 @@
+"""Event loop helpers.
+
+uvloop is an optional dependency (``pip install .[uvloop]``). When it is
+installed, loops created here use it; otherwise they are standard asyncio
+loops.
+"""
+
+import asyncio
+from collections.abc import Callable, Coroutine
+from typing import Any, TypeVar
+
+try:
+    import uvloop
+
+    new_event_loop: Callable[[], asyncio.AbstractEventLoop] = uvloop.new_event_loop
+    HAS_UVLOOP = True
+except ImportError:
+    new_event_loop = asyncio.new_event_loop
+    HAS_UVLOOP = False
+
+T = TypeVar("T")
+
+
+def new_runner() -> asyncio.Runner:
+    """Create an asyncio.Runner backed by uvloop when available.
+
+    Reuse the runner for repeated ``run()`` calls to keep one loop (and its
+    connection pools) instead of creating a new loop per call.
+    """
+    return asyncio.Runner(loop_factory=new_event_loop)
+
+
+def run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """Drop-in for ``asyncio.run()`` that uses uvloop when available."""
+    with new_runner() as runner:
+        return runner.run(coro)
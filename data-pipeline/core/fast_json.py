@@ -0,0 +1,19 @@
+"""JSON decoding for API responses.
+
+orjson is an optional dependency (``pip install .[orjson]``). When it is
+installed, ``loads`` uses it; otherwise it is the stdlib ``json.loads``.
+Pass it to aiohttp as ``await resp.json(loads=loads)``.
+"""
+
+import json
+from collections.abc import Callable
+from typing import Any
+
+try:
+    import orjson
+
+    loads: Callable[[str | bytes], Any] = orjson.loads
+    HAS_ORJSON = True
+except ImportError:
+    loads = json.loads
+    HAS_ORJSON = False
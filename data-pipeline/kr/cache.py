@@ -0,0 +1,73 @@
+"""Persistent history cache.
+
+History (~1 year of OHLCV per ticker) is the slowest KR phase, and it
+doesn't change between re-runs shortly after one another (e.g. retrying a
+failed collection). Successful results are kept in a pickle file so a re-run
+within the TTL skips the download:
+- Entries are keyed by ticker with the time they were fetched
+- Expired entries are not served as-is
+- A TTL of 0 disables the cache
+
+The TTL is short by default: the latest price is read from history, so
+entries fetched during market hours go stale once the session moves on.
+
+Expired entries are kept for ``max_age`` (then dropped on the next save) as
+a base for an incremental refresh: only the days after the entry's last
+settled row are downloaded and appended (see ``extend_history``).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import pandas as pd
+from common.ttl_cache import PICKLE_SERIALIZER, Serializer, TTLFileCache
+
+
+@dataclass
+class HistoryCache(TTLFileCache[pd.DataFrame]):
+    """TTL'd on-disk cache of OHLCV DataFrames keyed by ticker.
+
+    Usage:
+        cache = HistoryCache(path=Path("data/kr_history_cache.pkl"), ttl=3600)
+
+        df = cache.get("005930")
+        if df is None:
+            df = fetch_history("005930")
+            cache.put("005930", df)
+        cache.save()
+    """
+
+    ttl: float = 3600.0  # Seconds (1 hour)
+    max_age: float = 604800.0  # Seconds (7 days) expired entries are kept
+    serializer: Serializer = PICKLE_SERIALIZER
+    name: str = "history cache"
+
+
+def extend_history(
+    base: pd.DataFrame,
+    recent: pd.DataFrame,
+    window_start: pd.Timestamp,
+) -> pd.DataFrame | None:
+    """Append recently fetched rows to cached history.
+
+    ``recent`` must start on or before ``base``'s second-to-last day. The
+    last cached row may be a partial intraday bar, so it is replaced. The
+    row before it must match exactly; otherwise prices were adjusted (e.g.
+    a split) since caching, and None is returned so the caller refetches in
+    full.
+
+    The result is trimmed to rows on or after ``window_start``.
+    """
+    if len(base) < 2:
+        return None
+
+    settled = base.index[-2]
+    pos = recent.index.searchsorted(settled)
+    if pos >= len(recent) or recent.index[pos] != settled:
+        return None
+    if recent["Close"].iat[pos] != base["Close"].iat[-2]:
+        return None
+
+    merged = pd.concat([base.iloc[:-1], recent.iloc[pos + 1 :]])
+    return merged.iloc[merged.index.searchsorted(window_start) :]
@@ -16,7 +16,8 @@ class KRConfig:
     """KR pipeline configuration.
 
     Optimized for:
-    - FDR (FinanceDataReader): Price and history data
+    - Naver chart API: Price and history data
+    - FDR (FinanceDataReader): History fallback and index data
     - Naver Finance: Fundamental metrics (web scraping)
     - KIS API: Supplementary data (optional)
     """
@@ -26,6 +27,8 @@ class KRConfig:
     fdr_timeout: float = 10.0
     # Naver scraping is usually fast
     naver_timeout: float = 5.0
+    # Naver chart API (one ~1-year OHLCV response per ticker)
+    naver_chart_timeout: float = 10.0
     # KIS API
     kis_timeout: float = 10.0
     # Batch-level timeout (for entire batch of requests)
@@ -38,6 +41,8 @@ class KRConfig:
     metrics_batch_size: int = 50
     # Concurrent workers for FDR history fetch
     max_workers: int = 8
+    # Concurrent requests (and pooled connections) for Naver chart history
+    naver_chart_concurrency: int = 20
 
     # === Retry settings (simple) ===
     max_retries: int = 2
@@ -48,10 +53,19 @@ class KRConfig:
     tickers_file: Path = field(
         default_factory=lambda: Path("data/companies/kr_companies.csv")
     )
+    history_cache_file: Path = field(
+        default_factory=lambda: Path("data/kr_history_cache.pkl")
+    )
 
     # === History ===
     history_days: int = 365  # ~12 months for 52-week high/low and technical indicators
 
+    # === History cache ===
+    # Seconds cached history stays valid for re-runs (0 disables)
+    history_cache_ttl: float = 3600.0
+    # Seconds expired history is kept to be extended instead of refetched
+    history_cache_max_age: float = 604800.0
+
     # === KIS API (optional) ===
     kis_app_key: str | None = field(
         default_factory=lambda: os.environ.get("KIS_APP_KEY")
@@ -59,6 +73,9 @@ class KRConfig:
     kis_app_secret: str | None = field(
         default_factory=lambda: os.environ.get("KIS_APP_SECRET")
     )
+    # Large caps probed before the full KIS sweep (Samsung Electronics,
+    # SK hynix, NAVER); unless most succeed, metrics go straight to Naver
+    kis_probe_tickers: tuple[str, ...] = ("005930", "000660", "035420")
 
     @property
     def kis_available(self) -> bool:
@@ -83,3 +100,4 @@ class KRConfig:
         # Ensure directories exist
         object.__setattr__(self, "data_dir", Path(self.data_dir))
         object.__setattr__(self, "tickers_file", Path(self.tickers_file))
+        object.__setattr__(self, "history_cache_file", Path(self.history_cache_file))
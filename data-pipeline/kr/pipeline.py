@@ -4,8 +4,8 @@ Simple pipeline optimized for FDR + Naver + KIS data sources.
 No complex rate limiting needed - focus on timeout management.
 
 Pipeline flow:
-1. Fetch prices/history from FDR
-2. Fetch metrics from KIS (primary) or Naver (fallback)
+1. Fetch prices/history from Naver's chart API (FDR as fallback)
+2. Fetch metrics from KIS (primary) or Naver (fallback), concurrently with 1
 3. Calculate technical indicators (RSI, MACD, BB, etc.)
 4. Calculate Beta using KOSPI index
 5. Merge and return results
@@ -15,21 +15,23 @@ from __future__ import annotations
 
 import asyncio
 from dataclasses import dataclass, field
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 from typing import Any
 
 import pandas as pd
 
 from common.indicators import (
-    calculate_all_technicals,
-    calculate_beta,
+    calculate_52_week_high_low_batch,
+    calculate_beta_batch,
     calculate_graham_number,
-    calculate_moving_averages,
+    calculate_moving_averages_batch,
+    calculate_technicals_batch,
 )
 from core.types import (
     BatchFetchResult,
     CollectionPhase,
     CollectionResult,
+    FetchResult,
     HistoryData,
     Market,
     MetricsData,
@@ -39,6 +41,7 @@ from core.types import (
 from observability.logger import get_logger, log_context
 from observability.metrics import MetricsCollector
 
+from .cache import HistoryCache, extend_history
 from .config import KRConfig
 from .sources import FDRSource, KISSource, NaverSource
 
@@ -52,7 +55,8 @@ class KRPipeline:
     Optimized for Korean market characteristics:
     - No rate limiting concerns (FDR, Naver, KIS are forgiving)
     - Focus on timeout management
-    - Simple sequential processing
+    - History (Naver chart API) and metrics (KIS/Naver pages) hit different
+      endpoints, so they are fetched concurrently
     """
 
     config: KRConfig = field(default_factory=KRConfig)
@@ -103,40 +107,38 @@ class KRPipeline:
         )
 
         merged_data: list[dict[str, Any]] = []
+        technicals_task: asyncio.Future[dict[str, TechnicalIndicators]] | None = None
+        history_task: (
+            asyncio.Future[tuple[BatchFetchResult[HistoryData], pd.DataFrame | None]]
+            | None
+        ) = None
 
         with log_context(market="kr"):
             with self.metrics.collection("kr", total=len(tickers)) as m:
                 try:
-                    # Phase 1: Fetch history from FDR
-                    result.phase = CollectionPhase.HISTORY
-                    logger.info(
-                        "Starting history collection",
-                        extra={"total_tickers": len(tickers)},
-                    )
-
-                    with self.metrics.phase("history"):
-                        history_result = await self.fdr.fetch_history(tickers)
-
-                    logger.info(
-                        "History collection completed",
-                        extra={
-                            "success": history_result.success_count,
-                            "failed": history_result.failed_count,
-                        },
+                    # Phase 1-2: History and KOSPI index. Metrics come
+                    # from KIS/Naver without history, so both run concurrently.
+                    history_task = asyncio.ensure_future(self._fetch_history(tickers))
+
+                    # Technicals only need history, so calculate them in a worker
+                    # thread as soon as it lands, while metrics are still running
+                    technicals_task = asyncio.ensure_future(
+                        self._calculate_technicals_after(history_task)
                     )
 
-                    # Phase 2: Fetch index for Beta calculation
-                    logger.info("Fetching KOSPI index for Beta calculation")
-                    kospi_history = await self.fdr.fetch_index_history("KS11")
-
                     # Phase 3: Fetch metrics from KIS (primary) or Naver (fallback)
                     result.phase = CollectionPhase.METRICS
                     logger.info("Starting metrics collection")
 
                     with self.metrics.phase("metrics"):
-                        if self.kis.is_available:
+                        probe = (
+                            await self._probe_kis(tickers)
+                            if self.kis.is_available
+                            else None
+                        )
+                        if probe is not None:
                             logger.info("Using KIS API for metrics (primary)")
-                            metrics_result = await self.kis.fetch_metrics(tickers)
+                            metrics_result = await self._sweep_kis(tickers, probe)
 
                             # Fallback to Naver for failed tickers
                             failed_tickers = [r.ticker for r in metrics_result.failed]
@@ -162,14 +164,14 @@ class KRPipeline:
                         },
                     )
 
+                    history_result, _ = await history_task
+
                     # Phase 4: Calculate technical indicators
                     result.phase = CollectionPhase.TECHNICALS
                     logger.info("Calculating technical indicators")
 
                     with self.metrics.phase("technicals"):
-                        technicals = self._calculate_technicals(
-                            history_result, kospi_history
-                        )
+                        technicals = await technicals_task
 
                     # Phase 5: Merge all data
                     result.phase = CollectionPhase.SAVE
@@ -205,11 +207,242 @@ class KRPipeline:
                     raise
 
                 finally:
+                    for task in (technicals_task, history_task):
+                        if task is not None and not task.done():
+                            task.cancel()
                     result.ended_at = datetime.now()
                     await self._cleanup()
 
         return result, merged_data
 
+    async def _fetch_history(
+        self,
+        tickers: list[str],
+    ) -> tuple[BatchFetchResult[HistoryData], pd.DataFrame | None]:
+        """Fetch OHLCV history and the KOSPI index (FDR) for Beta calculation."""
+        logger.info(
+            "Starting history collection",
+            extra={"total_tickers": len(tickers)},
+        )
+
+        with self.metrics.phase("history"):
+            history_result = await self._fetch_history_cached(tickers)
+
+        logger.info(
+            "History collection completed",
+            extra={
+                "success": history_result.success_count,
+                "failed": history_result.failed_count,
+            },
+        )
+
+        logger.info("Fetching KOSPI index for Beta calculation")
+        kospi_history = await self.fdr.fetch_index_history("KS11")
+
+        return history_result, kospi_history
+
+    async def _fetch_history_cached(
+        self,
+        tickers: list[str],
+    ) -> BatchFetchResult[HistoryData]:
+        """Fetch history, reusing entries from the history cache.
+
+        Fresh entries are used as-is and expired ones are extended with just
+        the days since they were cached. Only tickers missing from the cache
+        (or whose refresh didn't line up) are downloaded in full, and all
+        downloads are cached. The cache file is read and written in a worker
+        thread so the concurrent metrics phase keeps running.
+        """
+        cache = await asyncio.to_thread(
+            HistoryCache,
+            path=self.config.history_cache_file,
+            ttl=self.config.history_cache_ttl,
+            max_age=self.config.history_cache_max_age,
+        )
+
+        cached: list[FetchResult[HistoryData]] = []
+        expired: dict[str, pd.DataFrame] = {}
+        to_fetch: list[str] = []
+        for ticker in tickers:
+            df = cache.get(ticker)
+            if df is not None:
+                cached.append(
+                    FetchResult(
+                        ticker=ticker,
+                        data=HistoryData(ticker=ticker, data=df),
+                        source="cache",
+                    )
+                )
+            elif (base := cache.get_expired(ticker)) is not None:
+                expired[ticker] = base
+            else:
+                to_fetch.append(ticker)
+
+        if cached or expired:
+            logger.info(
+                f"History cache hit for {len(cached)} tickers, "
+                f"refreshing {len(expired)}, fetching {len(to_fetch)}"
+            )
+        if not expired and not to_fetch:
+            return BatchFetchResult(results=cached, source="cache")
+
+        refreshed: list[FetchResult[HistoryData]] = []
+        if expired:
+            refreshed, stale = await self._refresh_history(expired)
+            to_fetch.extend(stale)
+
+        result: BatchFetchResult[HistoryData] = BatchFetchResult(
+            results=[], source="cache"
+        )
+        if to_fetch:
+            result = await self._fetch_history_with_fallback(to_fetch)
+
+        fetched = refreshed + result.results
+        if cache.enabled:
+            cache.put_all(
+                (r.ticker, r.data.data)
+                for r in fetched
+                if r.is_success and r.data is not None
+            )
+            await asyncio.to_thread(cache.save)
+
+        return BatchFetchResult(
+            results=cached + fetched,
+            total_latency_ms=result.total_latency_ms,
+            source=result.source,
+        )
+
+    async def _refresh_history(
+        self,
+        expired: dict[str, pd.DataFrame],
+    ) -> tuple[list[FetchResult[HistoryData]], list[str]]:
+        """Extend expired cache entries with the days since they were cached.
+
+        Each refetch starts at the entry's second-to-last day (see
+        extend_history), so tickers are grouped by that day. Returns the
+        refreshed results and the tickers that need a full fetch instead.
+        """
+        today = date.today()
+        window_start = pd.Timestamp(today - timedelta(days=self.config.history_days))
+
+        stale: list[str] = []
+        by_start: dict[date, list[str]] = {}
+        for ticker, base in expired.items():
+            if len(base) < 2:
+                stale.append(ticker)
+            else:
+                by_start.setdefault(base.index[-2].date(), []).append(ticker)
+
+        refreshed: list[FetchResult[HistoryData]] = []
+        for start, group in by_start.items():
+            recent = await self.naver.fetch_history(group, days=(today - start).days)
+
+            for r in recent.results:
+                merged = None
+                if r.is_success and r.data is not None:
+                    merged = extend_history(expired[r.ticker], r.data.data, window_start)
+
+                if merged is None or merged.empty:
+                    stale.append(r.ticker)
+                else:
+                    refreshed.append(
+                        FetchResult(
+                            ticker=r.ticker,
+                            data=HistoryData(ticker=r.ticker, data=merged),
+                            latency_ms=r.latency_ms,
+                            source=r.source,
+                        )
+                    )
+
+        logger.info(
+            f"History refreshed for {len(refreshed)} tickers, "
+            f"{len(stale)} need a full fetch"
+        )
+        return refreshed, stale
+
+    async def _fetch_history_with_fallback(
+        self,
+        tickers: list[str],
+    ) -> BatchFetchResult[HistoryData]:
+        """Fetch history from Naver's chart API, falling back to FDR on failure."""
+        history_result = await self.naver.fetch_history(tickers)
+
+        failed_tickers = [r.ticker for r in history_result.failed]
+        if not failed_tickers:
+            return history_result
+
+        logger.info(f"Falling back to FDR history for {len(failed_tickers)} tickers")
+        fdr_result = await self.fdr.fetch_history(failed_tickers)
+
+        return BatchFetchResult(
+            results=history_result.succeeded + fdr_result.results,
+            total_latency_ms=(
+                history_result.total_latency_ms + fdr_result.total_latency_ms
+            ),
+            source="naver+fdr",
+        )
+
+    async def _probe_kis(
+        self, tickers: list[str]
+    ) -> BatchFetchResult[MetricsData] | None:
+        """Probe KIS with a few large caps before the full metrics sweep.
+
+        A misconfigured or rate-limited KIS account fails every ticker, so
+        finding out from a handful saves a full sweep of failures before the
+        Naver fallback.
+
+        Returns:
+            None if KIS looks unhealthy. Otherwise the probe results for
+            tickers in ``tickers``, so the sweep doesn't request them again.
+        """
+        probe_tickers = list(self.config.kis_probe_tickers)
+        if not probe_tickers:
+            return BatchFetchResult(source="kis")
+
+        probe = await self.kis.fetch_metrics(probe_tickers)
+        if probe.success_count * 2 <= len(probe_tickers):
+            logger.warning(
+                "KIS probe failed, going straight to Naver",
+                extra={
+                    "success": probe.success_count,
+                    "failed": probe.failed_count,
+                },
+            )
+            return None
+
+        universe = set(tickers)
+        return BatchFetchResult(
+            results=[r for r in probe.results if r.ticker in universe],
+            total_latency_ms=probe.total_latency_ms,
+            source=probe.source,
+        )
+
+    async def _sweep_kis(
+        self,
+        tickers: list[str],
+        probe: BatchFetchResult[MetricsData],
+    ) -> BatchFetchResult[MetricsData]:
+        """Fetch KIS metrics for the tickers the probe didn't already cover."""
+        probed = {r.ticker for r in probe.results}
+        sweep = await self.kis.fetch_metrics([t for t in tickers if t not in probed])
+        return BatchFetchResult(
+            results=probe.results + sweep.results,
+            total_latency_ms=probe.total_latency_ms + sweep.total_latency_ms,
+            source=sweep.source,
+        )
+
+    async def _calculate_technicals_after(
+        self,
+        history_task: asyncio.Future[
+            tuple[BatchFetchResult[HistoryData], pd.DataFrame | None]
+        ],
+    ) -> dict[str, TechnicalIndicators]:
+        """Calculate technicals in a worker thread once history has landed."""
+        history_result, kospi_history = await history_task
+        return await asyncio.to_thread(
+            self._calculate_technicals, history_result, kospi_history
+        )
+
     def _merge_metrics_results(
         self,
         primary: BatchFetchResult[MetricsData],
@@ -234,17 +467,11 @@ class KRPipeline:
                 merged_results.append(result)
                 merged_tickers.add(result.ticker)
 
-        # Add failed results (only for tickers not in either succeeded set)
-        for result in primary.failed:
-            if result.ticker not in merged_tickers:
-                # Check if fallback has this ticker
-                fallback_result = next(
-                    (r for r in fallback.results if r.ticker == result.ticker), None
-                )
-                if fallback_result and fallback_result.is_success:
-                    merged_results.append(fallback_result)
-                else:
-                    merged_results.append(result)
+        # Add failed results (only for tickers not in either succeeded set;
+        # any fallback success is already in merged_tickers)
+        merged_results.extend(
+            result for result in primary.failed if result.ticker not in merged_tickers
+        )
 
         return BatchFetchResult(
             results=merged_results,
@@ -260,32 +487,43 @@ class KRPipeline:
         """Calculate technical indicators for all tickers.
 
         Args:
-            history_result: History data from FDR
+            history_result: History data (Naver chart API or FDR)
             kospi_history: KOSPI index history for Beta calculation
 
         Returns:
             Dict mapping ticker to TechnicalIndicators
         """
         technicals: dict[str, TechnicalIndicators] = {}
+        today = date.today()
+        if kospi_history is not None and kospi_history.empty:
+            kospi_history = None
 
-        for result in history_result.succeeded:
-            if result.data is None:
-                continue
+        histories = {
+            result.ticker: result.data.data
+            for result in history_result.succeeded
+            if result.data is not None
+        }
 
-            ticker = result.ticker
-            df = result.data.data
+        # Calculate all technicals in one vectorized pass
+        try:
+            batch = calculate_technicals_batch(histories)
+        except Exception as e:
+            logger.warning(f"Failed to calculate technicals: {e}")
+            batch = {}
 
+        betas: dict[str, float | None] = {}
+        if kospi_history is not None:
             try:
-                # Calculate all technicals
-                tech_dict = calculate_all_technicals(df)
+                betas = calculate_beta_batch(histories, kospi_history)
+            except Exception as e:
+                logger.warning(f"Failed to calculate beta: {e}")
 
-                # Calculate Beta
-                beta = None
-                if kospi_history is not None and not kospi_history.empty:
-                    beta = calculate_beta(df, kospi_history)
+        for ticker, df in histories.items():
+            tech_dict = batch.get(ticker, {})
 
+            try:
                 # Get trading date from history
-                trading_date = date.today()
+                trading_date = today
                 if not df.empty and hasattr(df.index[-1], "date"):
                     trading_date = df.index[-1].date()
 
@@ -305,7 +543,7 @@ class KRPipeline:
                 )
 
                 # Store beta in metrics later (not in technicals)
-                technicals[ticker]._beta = beta  # type: ignore
+                technicals[ticker]._beta = betas.get(ticker)  # type: ignore
 
             except Exception as e:
                 logger.debug(f"Failed to calculate technicals for {ticker}: {e}")
@@ -321,7 +559,7 @@ class KRPipeline:
         """Merge all data into final output format.
 
         Args:
-            history_result: History/price data from FDR
+            history_result: History/price data (Naver chart API or FDR)
             metrics_result: Metrics from KIS/Naver
             technicals: Calculated technical indicators
 
@@ -330,40 +568,29 @@ class KRPipeline:
         """
         merged: list[dict[str, Any]] = []
 
+        # Filter out missing/empty histories once instead of per lookup loop
+        histories: dict[str, pd.DataFrame] = {
+            result.ticker: result.data.data
+            for result in history_result.succeeded
+            if result.data is not None and not result.data.data.empty
+        }
+
         # Build lookup dicts
         prices: dict[str, PriceData] = {}
-        for result in history_result.succeeded:
-            if result.data is not None:
-                df = result.data.data
-                if not df.empty:
-                    # Extract latest price
-                    price = self._extract_price(result.ticker, df)
-                    if price:
-                        prices[result.ticker] = price
+        for ticker, df in histories.items():
+            # Extract latest price
+            price = self._extract_price(ticker, df)
+            if price:
+                prices[ticker] = price
 
         metrics: dict[str, MetricsData] = {}
         for result in metrics_result.succeeded:
             if result.data is not None:
                 metrics[result.ticker] = result.data
 
-        # Calculate moving averages from history
-        ma_data: dict[str, tuple[float | None, float | None]] = {}
-        for result in history_result.succeeded:
-            if result.data is not None:
-                ma_50, ma_200 = calculate_moving_averages(result.data.data)
-                ma_data[result.ticker] = (ma_50, ma_200)
-
-        # Calculate 52-week high/low from history
-        week52_data: dict[str, tuple[float | None, float | None]] = {}
-        for result in history_result.succeeded:
-            if result.data is not None:
-                df = result.data.data
-                if not df.empty and len(df) > 0:
-                    # Use last 252 trading days (approximately 1 year)
-                    year_data = df.tail(252)
-                    high_52w = float(year_data["High"].max()) if "High" in year_data else None
-                    low_52w = float(year_data["Low"].min()) if "Low" in year_data else None
-                    week52_data[result.ticker] = (high_52w, low_52w)
+        # Moving averages and 52-week high/low, each in one pass over all tickers
+        ma_data = calculate_moving_averages_batch(histories)
+        week52_data = calculate_52_week_high_low_batch(histories)
 
         # Merge for each ticker with price data
         for ticker, price in prices.items():
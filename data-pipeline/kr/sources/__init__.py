@@ -1,7 +1,7 @@
 """KR data sources.
 
-- FDR (FinanceDataReader): Prices and OHLCV history
-- Naver Finance: Fundamental metrics (web scraping)
+- FDR (FinanceDataReader): OHLCV history fallback and index data
+- Naver Finance: OHLCV history (chart API) and fundamental metrics (web scraping)
 - KIS API: Primary metrics source (optional, requires credentials)
 """
 
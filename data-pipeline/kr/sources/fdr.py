@@ -13,14 +13,19 @@ from __future__ import annotations
 
 import asyncio
 import time
-from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import date, timedelta
 from typing import TYPE_CHECKING
 
 import pandas as pd
 
-from core.errors import DataNotFoundError, TimeoutError, classify_exception
+from common.utils import downcast_ohlcv
+from core.errors import (
+    DataNotFoundError,
+    TimeoutError as PipelineTimeoutError,
+    classify_exception,
+)
 from core.types import (
     BatchFetchResult,
     FetchResult,
@@ -166,11 +171,15 @@ class FDRSource:
                     )
                     futures[ticker] = future
 
-                # Collect results
+                # Collect results without blocking the event loop, so other
+                # phases (e.g. metrics) can make progress meanwhile
                 for ticker, future in futures.items():
                     fetch_start = time.monotonic()
                     try:
-                        df = future.result(timeout=self.config.fdr_timeout)
+                        df = await asyncio.wait_for(
+                            asyncio.wrap_future(future),
+                            timeout=self.config.fdr_timeout,
+                        )
                         latency = (time.monotonic() - fetch_start) * 1000
 
                         if df is not None and not df.empty:
@@ -195,7 +204,7 @@ class FDRSource:
                                 )
                             )
 
-                    except FuturesTimeoutError:
+                    except TimeoutError:
                         latency = (time.monotonic() - fetch_start) * 1000
                         logger.warning(
                             "Timeout fetching history",
@@ -204,7 +213,7 @@ class FDRSource:
                         results.append(
                             FetchResult(
                                 ticker=ticker,
-                                error=TimeoutError(
+                                error=PipelineTimeoutError(
                                     f"Timeout after {self.config.fdr_timeout}s",
                                     timeout=self.config.fdr_timeout,
                                     ticker=ticker,
@@ -300,7 +309,7 @@ class FDRSource:
                     logger.debug(f"Successfully fetched index {code}")
                     return df
 
-            except asyncio.TimeoutError:
+            except TimeoutError:
                 logger.debug(f"Timeout fetching index {code}")
                 continue
             except Exception as e:
@@ -341,7 +350,7 @@ class FDRSource:
             if not all(col in df.columns for col in required):
                 return None
 
-            return df
+            return downcast_ohlcv(df)
 
         except Exception as e:
             logger.debug(f"FDR fetch failed for {ticker}: {e}")
@@ -15,18 +15,17 @@ from __future__ import annotations
 import asyncio
 import time
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from typing import TYPE_CHECKING, Any, ClassVar
 
 import aiohttp
 
 from core.errors import DataNotFoundError, NetworkError, RateLimitError, TimeoutError
+from core.fast_json import loads
 from core.types import BatchFetchResult, FetchResult, MetricsData
 from observability.logger import get_logger, log_context
 
 if TYPE_CHECKING:
-    from datetime import date
-
     from kr.config import KRConfig
 
 logger = get_logger(__name__)
@@ -63,7 +62,9 @@ class KISSource:
         self._token_expires: datetime | None = None
         self._session: aiohttp.ClientSession | None = None
         self._rate_limit = 15.0  # requests per second
-        self._tokens = self._rate_limit
+        # No burst: requests run concurrently, so a full bucket would let
+        # a second's worth through on top of the steady rate
+        self._tokens = 1.0
         self._last_refill = time.monotonic()
         self._lock = asyncio.Lock()
 
@@ -91,13 +92,10 @@ class KISSource:
         Returns:
             BatchFetchResult containing MetricsData for each ticker
         """
-        from datetime import date as date_type
-
         if trading_date is None:
-            trading_date = date_type.today()
+            trading_date = date.today()
 
         results: list[FetchResult[MetricsData]] = []
-        total_latency = 0.0
 
         if not tickers:
             return BatchFetchResult(results=results, source="kis")
@@ -124,39 +122,30 @@ class KISSource:
             # Get access token first
             await self._get_access_token()
 
-            # Process tickers with rate limiting
-            batch_size = self.config.metrics_batch_size
-            delay = 0.1  # 100ms between calls
-
-            for i in range(0, len(tickers), batch_size):
-                batch = tickers[i : i + batch_size]
-                batch_start = time.monotonic()
-
-                with log_context(
-                    source="kis",
-                    phase="metrics",
-                    batch_index=i // batch_size,
-                    batch_size=len(batch),
-                ):
-                    for ticker in batch:
-                        result = await self._fetch_single_metrics(ticker, trading_date, delay)
-                        results.append(result)
-
-                    batch_latency = (time.monotonic() - batch_start) * 1000
-                    total_latency += batch_latency
-
-                    # Log batch completion
-                    batch_succeeded = sum(
-                        1 for r in results[i:] if r.is_success
-                    )
-                    logger.info(
-                        "Batch completed",
-                        extra={
-                            "success_count": batch_succeeded,
-                            "failed_count": len(batch) - batch_succeeded,
-                            "duration_ms": round(batch_latency, 2),
-                        },
-                    )
+            results = [None] * len(tickers)  # type: ignore[list-item]
+            pending = iter(enumerate(tickers))
+
+            async def worker() -> None:
+                for i, ticker in pending:
+                    results[i] = await self._fetch_single_metrics(ticker, trading_date)
+
+            # Workers pull tickers as slots free up; _request paces the calls
+            workers = min(self.config.metrics_batch_size, len(tickers))
+            batch_start = time.monotonic()
+
+            with log_context(source="kis", phase="metrics", batch_size=len(tickers)):
+                await asyncio.gather(*(worker() for _ in range(workers)))
+
+                total_latency = (time.monotonic() - batch_start) * 1000
+                succeeded = sum(1 for r in results if r.is_success)
+                logger.info(
+                    "Batch completed",
+                    extra={
+                        "success_count": succeeded,
+                        "failed_count": len(tickers) - succeeded,
+                        "duration_ms": round(total_latency, 2),
+                    },
+                )
 
         finally:
             await self.close()
@@ -171,14 +160,12 @@ class KISSource:
         self,
         ticker: str,
         trading_date: date,
-        delay: float,
     ) -> FetchResult[MetricsData]:
         """Fetch metrics for a single ticker.
 
         Args:
             ticker: KRX ticker code
             trading_date: Date for the metrics
-            delay: Delay after request
 
         Returns:
             FetchResult containing MetricsData or error
@@ -186,11 +173,19 @@ class KISSource:
         fetch_start = time.monotonic()
 
         try:
-            # Fetch quote data (PER, PBR, EPS, BPS, 52w high/low)
-            quote = await self._get_quote(ticker)
-
-            # Fetch financial ratios (ROE, ROA, debt ratio)
-            ratio = await self._get_financial_ratio(ticker)
+            # Fetch quote data (PER, PBR, EPS, BPS, 52w high/low) and
+            # financial ratios (ROE, margins, debt ratio) concurrently. Both
+            # calls are always awaited so a failed quote doesn't leave the
+            # ratio request running unobserved after we've moved on.
+            quote, ratio = await asyncio.gather(
+                self._get_quote(ticker),
+                self._get_financial_ratio(ticker),
+                return_exceptions=True,
+            )
+            if isinstance(quote, BaseException):
+                raise quote
+            if isinstance(ratio, BaseException):
+                raise ratio
 
             latency = (time.monotonic() - fetch_start) * 1000
 
@@ -224,9 +219,6 @@ class KISSource:
                 debt_equity=ratio.get("debt_ratio"),
             )
 
-            # Rate limiting delay
-            await asyncio.sleep(delay)
-
             return FetchResult(
                 ticker=ticker,
                 data=metrics,
@@ -359,7 +351,7 @@ class KISSource:
                     text = await resp.text()
                     raise KISAuthError(f"Failed to get access token: {resp.status} {text}")
 
-                data = await resp.json()
+                data = await resp.json(loads=loads)
 
                 if "access_token" not in data:
                     raise KISAuthError(f"No access token in response: {data}")
@@ -381,7 +373,7 @@ class KISSource:
             elapsed = now - self._last_refill
 
             self._tokens = min(
-                self._rate_limit,
+                1.0,
                 self._tokens + elapsed * self._rate_limit,
             )
             self._last_refill = now
@@ -389,7 +381,9 @@ class KISSource:
             if self._tokens < 1:
                 wait_time = (1 - self._tokens) / self._rate_limit
                 await asyncio.sleep(wait_time)
+                # The token that refilled while waiting is used up now
                 self._tokens = 0
+                self._last_refill = time.monotonic()
             else:
                 self._tokens -= 1
 
@@ -417,7 +411,7 @@ class KISSource:
         }
 
         async with self._session.get(url, headers=headers, params=params) as resp:
-            data = await resp.json()
+            data = await resp.json(loads=loads)
 
             if resp.status == 429:
                 raise RateLimitError("KIS API rate limit exceeded")
@@ -1,11 +1,12 @@
-"""Naver Finance source for Korean stock fundamentals.
+"""Naver Finance source for Korean stocks.
 
 Scrapes Naver Finance web pages to extract:
 - PER, PBR, EPS, BPS (from main page)
 - ROE, ROA, Debt/Equity (from financial analysis table)
 - Dividend yield, Market cap (from sise page)
 
-This is a fallback source when KIS API is not available.
+Metrics scraping is a fallback when KIS API is not available. Daily OHLCV
+history comes from Naver's chart API (siseJson).
 """
 
 from __future__ import annotations
@@ -14,23 +15,53 @@ import asyncio
 import contextlib
 import re
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from html import unescape
 from typing import TYPE_CHECKING, Any, ClassVar
 
 import aiohttp
+import numpy as np
+import pandas as pd
 from bs4 import BeautifulSoup
 
-from core.errors import DataNotFoundError, NetworkError, TimeoutError, classify_exception
-from core.types import BatchFetchResult, FetchResult, MetricsData
+from common.utils import downcast_ohlcv
+from core.errors import (
+    DataNotFoundError,
+    NetworkError,
+    TimeoutError as PipelineTimeoutError,
+    classify_exception,
+)
+from core.types import BatchFetchResult, FetchResult, HistoryData, MetricsData
 from observability.logger import get_logger, log_context
 
 if TYPE_CHECKING:
-    from datetime import date
-
     from kr.config import KRConfig
 
 logger = get_logger(__name__)
 
+# Main page fields are three id'd <em> tags and one table, so they are read
+# with regexes instead of building a DOM for every ticker's page
+_MAIN_EM_PATTERNS = tuple(
+    (key, re.compile(rf'<em\b[^>]*\bid="{em_id}"[^>]*>([^<]*)</em>'))
+    for key, em_id in (("pe_ratio", "_per"), ("eps", "_eps"), ("pb_ratio", "_pbr"))
+)
+_PER_TABLE_RE = re.compile(
+    r'<table\b[^>]*\bclass="[^"]*\bper_table\b[^"]*"[^>]*>(.*?)</table>', re.DOTALL
+)
+_TAG_RE = re.compile(r"<[^>]+>")
+_BPS_RE = re.compile(r"PBR.*?l\s*BPS.*?([\d,.]+)배.*?l\s*([\d,]+)원", re.DOTALL)
+
+# Market data fields in the sise page text
+_MARKET_CAP_RE = re.compile(r"시가총액[^\d]*([\d,]+)\s*억")
+_DIVIDEND_YIELD_RE = re.compile(r"배당수익률[^\d]*([\d.]+)\s*%")
+
+# One day of siseJson: ["20240102", 78200, 79800, 78200, 79600, 17142847, 53.39]
+_CHART_ROW_RE = re.compile(
+    r'\[\s*"(\d{8})"\s*,\s*([\d.]+)\s*,\s*([\d.]+)\s*,\s*([\d.]+)\s*,'
+    r"\s*([\d.]+)\s*,\s*(\d+)"
+)
+
 
 @dataclass
 class NaverSource:
@@ -41,10 +72,12 @@ class NaverSource:
     """
 
     config: KRConfig
+    _session: aiohttp.ClientSession | None = field(default=None, init=False, repr=False)
 
     BASE_URL: ClassVar[str] = "https://finance.naver.com"
     MAIN_URL: ClassVar[str] = f"{BASE_URL}/item/main.naver"
     SISE_URL: ClassVar[str] = f"{BASE_URL}/item/sise.naver"
+    CHART_URL: ClassVar[str] = "https://api.finance.naver.com/siseJson.naver"
 
     DEFAULT_HEADERS: ClassVar[dict[str, str]] = {
         "User-Agent": (
@@ -71,163 +104,170 @@ class NaverSource:
         Returns:
             BatchFetchResult containing MetricsData for each ticker
         """
-        from datetime import date as date_type
-
         if trading_date is None:
-            trading_date = date_type.today()
-
-        results: list[FetchResult[MetricsData]] = []
-        total_latency = 0.0
+            trading_date = date.today()
 
         if not tickers:
-            return BatchFetchResult(results=results, source="naver")
-
-        # Create session for all requests
-        connector = aiohttp.TCPConnector(limit=self.config.metrics_batch_size * 2)
-        timeout = aiohttp.ClientTimeout(total=self.config.naver_timeout)
-
-        async with aiohttp.ClientSession(
-            headers=self.DEFAULT_HEADERS,
-            connector=connector,
-            timeout=timeout,
-        ) as session:
-            # Process in batches
-            batch_size = self.config.metrics_batch_size
-            semaphore = asyncio.Semaphore(self.config.metrics_batch_size)
-
-            for i in range(0, len(tickers), batch_size):
-                batch = tickers[i : i + batch_size]
-                batch_start = time.monotonic()
-
-                with log_context(
-                    source="naver",
-                    phase="metrics",
-                    batch_index=i // batch_size,
-                    batch_size=len(batch),
-                ):
-                    # Fetch all tickers in batch concurrently
-                    tasks = [
-                        self._fetch_single_metrics(session, semaphore, ticker, trading_date)
-                        for ticker in batch
-                    ]
-
-                    batch_results = await asyncio.gather(*tasks, return_exceptions=True)
-
-                    # Process results
-                    for ticker, result in zip(batch, batch_results):
-                        if isinstance(result, Exception):
-                            results.append(
-                                FetchResult(
-                                    ticker=ticker,
-                                    error=classify_exception(result, source="naver"),
-                                    source="naver",
-                                )
-                            )
-                        else:
-                            results.append(result)
-
-                    batch_latency = (time.monotonic() - batch_start) * 1000
-                    total_latency += batch_latency
-
-                    # Log batch completion
-                    batch_succeeded = sum(
-                        1 for r in results[i:] if isinstance(r, FetchResult) and r.is_success
+            return BatchFetchResult(results=[], source="naver")
+
+        session = self._ensure_session()
+        results: list[FetchResult[MetricsData]] = [None] * len(tickers)  # type: ignore[list-item]
+        pending = iter(enumerate(tickers))
+
+        async def worker() -> None:
+            for i, ticker in pending:
+                try:
+                    results[i] = await self._fetch_single_metrics(
+                        session, ticker, trading_date
                     )
-                    logger.info(
-                        "Batch completed",
-                        extra={
-                            "success_count": batch_succeeded,
-                            "failed_count": len(batch) - batch_succeeded,
-                            "duration_ms": round(batch_latency, 2),
-                        },
+                except Exception as e:
+                    results[i] = FetchResult(
+                        ticker=ticker,
+                        error=classify_exception(e, source="naver"),
+                        source="naver",
                     )
 
+        # A fixed pool of workers pulls tickers as slots free up, so
+        # metrics_batch_size tickers stay in flight without waiting for the
+        # slowest ticker of a batch
+        workers = min(self.config.metrics_batch_size, len(tickers))
+        batch_start = time.monotonic()
+
+        with log_context(source="naver", phase="metrics", batch_size=len(tickers)):
+            await asyncio.gather(*(worker() for _ in range(workers)))
+
+            total_latency = (time.monotonic() - batch_start) * 1000
+            succeeded = sum(1 for r in results if r.is_success)
+            logger.info(
+                "Batch completed",
+                extra={
+                    "success_count": succeeded,
+                    "failed_count": len(tickers) - succeeded,
+                    "duration_ms": round(total_latency, 2),
+                },
+            )
+
         return BatchFetchResult(
             results=results,
             total_latency_ms=total_latency,
             source="naver",
         )
 
-    async def _fetch_single_metrics(
+    async def fetch_history(
         self,
-        session: aiohttp.ClientSession,
-        semaphore: asyncio.Semaphore,
-        ticker: str,
-        trading_date: date,
-    ) -> FetchResult[MetricsData]:
-        """Fetch metrics for a single ticker.
+        tickers: list[str],
+        days: int | None = None,
+    ) -> BatchFetchResult[HistoryData]:
+        """Fetch daily OHLCV history from Naver's chart API.
+
+        This is the endpoint FDR reads KRX history from, but the source's
+        pooled session serves every ticker instead of a new connection per
+        ``fdr.DataReader`` call.
 
         Args:
-            session: aiohttp session
-            semaphore: Concurrency limiter
-            ticker: KRX ticker code
-            trading_date: Date for the metrics
+            tickers: List of KRX ticker codes
+            days: Number of days of history (default: from config)
 
         Returns:
-            FetchResult containing MetricsData or error
+            BatchFetchResult containing HistoryData for each ticker
         """
+        if days is None:
+            days = self.config.history_days
+
+        if not tickers:
+            return BatchFetchResult(results=[], source="naver")
+
+        end_date = date.today()
+        start_date = end_date - timedelta(days=days)
+        params = {
+            "requestType": "1",
+            "startTime": start_date.strftime("%Y%m%d"),
+            "endTime": end_date.strftime("%Y%m%d"),
+            "timeframe": "day",
+        }
+
+        session = self._ensure_session()
+        semaphore = asyncio.Semaphore(self.config.naver_chart_concurrency)
+        batch_start = time.monotonic()
+
+        with log_context(source="naver", phase="history", batch_size=len(tickers)):
+            results = await asyncio.gather(
+                *(
+                    self._fetch_single_history(session, semaphore, ticker, params)
+                    for ticker in tickers
+                )
+            )
+
+            total_latency = (time.monotonic() - batch_start) * 1000
+            succeeded = sum(1 for r in results if r.is_success)
+            logger.info(
+                "Batch completed",
+                extra={
+                    "success_count": succeeded,
+                    "failed_count": len(tickers) - succeeded,
+                    "duration_ms": round(total_latency, 2),
+                },
+            )
+
+        return BatchFetchResult(
+            results=list(results),
+            total_latency_ms=total_latency,
+            source="naver",
+        )
+
+    async def _fetch_single_history(
+        self,
+        session: aiohttp.ClientSession,
+        semaphore: asyncio.Semaphore,
+        ticker: str,
+        params: dict[str, str],
+    ) -> FetchResult[HistoryData]:
+        """Fetch chart history for a single ticker."""
         fetch_start = time.monotonic()
 
         async with semaphore:
             try:
-                # Fetch fundamentals and market data concurrently
-                fundamentals, market_data = await asyncio.gather(
-                    self._fetch_fundamentals(session, ticker),
-                    self._fetch_market_data(session, ticker),
-                )
-
+                async with session.get(
+                    self.CHART_URL,
+                    params={"symbol": ticker, **params},
+                    timeout=aiohttp.ClientTimeout(total=self.config.naver_chart_timeout),
+                ) as resp:
+                    if resp.status != 200:
+                        return FetchResult(
+                            ticker=ticker,
+                            error=NetworkError(
+                                f"Naver chart HTTP {resp.status}", ticker=ticker
+                            ),
+                            latency_ms=(time.monotonic() - fetch_start) * 1000,
+                            source="naver",
+                        )
+                    text = await resp.text()
+
+                df = self._parse_chart(text)
                 latency = (time.monotonic() - fetch_start) * 1000
 
-                # Merge results
-                data: dict[str, Any] = {}
-                if fundamentals:
-                    data.update(fundamentals)
-                if market_data:
-                    data.update(market_data)
-
-                if not data:
+                if df is None:
                     return FetchResult(
                         ticker=ticker,
-                        error=DataNotFoundError(
-                            "No metrics data from Naver",
-                            ticker=ticker,
-                        ),
+                        error=DataNotFoundError("No history data", ticker=ticker),
                         latency_ms=latency,
                         source="naver",
                     )
 
-                # Convert to MetricsData
-                metrics = MetricsData(
-                    ticker=ticker,
-                    date=trading_date,
-                    pe_ratio=data.get("pe_ratio"),
-                    pb_ratio=data.get("pb_ratio"),
-                    eps=data.get("eps"),
-                    bps=data.get("book_value_per_share"),
-                    roe=data.get("roe"),
-                    roa=data.get("roa"),
-                    gross_margin=data.get("gross_margin"),
-                    net_margin=data.get("net_margin"),
-                    debt_equity=data.get("debt_equity"),
-                    current_ratio=data.get("current_ratio"),
-                    dividend_yield=data.get("dividend_yield"),
-                    market_cap=data.get("market_cap"),
-                )
-
                 return FetchResult(
                     ticker=ticker,
-                    data=metrics,
+                    data=HistoryData(ticker=ticker, data=df),
                     latency_ms=latency,
                     source="naver",
                 )
 
-            except asyncio.TimeoutError:
+            except TimeoutError:
                 latency = (time.monotonic() - fetch_start) * 1000
                 return FetchResult(
                     ticker=ticker,
-                    error=TimeoutError(
-                        f"Timeout after {self.config.naver_timeout}s",
-                        timeout=self.config.naver_timeout,
+                    error=PipelineTimeoutError(
+                        f"Timeout after {self.config.naver_chart_timeout}s",
+                        timeout=self.config.naver_chart_timeout,
                         ticker=ticker,
                     ),
                     latency_ms=latency,
@@ -252,6 +292,133 @@ class NaverSource:
                     source="naver",
                 )
 
+    def _parse_chart(self, text: str) -> pd.DataFrame | None:
+        """Parse a siseJson response into an OHLCV DataFrame.
+
+        The response is a JS array literal (single-quoted header row, then
+        one ``["YYYYMMDD", open, high, low, close, volume, ...]`` row per
+        day), so rows are read with a regex rather than a JSON parser.
+        """
+        rows = _CHART_ROW_RE.findall(text)
+        if not rows:
+            return None
+
+        dates, opens, highs, lows, closes, volumes = zip(*rows, strict=True)
+        df = pd.DataFrame(
+            {
+                "Open": np.asarray(opens, dtype=np.float64),
+                "High": np.asarray(highs, dtype=np.float64),
+                "Low": np.asarray(lows, dtype=np.float64),
+                "Close": np.asarray(closes, dtype=np.float64),
+                "Volume": np.asarray(volumes, dtype=np.int64),
+            },
+            index=pd.DatetimeIndex(
+                pd.to_datetime(dates, format="%Y%m%d"), name="Date"
+            ),
+        )
+        return downcast_ohlcv(df)
+
+    async def _fetch_single_metrics(
+        self,
+        session: aiohttp.ClientSession,
+        ticker: str,
+        trading_date: date,
+    ) -> FetchResult[MetricsData]:
+        """Fetch metrics for a single ticker.
+
+        Args:
+            session: aiohttp session
+            ticker: KRX ticker code
+            trading_date: Date for the metrics
+
+        Returns:
+            FetchResult containing MetricsData or error
+        """
+        fetch_start = time.monotonic()
+
+        try:
+            # Fetch fundamentals and market data concurrently
+            fundamentals, market_data = await asyncio.gather(
+                self._fetch_fundamentals(session, ticker),
+                self._fetch_market_data(session, ticker),
+            )
+
+            latency = (time.monotonic() - fetch_start) * 1000
+
+            # Merge results
+            data: dict[str, Any] = {}
+            if fundamentals:
+                data.update(fundamentals)
+            if market_data:
+                data.update(market_data)
+
+            if not data:
+                return FetchResult(
+                    ticker=ticker,
+                    error=DataNotFoundError(
+                        "No metrics data from Naver",
+                        ticker=ticker,
+                    ),
+                    latency_ms=latency,
+                    source="naver",
+                )
+
+            # Convert to MetricsData
+            metrics = MetricsData(
+                ticker=ticker,
+                date=trading_date,
+                pe_ratio=data.get("pe_ratio"),
+                pb_ratio=data.get("pb_ratio"),
+                eps=data.get("eps"),
+                bps=data.get("book_value_per_share"),
+                roe=data.get("roe"),
+                roa=data.get("roa"),
+                gross_margin=data.get("gross_margin"),
+                net_margin=data.get("net_margin"),
+                debt_equity=data.get("debt_equity"),
+                current_ratio=data.get("current_ratio"),
+                dividend_yield=data.get("dividend_yield"),
+                market_cap=data.get("market_cap"),
+            )
+
+            return FetchResult(
+                ticker=ticker,
+                data=metrics,
+                latency_ms=latency,
+                source="naver",
+            )
+
+        except TimeoutError:
+            latency = (time.monotonic() - fetch_start) * 1000
+            return FetchResult(
+                ticker=ticker,
+                error=PipelineTimeoutError(
+                    f"Timeout after {self.config.naver_timeout}s",
+                    timeout=self.config.naver_timeout,
+                    ticker=ticker,
+                ),
+                latency_ms=latency,
+                source="naver",
+            )
+
+        except aiohttp.ClientError as e:
+            latency = (time.monotonic() - fetch_start) * 1000
+            return FetchResult(
+                ticker=ticker,
+                error=NetworkError(str(e), ticker=ticker),
+                latency_ms=latency,
+                source="naver",
+            )
+
+        except Exception as e:
+            latency = (time.monotonic() - fetch_start) * 1000
+            return FetchResult(
+                ticker=ticker,
+                error=classify_exception(e, source="naver"),
+                latency_ms=latency,
+                source="naver",
+            )
+
     async def _fetch_fundamentals(
         self,
         session: aiohttp.ClientSession,
@@ -306,42 +473,23 @@ class NaverSource:
 
     def _parse_fundamentals(self, html: str) -> dict[str, float | None]:
         """Parse PER, EPS, PBR, BPS from main page HTML."""
-        soup = BeautifulSoup(html, "html.parser")
         data: dict[str, float | None] = {}
 
-        # Extract PER from em#_per
-        per_em = soup.find("em", id="_per")
-        if per_em:
-            with contextlib.suppress(ValueError, TypeError):
-                text = per_em.get_text().replace(",", "").strip()
-                if text and text != "-":
-                    data["pe_ratio"] = float(text)
-
-        # Extract EPS from em#_eps
-        eps_em = soup.find("em", id="_eps")
-        if eps_em:
-            with contextlib.suppress(ValueError, TypeError):
-                text = eps_em.get_text().replace(",", "").strip()
-                if text and text != "-":
-                    data["eps"] = float(text)
-
-        # Extract PBR from em#_pbr
-        pbr_em = soup.find("em", id="_pbr")
-        if pbr_em:
-            with contextlib.suppress(ValueError, TypeError):
-                text = pbr_em.get_text().replace(",", "").strip()
-                if text and text != "-":
-                    data["pb_ratio"] = float(text)
+        # Extract PER, EPS, PBR from em#_per, em#_eps, em#_pbr
+        for key, pattern in _MAIN_EM_PATTERNS:
+            em_match = pattern.search(html)
+            if em_match:
+                with contextlib.suppress(ValueError, TypeError):
+                    text = unescape(em_match.group(1)).replace(",", "").strip()
+                    if text and text != "-":
+                        data[key] = float(text)
 
         # Extract BPS from per_table
-        per_table = soup.find("table", class_="per_table")
-        if per_table:
-            table_text = per_table.get_text()
-            bps_match = re.search(
-                r"PBR.*?l\s*BPS.*?([\d,.]+)배.*?l\s*([\d,]+)원",
-                table_text,
-                re.DOTALL,
-            )
+        table_match = _PER_TABLE_RE.search(html)
+        if table_match:
+            table_text = unescape(_TAG_RE.sub("", table_match.group(1)))
+            # Pattern: "PBR ... l BPS ... 배 l N원"
+            bps_match = _BPS_RE.search(table_text)
             if bps_match:
                 with contextlib.suppress(ValueError, TypeError):
                     data["book_value_per_share"] = float(
@@ -383,7 +531,7 @@ class NaverSource:
             """Get the most recent non-empty value from a row."""
             values = row_data.get(row_name, [])
             for val in values:
-                if val and val not in ["-", "", "IFRS연결", "IFRS별도"]:
+                if val and val not in {"-", "", "IFRS연결", "IFRS별도"}:
                     try:
                         return float(val.replace(",", ""))
                     except ValueError:
@@ -440,23 +588,46 @@ class NaverSource:
         text = soup.get_text()
 
         # 시가총액 (Market Cap)
-        market_cap_match = re.search(
-            r"시가총액[^\d]*([\d,]+)\s*억",
-            text,
-        )
+        market_cap_match = _MARKET_CAP_RE.search(text)
         if market_cap_match:
             with contextlib.suppress(ValueError):
                 cap_in_billion = int(market_cap_match.group(1).replace(",", ""))
                 data["market_cap"] = cap_in_billion * 100_000_000
 
         # 배당수익률 (Dividend Yield) - may override fundamentals
-        div_match = re.search(r"배당수익률[^\d]*([\d.]+)\s*%", text)
+        div_match = _DIVIDEND_YIELD_RE.search(text)
         if div_match:
             with contextlib.suppress(ValueError):
                 data["dividend_yield"] = float(div_match.group(1)) / 100
 
         return data
 
+    def _ensure_session(self) -> aiohttp.ClientSession:
+        """Get the shared aiohttp session, creating it on first use.
+
+        History and metrics (including the KIS fallback) reuse one
+        keep-alive pool instead of reconnecting for every call. The session
+        timeout is for page scrapes; chart requests set their own.
+        """
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=(
+                    self.config.naver_chart_concurrency
+                    + self.config.metrics_batch_size * 2
+                ),
+                ttl_dns_cache=300,
+                keepalive_timeout=60,
+                enable_cleanup_closed=True,
+            )
+            self._session = aiohttp.ClientSession(
+                headers=self.DEFAULT_HEADERS,
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.config.naver_timeout),
+            )
+        return self._session
+
     async def close(self) -> None:
-        """No persistent resources to clean up."""
-        pass
+        """Clean up resources."""
+        if self._session and not self._session.closed:
+            await self._session.close()
+            self._session = None
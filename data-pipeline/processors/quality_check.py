@@ -146,13 +146,16 @@ class DataQualityChecker:
         Returns:
             QualityReport with assessment results
         """
+        market_key = market.upper()
+        is_kr = market_key == "KR"
+
         # Get universe
-        universe = self.get_universe(market)
+        universe = self.get_universe(market_key)
         universe_set = set(universe)
         collected_set = set(collected_tickers)
 
         # For KR, also check without suffix
-        if market.upper() == "KR":
+        if is_kr:
             normalized_collected = set()
             for t in collected_tickers:
                 normalized_collected.add(t)
@@ -162,42 +165,38 @@ class DataQualityChecker:
             collected_set = normalized_collected
 
         # Find missing tickers
-        missing_tickers = []
-        for t in universe:
-            base = (
-                t.replace(".KS", "").replace(".KQ", "") if market.upper() == "KR" else t
-            )
-            if t not in collected_set and base not in collected_set:
-                missing_tickers.append(t)
+        if is_kr:
+            missing_tickers = [
+                t
+                for t in universe
+                if t not in collected_set
+                and t.replace(".KS", "").replace(".KQ", "") not in collected_set
+            ]
+        else:
+            missing_tickers = [t for t in universe if t not in collected_set]
 
         # Find missing major tickers
-        major_tickers = US_MAJOR_TICKERS if market.upper() == "US" else KR_MAJOR_TICKERS
-        missing_major = []
-        for t in major_tickers:
-            # For KR, major tickers are codes without suffix
-            if market.upper() == "KR":
-                found = any(t in ct for ct in collected_set)
-            else:
-                # For US, check exact match only (tickers are already normalized)
-                found = t in collected_set
-            if not found:
-                missing_major.append(t)
-
-        # Calculate metric coverage
+        if is_kr:
+            # KR major tickers are codes without suffix
+            missing_major = [
+                t for t in KR_MAJOR_TICKERS if not any(t in ct for ct in collected_set)
+            ]
+        else:
+            # For US, check exact match only (tickers are already normalized)
+            missing_major = [t for t in US_MAJOR_TICKERS if t not in collected_set]
+
+        # Calculate metric coverage (non-null share of every key metric at once)
         metric_coverage = {}
         if metrics_df is not None and len(metrics_df) > 0:
-            for metric in KEY_METRICS:
-                if metric in metrics_df.columns:
-                    non_null = metrics_df[metric].notna().sum()
-                    coverage = non_null / len(metrics_df)
-                    metric_coverage[metric] = coverage
+            present = [m for m in KEY_METRICS if m in metrics_df.columns]
+            metric_coverage = metrics_df[present].notna().mean().to_dict()
 
         # Determine if passed
         coverage_rate = len(collected_set) / len(universe_set) if universe_set else 0
         passed = coverage_rate >= MIN_COVERAGE_THRESHOLD and len(missing_major) == 0
 
         return QualityReport(
-            market=market.upper(),
+            market=market_key,
             universe_count=len(universe_set),
             collected_count=len(collected_set),
             missing_count=len(missing_tickers),
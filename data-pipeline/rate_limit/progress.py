@@ -1,6 +1,7 @@
 """Progress tracking for resume functionality."""
 
 import logging
+import time
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TextIO
@@ -27,8 +28,10 @@ class ProgressTracker:
 
     market: str
     data_dir: Path
+    min_save_interval: float = 30.0  # Seconds between non-flush saves
     _completed: set[str] = field(default_factory=set, init=False, repr=False)
     _failed: set[str] = field(default_factory=set, init=False, repr=False)
+    _last_save: float | None = field(default=None, init=False, repr=False)
 
     def __post_init__(self) -> None:
         """Load existing progress from file."""
@@ -91,7 +94,7 @@ class ProgressTracker:
         """Mark multiple tickers as completed."""
         self._completed.update(tickers)
         # Remove from failed if they were there (recovery)
-        self._failed -= set(tickers)
+        self._failed.difference_update(tickers)
 
     def mark_failed(self, ticker: str) -> None:
         """Mark a ticker as permanently failed (will not retry on resume)."""
@@ -118,14 +121,29 @@ class ProgressTracker:
         Returns:
             List of tickers not in completed or failed sets (preserving order)
         """
-        skip = self._completed | self._failed
-        return [t for t in all_tickers if t not in skip]
+        completed, failed = self._completed, self._failed
+        return [t for t in all_tickers if t not in completed and t not in failed]
 
-    def save(self) -> None:
+    def save(self, flush: bool = False) -> None:
         """Save progress to file atomically.
 
-        Uses write-to-temp-then-rename pattern for atomic writes.
+        Uses write-to-temp-then-rename pattern for atomic writes. Saves are
+        throttled to one per ``min_save_interval`` so that calling this on
+        every batch (or error) doesn't rewrite the file each time; pass
+        ``flush=True`` for the final save of a run.
+
+        Args:
+            flush: Write even if the last save was within the interval
         """
+        now = time.monotonic()
+        if (
+            not flush
+            and self._last_save is not None
+            and now - self._last_save < self.min_save_interval
+        ):
+            return
+        self._last_save = now
+
         self.data_dir.mkdir(parents=True, exist_ok=True)
         tmp_file = self.progress_file.with_suffix(".tmp")
 
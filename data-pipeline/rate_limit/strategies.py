@@ -3,11 +3,14 @@
 import asyncio
 import logging
 import random
+import re
 import time
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Awaitable, Callable, Protocol, TypeVar
 
+from core.errors import is_rate_limit_error
+
 from .backoff import BackoffPolicy, ExponentialBackoff, NoBackoff
 
 logger = logging.getLogger(__name__)
@@ -25,63 +28,39 @@ class FailureType(Enum):
     OTHER = "other"  # Unknown error - don't retry
 
 
+# Message indicators, compiled once (case-insensitive). Quota messages count
+# as rate limits here on top of core.errors.is_rate_limit_error
+_QUOTA_PATTERN = re.compile(r"exceeded|quota", re.IGNORECASE)
+_TIMEOUT_PATTERN = re.compile(r"timeout|timed out|deadline", re.IGNORECASE)
+_NO_DATA_PATTERN = re.compile(
+    r"no data|not found|404|delisted|no price data|empty|no timezone found",
+    re.IGNORECASE,
+)
+_AUTH_PATTERN = re.compile(
+    r"unauthorized|401|403|forbidden|invalid key|authentication", re.IGNORECASE
+)
+
+
 def classify_failure(error: Exception) -> FailureType:
     """Classify an exception into a FailureType.
 
     This is the central place for error classification logic.
     All collectors should use this for consistent error handling.
     """
-    error_str = str(error).lower()
-    error_type = type(error).__name__.lower()
-
-    # Rate limit indicators
-    rate_limit_indicators = [
-        "rate limit",
-        "too many requests",
-        "429",
-        "throttl",
-        "exceeded",
-        "quota",
-    ]
-    if any(indicator in error_str for indicator in rate_limit_indicators):
+    error_str = str(error)
+
+    if is_rate_limit_error(error) or _QUOTA_PATTERN.search(error_str):
         return FailureType.RATE_LIMIT
 
-    # Timeout indicators
-    timeout_indicators = [
-        "timeout",
-        "timed out",
-        "read timeout",
-        "connect timeout",
-        "deadline",
-    ]
-    if any(indicator in error_str for indicator in timeout_indicators):
+    if _TIMEOUT_PATTERN.search(error_str):
         return FailureType.TIMEOUT
-    if "timeout" in error_type:
+    if "timeout" in type(error).__name__.lower():
         return FailureType.TIMEOUT
 
-    # No data indicators
-    no_data_indicators = [
-        "no data",
-        "not found",
-        "404",
-        "delisted",
-        "no price data",
-        "empty",
-        "no timezone found",
-    ]
-    if any(indicator in error_str for indicator in no_data_indicators):
+    if _NO_DATA_PATTERN.search(error_str):
         return FailureType.NO_DATA
 
-    # Auth error indicators
-    auth_indicators = [
-        "unauthorized",
-        "401",
-        "403",
-        "forbidden",
-        "invalid key",
-        "authentication",
-    ]
-    if any(indicator in error_str for indicator in auth_indicators):
+    if _AUTH_PATTERN.search(error_str):
         return FailureType.AUTH_ERROR
 
     return FailureType.OTHER
@@ -125,7 +104,7 @@ class BatchResult:
         """Merge another BatchResult into this one."""
         return BatchResult(
             succeeded=self.succeeded + other.succeeded,
-            failed={**self.failed, **other.failed},
+            failed=self.failed | other.failed,
         )
 
 
@@ -55,8 +55,8 @@ class FetchResult:
     def merge(self, other: "FetchResult") -> "FetchResult":
         """Merge another FetchResult into this one."""
         return FetchResult(
-            succeeded={**self.succeeded, **other.succeeded},
-            failed={**self.failed, **other.failed},
+            succeeded=self.succeeded | other.succeeded,
+            failed=self.failed | other.failed,
         )
 
 
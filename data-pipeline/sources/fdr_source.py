@@ -2,13 +2,14 @@
 
 import asyncio
 import logging
-from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import date, timedelta
 from typing import Any
 
 import pandas as pd
 
+from common.utils import downcast_ohlcv
 from config import get_settings
 from config.constants import FDR_REQUEST_TIMEOUT, DEFAULT_HISTORY_DAYS
 
@@ -88,10 +89,13 @@ class FDRSource(BaseDataSource):
                 )
                 futures[ticker] = future
 
-            # Collect results
+            # Collect results without blocking the event loop, so other
+            # phases (e.g. metrics) can make progress meanwhile
             for ticker, future in futures.items():
                 try:
-                    df = future.result(timeout=self.timeout)
+                    df = await asyncio.wait_for(
+                        asyncio.wrap_future(future), timeout=self.timeout
+                    )
                     if df is not None and not df.empty:
                         # Extract latest price data
                         price_data = self._extract_latest_price(df)
@@ -102,7 +106,7 @@ class FDRSource(BaseDataSource):
                         )
                     else:
                         result.failed[ticker] = "No data"
-                except FuturesTimeoutError:
+                except TimeoutError:
                     result.failed[ticker] = "Timeout"
                     logger.warning(f"Timeout fetching {ticker}")
                 except Exception as e:
@@ -150,7 +154,7 @@ class FDRSource(BaseDataSource):
             if not all(col in df.columns for col in required):
                 return None
 
-            return df
+            return downcast_ohlcv(df)
 
         except Exception as e:
             logger.debug(f"FDR fetch failed for {ticker}: {e}")
@@ -206,13 +210,16 @@ class FDRSource(BaseDataSource):
 
         for code in index_codes:
             try:
-                df = await asyncio.get_event_loop().run_in_executor(
-                    self._executor,
-                    lambda c=code: fdr.DataReader(
-                        c,
-                        start_date.isoformat(),
-                        end_date.isoformat(),
+                df = await asyncio.wait_for(
+                    asyncio.get_running_loop().run_in_executor(
+                        self._executor,
+                        lambda c=code: fdr.DataReader(
+                            c,
+                            start_date.isoformat(),
+                            end_date.isoformat(),
+                        ),
                     ),
+                    timeout=self.timeout,
                 )
 
                 if df is not None and not df.empty:
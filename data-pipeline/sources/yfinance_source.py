@@ -3,13 +3,15 @@
 import asyncio
 import logging
 import random
+from collections.abc import Callable
 from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import date
-from typing import Any
+from typing import Any, TypeVar
 
 import pandas as pd
 import yfinance as yf
+from core.errors import is_rate_limit_error
 from rate_limit import (
     FailureType,
     classify_failure,
@@ -19,6 +21,8 @@ from .base import BaseDataSource, FetchResult, ProgressCallback, TickerData
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 # Timeout settings
 DOWNLOAD_TIMEOUT = 120  # yf.download() timeout in seconds
 INFO_TIMEOUT = 30  # yf.Ticker().info timeout in seconds
@@ -84,11 +88,9 @@ class YFinanceSource(BaseDataSource):
         self._consecutive_rate_limits = 0
         self._rate_limit_wait = RATE_LIMIT_INITIAL_WAIT
 
-    def _is_rate_limit_error(self, error: Exception | str) -> bool:
+    def _is_rate_limit_error(self, error: Exception) -> bool:
         """Check if error indicates rate limiting."""
-        error_str = str(error).lower()
-        rate_limit_indicators = ["429", "rate limit", "too many requests", "throttl"]
-        return any(indicator in error_str for indicator in rate_limit_indicators)
+        return is_rate_limit_error(error)
 
     async def fetch_prices(
         self,
@@ -297,41 +299,65 @@ class YFinanceSource(BaseDataSource):
         for i in range(0, len(tickers), self.batch_size):
             batch = tickers[i : i + self.batch_size]
 
-            for ticker in batch:
-                try:
-                    metrics = await self._fetch_single_metrics(ticker)
-                    if metrics:
-                        result.succeeded[ticker] = TickerData(
-                            ticker=ticker,
-                            metrics=metrics,
-                        )
-                    else:
-                        result.failed[ticker] = "No metrics data"
-                except Exception as e:
-                    failure_type = classify_failure(e)
-                    result.failed[ticker] = str(e)
+            # Fetch the batch concurrently (bounded by the executor's
+            # max_workers threads), then handle outcomes in ticker order
+            outcomes = await asyncio.gather(
+                *(self._fetch_single_metrics(ticker) for ticker in batch),
+                return_exceptions=True,
+            )
+
+            # Every outcome is recorded before deciding to back off or stop,
+            # so results already fetched for the batch are kept
+            backoff = False
+            stop_after: int | None = None
+            for k, (ticker, outcome) in enumerate(zip(batch, outcomes, strict=True)):
+                if isinstance(outcome, Exception):
+                    failure_type = classify_failure(outcome)
+                    result.failed[ticker] = str(outcome)
 
                     if failure_type == FailureType.RATE_LIMIT:
                         logger.warning(f"Rate limit hit at {ticker}")
+                        backoff = True
 
                         # Check if we should retry or give up
-                        if self._consecutive_rate_limits >= max_rate_limit_retries:
-                            logger.error(
-                                f"Max rate limit retries ({max_rate_limit_retries}) exceeded. "
-                                f"Stopping metrics collection."
-                            )
-                            # Mark remaining tickers as rate limited
-                            remaining = tickers[tickers.index(ticker) + 1:]
-                            for remaining_ticker in remaining:
-                                result.failed[remaining_ticker] = "Rate limit - collection stopped"
-                            return result
-
-                        # Apply backoff and continue
-                        await self._handle_rate_limit()
+                        if (
+                            stop_after is None
+                            and self._consecutive_rate_limits >= max_rate_limit_retries
+                        ):
+                            stop_after = k
 
                     elif failure_type == FailureType.TIMEOUT:
                         logger.warning(f"Timeout at {ticker}, applying backoff")
-                        await self._handle_rate_limit()
+                        backoff = True
+
+                elif isinstance(outcome, BaseException):
+                    raise outcome  # Cancellation
+                elif outcome:
+                    result.succeeded[ticker] = TickerData(
+                        ticker=ticker,
+                        metrics=outcome,
+                    )
+                    # Reset rate limit state on successful fetch
+                    self._reset_rate_limit_state()
+                else:
+                    result.failed[ticker] = "No metrics data"
+
+            if stop_after is not None:
+                logger.error(
+                    f"Max rate limit retries ({max_rate_limit_retries}) exceeded. "
+                    f"Stopping metrics collection."
+                )
+                # Mark the rest of the batch (unless it succeeded) and the
+                # remaining tickers as rate limited
+                remaining = batch[stop_after + 1 :] + tickers[i + len(batch) :]
+                for remaining_ticker in remaining:
+                    if remaining_ticker not in result.succeeded:
+                        result.failed[remaining_ticker] = "Rate limit - collection stopped"
+                return result
+
+            # Back off once per batch, however many tickers hit the limit
+            if backoff:
+                await self._handle_rate_limit()
 
             total_processed += len(batch)
             if on_progress:
@@ -347,19 +373,11 @@ class YFinanceSource(BaseDataSource):
         """Fetch metrics for a single ticker with timeout."""
         try:
             stock = yf.Ticker(ticker, session=self._session)
-            info = await asyncio.wait_for(
-                asyncio.get_event_loop().run_in_executor(
-                    self._executor,
-                    lambda: stock.info,
-                ),
-                timeout=INFO_TIMEOUT,
-            )
+            info = await self._run_in_executor(lambda: stock.info, INFO_TIMEOUT)
 
             if not info or info.get("regularMarketPrice") is None:
                 return None
 
-            # Reset rate limit state on successful fetch
-            self._reset_rate_limit_state()
             return self._extract_metrics(info)
 
         except TimeoutError as e:
@@ -370,6 +388,27 @@ class YFinanceSource(BaseDataSource):
             logger.debug(f"Failed to fetch metrics for {ticker}: {e}")
             raise
 
+    async def _run_in_executor(self, func: Callable[[], T], time_limit: float) -> T:
+        """Run ``func`` on the executor, timing out after ``time_limit`` seconds.
+
+        The clock starts when a worker thread picks the call up, so calls
+        queued behind busy workers don't time out while waiting.
+        """
+        loop = asyncio.get_running_loop()
+        started = asyncio.Event()
+
+        def call() -> T:
+            loop.call_soon_threadsafe(started.set)
+            return func()
+
+        future = loop.run_in_executor(self._executor, call)
+        try:
+            await started.wait()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        return await asyncio.wait_for(future, timeout=time_limit)
+
     def _extract_trading_date(self, df: pd.DataFrame) -> str:
         """Extract trading date from download DataFrame."""
         if df.empty:
@@ -448,8 +487,9 @@ class YFinanceSource(BaseDataSource):
     def _extract_metrics(self, info: dict) -> dict:
         """Extract metrics from yfinance info dict."""
         def safe_get(key: str, default=None):
+            # NaN is the only float that is not equal to itself
             val = info.get(key)
-            if val is None or (isinstance(val, float) and pd.isna(val)):
+            if val is None or (isinstance(val, float) and val != val):
                 return default
             return val
 
@@ -88,6 +88,49 @@ class Storage(Protocol):
         """
         ...
 
+    def save_all(
+        self,
+        companies: list[dict],
+        metrics: list[dict],
+        prices: list[dict],
+        market: str,
+    ) -> SaveResult:
+        """Save company, metrics and price records in one call.
+
+        Companies are saved first, since metrics and prices may reference
+        them (e.g., via company_id).
+
+        Args:
+            companies: Company records (see save_companies)
+            metrics: Metrics records (see save_metrics)
+            prices: Price records (see save_prices)
+            market: Market identifier ('US' or 'KR')
+
+        Returns:
+            SaveResult merged across all three record types
+        """
+        ...
+
+    def set_trading_date(self, market: str, trading_date: str) -> None:
+        """Set the trading date that the following saves belong to.
+
+        Called before saving. Backends that don't organize data by date
+        ignore it.
+
+        Args:
+            market: Market identifier ('US' or 'KR')
+            trading_date: Trading date in YYYY-MM-DD format
+        """
+        ...
+
+    def finalize(self, market: str | None = None) -> None:
+        """Finish a collection run (e.g., publish the new CSV version).
+
+        Args:
+            market: Market to finalize, or None for all saved markets
+        """
+        ...
+
     def load_completed_tickers(self, market: str) -> set[str]:
         """Load tickers that have already been collected.
 
@@ -137,6 +180,28 @@ class BaseStorage:
     def save_prices(self, records: list[dict], market: str) -> SaveResult:
         raise NotImplementedError("Subclass must implement save_prices")
 
+    def save_all(
+        self,
+        companies: list[dict],
+        metrics: list[dict],
+        prices: list[dict],
+        market: str,
+    ) -> SaveResult:
+        """Save companies, then metrics, then prices, and merge the results.
+
+        Backends that can write the three record types together should
+        override this.
+        """
+        result = self.save_companies(companies, market)
+        result = result.merge(self.save_metrics(metrics, market))
+        return result.merge(self.save_prices(prices, market))
+
+    def set_trading_date(self, market: str, trading_date: str) -> None:
+        """No-op by default; override for date-organized backends."""
+
+    def finalize(self, market: str | None = None) -> None:
+        """No-op by default; override if a run needs a final step."""
+
     def load_completed_tickers(self, market: str) -> set[str]:
         raise NotImplementedError("Subclass must implement load_completed_tickers")
 
@@ -1,6 +1,7 @@
 """Supabase storage backend."""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -25,6 +26,10 @@ class SupabaseStorage(BaseStorage):
     _company_id_cache: dict[str, dict[str, str]] = field(
         default_factory=dict, init=False, repr=False
     )
+    # ticker -> id returned by save_companies upserts, per market
+    _upserted_company_ids: dict[str, dict[str, str]] = field(
+        default_factory=dict, init=False, repr=False
+    )
 
     def __post_init__(self) -> None:
         super().__init__("supabase")
@@ -53,14 +58,24 @@ class SupabaseStorage(BaseStorage):
                     "industry": record.get("industry"),
                 })
 
-            # Batch upsert
-            result = (
-                self.client.table("companies")
-                .upsert(upsert_records, on_conflict="ticker,market")
-                .execute()
-            )
+            # Batch upsert in chunks; the upsert returns the stored rows, so
+            # their ids are kept to resolve company_id without a re-query
+            saved = 0
+            chunk_size = 1000
+            upserted_ids = self._upserted_company_ids.setdefault(market.upper(), {})
+            for i in range(0, len(upsert_records), chunk_size):
+                chunk = upsert_records[i : i + chunk_size]
+                result = (
+                    self.client.table("companies")
+                    .upsert(chunk, on_conflict="ticker,market")
+                    .execute()
+                )
+                rows = result.data or []
+                saved += len(rows)
+                for row in rows:
+                    if "id" in row:
+                        upserted_ids[row["ticker"]] = row["id"]
 
-            saved = len(result.data) if result.data else 0
             logger.info(f"Upserted {saved} companies to Supabase")
             return SaveResult(saved=saved)
 
@@ -75,7 +90,7 @@ class SupabaseStorage(BaseStorage):
 
         try:
             # Get company_id mapping
-            company_ids = self.get_company_id_mapping(market)
+            company_ids = self._resolve_company_ids(records, market)
 
             # Prepare records with company_id
             upsert_records = []
@@ -126,7 +141,7 @@ class SupabaseStorage(BaseStorage):
 
         try:
             # Get company_id mapping
-            company_ids = self.get_company_id_mapping(market)
+            company_ids = self._resolve_company_ids(records, market)
 
             # Prepare records with company_id
             upsert_records = []
@@ -175,6 +190,24 @@ class SupabaseStorage(BaseStorage):
             logger.error(f"Failed to save prices to Supabase: {e}")
             return SaveResult(saved=0, errors=[str(e)])
 
+    def save_all(
+        self,
+        companies: list[dict],
+        metrics: list[dict],
+        prices: list[dict],
+        market: str,
+    ) -> SaveResult:
+        """Save companies first, then metrics and prices concurrently.
+
+        Metrics and prices only depend on the company ids from the companies
+        upsert, so their round trips can overlap.
+        """
+        result = self.save_companies(companies, market)
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            metrics_future = pool.submit(self.save_metrics, metrics, market)
+            prices_result = self.save_prices(prices, market)
+        return result.merge(metrics_future.result()).merge(prices_result)
+
     def load_completed_tickers(self, market: str) -> set[str]:
         """Load tickers that have metrics saved (for resume).
 
@@ -184,6 +217,17 @@ class SupabaseStorage(BaseStorage):
         # Resume tracking should use ProgressTracker with file-based storage
         return set()
 
+    def _resolve_company_ids(self, records: list[dict], market: str) -> dict[str, str]:
+        """Get company ids for records, preferring ids from save_companies.
+
+        Falls back to the full (paginated) mapping only when some ticker was
+        not part of a companies upsert in this session.
+        """
+        upserted = self._upserted_company_ids.get(market.upper(), {})
+        if upserted and all(str(r["ticker"]) in upserted for r in records):
+            return upserted
+        return self.get_company_id_mapping(market)
+
     def get_company_id_mapping(self, market: str) -> dict[str, str]:
         """Get mapping of ticker to company_id for a market."""
         cache_key = market.upper()
@@ -292,6 +336,20 @@ class CompositeStorage(BaseStorage):
             result = result.merge(storage_result)
         return result
 
+    def save_all(
+        self,
+        companies: list[dict],
+        metrics: list[dict],
+        prices: list[dict],
+        market: str,
+    ) -> SaveResult:
+        """Save to all backends with one save_all each, return merged result."""
+        result = SaveResult()
+        for storage in self.storages:
+            storage_result = storage.save_all(companies, metrics, prices, market)
+            result = result.merge(storage_result)
+        return result
+
     def load_completed_tickers(self, market: str) -> set[str]:
         """Load from first storage that returns results."""
         for storage in self.storages:
@@ -309,13 +367,11 @@ class CompositeStorage(BaseStorage):
         return {}
 
     def finalize(self, market: str | None = None) -> None:
-        """Delegate finalize to all storages that support it."""
+        """Delegate finalize to all storages."""
         for storage in self.storages:
-            if hasattr(storage, "finalize"):
-                getattr(storage, "finalize")(market)  # noqa: B009
+            storage.finalize(market)
 
-    def set_trading_date(self, market: str, date_str: str) -> None:
-        """Delegate set_trading_date to all storages that support it."""
+    def set_trading_date(self, market: str, trading_date: str) -> None:
+        """Delegate set_trading_date to all storages."""
         for storage in self.storages:
-            if hasattr(storage, "set_trading_date"):
-                getattr(storage, "set_trading_date")(market, date_str)  # noqa: B009
+            storage.set_trading_date(market, trading_date)
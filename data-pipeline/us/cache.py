@@ -0,0 +1,58 @@
+"""Persistent metrics cache.
+
+yf.Ticker().info is the most rate-limited call in the US pipeline, and a
+ticker's fundamentals rarely change within a day. Successful results are
+kept in a JSON file so a re-run within the TTL skips the network call:
+- Entries are keyed by ticker with the time they were fetched
+- Expired entries are ignored (and dropped on the next save)
+- A TTL of 0 disables the cache
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import date
+from typing import Any
+
+from common.ttl_cache import TTLFileCache
+from core.types import MetricsData
+
+
+@dataclass
+class MetricsCache(TTLFileCache[dict[str, Any]]):
+    """TTL'd on-disk cache of MetricsData keyed by ticker.
+
+    Entries are stored as ``MetricsData.to_dict()`` in a JSON file.
+
+    Usage:
+        cache = MetricsCache(path=Path("data/us_metrics_cache.json"), ttl=43200)
+
+        data = cache.get_metrics("AAPL")
+        if data is None:
+            data = fetch_metrics("AAPL")
+            cache.put_metrics(data)
+        cache.save()
+    """
+
+    ttl: float = 43200.0  # Seconds (12 hours)
+    name: str = "metrics cache"
+
+    def get_metrics(self, ticker: str) -> MetricsData | None:
+        """Get cached metrics for a ticker, or None if missing or expired."""
+        entry = self.get(ticker)
+        if entry is None:
+            return None
+
+        data = dict(entry)
+        data["date"] = date.fromisoformat(data["date"])
+        return MetricsData(**data)
+
+    def put_metrics(self, data: MetricsData) -> None:
+        """Cache metrics for a ticker."""
+        self.put(data.ticker, data.to_dict())
+
+    def put_all_metrics(self, items: Iterable[MetricsData]) -> None:
+        """Cache metrics for several tickers."""
+        for data in items:
+            self.put_metrics(data)
@@ -76,6 +76,13 @@ class USConfig:
         default_factory=lambda: Path("data/companies/us_companies.csv")
     )
     progress_file: Path = field(default_factory=lambda: Path("data/us_progress.txt"))
+    metrics_cache_file: Path = field(
+        default_factory=lambda: Path("data/us_metrics_cache.json")
+    )
+
+    # === Metrics cache ===
+    # Seconds a cached yf.Ticker().info result stays valid (0 disables)
+    metrics_cache_ttl: float = 43200.0
 
     # === History ===
     history_days: int = 300  # ~10 months for technical indicators
@@ -100,3 +107,4 @@ class USConfig:
         object.__setattr__(self, "data_dir", Path(self.data_dir))
         object.__setattr__(self, "tickers_file", Path(self.tickers_file))
         object.__setattr__(self, "progress_file", Path(self.progress_file))
+        object.__setattr__(self, "metrics_cache_file", Path(self.metrics_cache_file))
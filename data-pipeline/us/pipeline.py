@@ -21,15 +21,16 @@ from typing import Any
 import pandas as pd
 
 from common.indicators import (
-    calculate_all_technicals,
-    calculate_beta,
+    calculate_beta_batch,
     calculate_graham_number,
+    calculate_technicals_batch,
 )
 from core.errors import CircuitOpenError, RateLimitError
 from core.types import (
     BatchFetchResult,
     CollectionPhase,
     CollectionResult,
+    FetchResult,
     HistoryData,
     Market,
     MetricsData,
@@ -39,6 +40,7 @@ from core.types import (
 from observability.logger import get_logger, log_context
 from observability.metrics import MetricsCollector
 
+from .cache import MetricsCache
 from .config import USConfig
 from .resilience import CircuitBreaker, RateLimiter, RetryExecutor
 from .sources import YFinanceSource
@@ -127,6 +129,7 @@ class USPipeline:
         )
 
         merged_data: list[dict[str, Any]] = []
+        technicals_task: asyncio.Future[dict[str, TechnicalIndicators]] | None = None
 
         # Resume support
         if resume:
@@ -177,6 +180,14 @@ class USPipeline:
                     logger.info("Fetching S&P 500 index for Beta calculation")
                     sp500_history = await self.yfinance.fetch_index_history("^GSPC")
 
+                    # Technicals only need history, so calculate them in a worker
+                    # thread while the network-bound metrics phase runs
+                    technicals_task = asyncio.ensure_future(
+                        asyncio.to_thread(
+                            self._calculate_technicals, history_result, sp500_history
+                        )
+                    )
+
                     # Phase 3: Fetch metrics (with circuit breaker)
                     result.phase = CollectionPhase.METRICS
                     logger.info("Starting metrics collection (rate limited)")
@@ -204,9 +215,7 @@ class USPipeline:
                     logger.info("Calculating technical indicators")
 
                     with self.metrics.phase("technicals"):
-                        technicals = self._calculate_technicals(
-                            history_result, sp500_history
-                        )
+                        technicals = await technicals_task
 
                     # Phase 5: Merge all data
                     result.phase = CollectionPhase.SAVE
@@ -261,6 +270,8 @@ class USPipeline:
                     raise
 
                 finally:
+                    if technicals_task is not None and not technicals_task.done():
+                        technicals_task.cancel()
                     result.ended_at = datetime.now()
                     await self._cleanup()
 
@@ -273,6 +284,9 @@ class USPipeline:
     ) -> BatchFetchResult[MetricsData]:
         """Fetch metrics with circuit breaker and rate limiter.
 
+        Tickers with a fresh entry in the metrics cache are served from it;
+        only the rest hit yfinance, and their successes are cached.
+
         Args:
             tickers: List of tickers
             metrics_collector: Metrics collector for tracking
@@ -280,16 +294,37 @@ class USPipeline:
         Returns:
             BatchFetchResult with metrics
         """
+        cache = MetricsCache(
+            path=self.config.metrics_cache_file,
+            ttl=self.config.metrics_cache_ttl,
+        )
+
+        cached: list[FetchResult[MetricsData]] = []
+        to_fetch: list[str] = []
+        for ticker in tickers:
+            data = cache.get_metrics(ticker)
+            if data is None:
+                to_fetch.append(ticker)
+            else:
+                cached.append(FetchResult(ticker=ticker, data=data, source="cache"))
+
+        if cached:
+            logger.info(
+                f"Metrics cache hit for {len(cached)} tickers, fetching {len(to_fetch)}"
+            )
+        if not to_fetch:
+            return BatchFetchResult(results=cached, source="cache")
+
         # Use circuit breaker to wrap metrics fetching
         try:
             async with self.circuit_breaker:
                 # Rate limit before making requests
-                await self.rate_limiter.acquire(len(tickers))
+                await self.rate_limiter.acquire(len(to_fetch))
 
                 # Use retry executor
                 result = await self.retry.execute(
                     self.yfinance.fetch_metrics,
-                    tickers,
+                    to_fetch,
                 )
 
                 # Check for rate limit errors in results
@@ -305,12 +340,21 @@ class USPipeline:
                         f"Rate limit errors in metrics: {rate_limit_count}"
                     )
 
-                return result
+                cache.put_all_metrics(
+                    r.data for r in result.succeeded if r.data is not None
+                )
+                cache.save()
+
+                return BatchFetchResult(
+                    results=cached + result.results,
+                    total_latency_ms=result.total_latency_ms,
+                    source=result.source,
+                )
 
         except CircuitOpenError:
-            # Circuit is open - return empty result
+            # Circuit is open - return cached results only
             metrics_collector.record_circuit_breaker_trip()
-            return BatchFetchResult(results=[], source="yfinance")
+            return BatchFetchResult(results=cached, source="yfinance")
 
     def _calculate_technicals(
         self,
@@ -327,25 +371,36 @@ class USPipeline:
             Dict mapping ticker to TechnicalIndicators
         """
         technicals: dict[str, TechnicalIndicators] = {}
+        today = date.today()
+        if sp500_history is not None and sp500_history.empty:
+            sp500_history = None
 
-        for result in history_result.succeeded:
-            if result.data is None:
-                continue
+        histories = {
+            result.ticker: result.data.data
+            for result in history_result.succeeded
+            if result.data is not None
+        }
 
-            ticker = result.ticker
-            df = result.data.data
+        # Calculate all technicals in one vectorized pass
+        try:
+            batch = calculate_technicals_batch(histories)
+        except Exception as e:
+            logger.warning(f"Failed to calculate technicals: {e}")
+            batch = {}
 
+        betas: dict[str, float | None] = {}
+        if sp500_history is not None:
             try:
-                # Calculate all technicals
-                tech_dict = calculate_all_technicals(df)
+                betas = calculate_beta_batch(histories, sp500_history)
+            except Exception as e:
+                logger.warning(f"Failed to calculate beta: {e}")
 
-                # Calculate Beta
-                beta = None
-                if sp500_history is not None and not sp500_history.empty:
-                    beta = calculate_beta(df, sp500_history)
+        for ticker, df in histories.items():
+            tech_dict = batch.get(ticker, {})
 
+            try:
                 # Get trading date from history
-                trading_date = date.today()
+                trading_date = today
                 if not df.empty and hasattr(df.index[-1], "date"):
                     trading_date = df.index[-1].date()
 
@@ -365,7 +420,7 @@ class USPipeline:
                 )
 
                 # Store beta temporarily
-                technicals[ticker]._beta = beta  # type: ignore
+                technicals[ticker]._beta = betas.get(ticker)  # type: ignore
 
             except Exception as e:
                 logger.debug(f"Failed to calculate technicals for {ticker}: {e}")
@@ -15,6 +15,7 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Callable
 
+from core.errors import CircuitOpenError
 from observability.logger import get_logger
 
 logger = get_logger(__name__)
@@ -106,8 +107,6 @@ class CircuitBreaker:
             CircuitOpenError: If circuit is open
             Original exception: If function fails
         """
-        from core.errors import CircuitOpenError
-
         async with self._lock:
             await self._check_state()
 
@@ -125,8 +124,6 @@ class CircuitBreaker:
 
     async def _check_state(self) -> None:
         """Check circuit state and allow/reject call."""
-        from core.errors import CircuitOpenError
-
         now = time.monotonic()
 
         if self._state == CircuitState.CLOSED:
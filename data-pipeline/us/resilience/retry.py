@@ -14,7 +14,7 @@ import random
 from dataclasses import dataclass, field
 from typing import Any, Callable
 
-from core.errors import PipelineError
+from core.errors import PipelineError, is_rate_limit_error
 from observability.logger import get_logger
 
 logger = get_logger(__name__)
@@ -128,13 +128,8 @@ class RetryExecutor:
         if isinstance(error, retryable_types):
             return True
 
-        # Check error message for rate limit indicators
-        error_str = str(error).lower()
-        rate_limit_indicators = ["429", "rate limit", "too many requests", "throttl"]
-        if any(indicator in error_str for indicator in rate_limit_indicators):
-            return True
-
-        return False
+        # Rate limits are retryable after backoff
+        return is_rate_limit_error(error)
 
     def _calculate_delay(self, attempt: int) -> float:
         """Calculate delay for retry attempt.
@@ -27,6 +27,7 @@ from core.errors import (
     RateLimitError,
     TimeoutError,
     classify_exception,
+    is_rate_limit_error,
 )
 from core.types import (
     BatchFetchResult,
@@ -473,7 +474,7 @@ class YFinanceSource:
             latency = (time.monotonic() - fetch_start) * 1000
 
             # Check for rate limit
-            if self._is_rate_limit_error(e):
+            if is_rate_limit_error(e):
                 return FetchResult(
                     ticker=ticker,
                     error=RateLimitError(str(e), ticker=ticker),
@@ -488,12 +489,6 @@ class YFinanceSource:
                 source="yfinance",
             )
 
-    def _is_rate_limit_error(self, error: Exception) -> bool:
-        """Check if error indicates rate limiting."""
-        error_str = str(error).lower()
-        rate_limit_indicators = ["429", "rate limit", "too many requests", "throttl"]
-        return any(indicator in error_str for indicator in rate_limit_indicators)
-
     def _extract_trading_date(self, df: pd.DataFrame) -> date:
         """Extract trading date from download DataFrame."""
         if df.empty:
@@ -589,8 +584,9 @@ class YFinanceSource:
         """Extract metrics from yfinance info dict."""
 
         def safe_get(key: str) -> Any:
+            # NaN is the only float that is not equal to itself
             val = info.get(key)
-            if val is None or (isinstance(val, float) and pd.isna(val)):
+            if val is None or (isinstance(val, float) and val != val):
                 return None
             return val
 
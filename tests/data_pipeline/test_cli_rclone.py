@@ -0,0 +1,146 @@
+"""Tests for the rclone remote-control helpers in data_pipeline/cli/main.py.
+
+rclone itself is never run: subprocess.Popen and urlopen are mocked.
+"""
+
+import io
+import json
+import socket
+import sys
+import urllib.error
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# Add data-pipeline to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "data-pipeline"))
+
+from cli import main as cli_main
+
+URL = "http://127.0.0.1:5572"
+AUTH = "Basic dXNlcjpwYXNz"
+
+
+def make_response(body: dict) -> MagicMock:
+    """urlopen() context manager returning a JSON body."""
+    response = MagicMock()
+    response.__enter__.return_value.read.return_value = json.dumps(body).encode()
+    return response
+
+
+@pytest.fixture(autouse=True)
+def fresh_daemon():
+    """Don't share a (mocked) daemon between tests."""
+    cli_main._rclone_daemon.cache_clear()
+    yield
+    cli_main._rclone_daemon.cache_clear()
+
+
+class TestRcloneRc:
+    """Tests for _rclone_rc()."""
+
+    def test_posts_json(self):
+        """Params are posted as JSON with auth and a timeout."""
+        with patch.object(
+            cli_main.urllib.request,
+            "urlopen",
+            return_value=make_response({"ok": True}),
+        ) as urlopen:
+            result = cli_main._rclone_rc(URL, AUTH, "sync/copy", {"srcFs": "/tmp"})
+
+        assert result == {"ok": True}
+        request = urlopen.call_args.args[0]
+        assert request.full_url == f"{URL}/sync/copy"
+        assert json.loads(request.data) == {"srcFs": "/tmp"}
+        assert request.get_header("Authorization") == AUTH
+        assert urlopen.call_args.kwargs["timeout"] == cli_main.RCLONE_RC_TIMEOUT
+
+    def test_http_error(self):
+        """rclone's error message is surfaced as a RuntimeError."""
+        error = urllib.error.HTTPError(
+            f"{URL}/sync/copy",
+            500,
+            "Internal Server Error",
+            {},
+            io.BytesIO(b'{"error": "directory not found"}'),
+        )
+        with (
+            patch.object(cli_main.urllib.request, "urlopen", side_effect=error),
+            pytest.raises(RuntimeError, match="directory not found"),
+        ):
+            cli_main._rclone_rc(URL, AUTH, "sync/copy", {})
+
+
+class TestRcloneDaemon:
+    """Tests for _rclone_daemon()."""
+
+    def test_starts_on_free_port(self):
+        """rcd is started on a free port and polled until it answers."""
+        proc = MagicMock()
+        proc.poll.return_value = None
+        with (
+            patch.object(cli_main, "_free_local_addr", return_value="127.0.0.1:40123"),
+            patch.object(cli_main.subprocess, "Popen", return_value=proc) as popen,
+            patch.object(cli_main.atexit, "register"),
+            patch.object(cli_main.time, "sleep"),
+            patch.object(
+                cli_main.urllib.request,
+                "urlopen",
+                side_effect=[
+                    urllib.error.URLError("connection refused"),
+                    make_response({}),
+                ],
+            ) as urlopen,
+        ):
+            url, auth = cli_main._rclone_daemon()
+
+        assert url == "http://127.0.0.1:40123"
+        assert auth.startswith("Basic ")
+        assert "--rc-addr=127.0.0.1:40123" in popen.call_args.args[0]
+        assert urlopen.call_count == 2
+        assert urlopen.call_args.args[0].full_url == f"{url}/rc/noop"
+
+    def test_reused(self):
+        """The daemon is started once per process."""
+        proc = MagicMock()
+        with (
+            patch.object(cli_main.subprocess, "Popen", return_value=proc) as popen,
+            patch.object(cli_main.atexit, "register"),
+            patch.object(
+                cli_main.urllib.request, "urlopen", return_value=make_response({})
+            ),
+        ):
+            assert cli_main._rclone_daemon() == cli_main._rclone_daemon()
+
+        popen.assert_called_once()
+
+    def test_exits_early(self):
+        """A daemon that exits before answering raises RuntimeError."""
+        proc = MagicMock()
+        proc.poll.return_value = 1
+        with (
+            patch.object(cli_main.subprocess, "Popen", return_value=proc),
+            patch.object(cli_main.atexit, "register"),
+            patch.object(
+                cli_main.urllib.request,
+                "urlopen",
+                side_effect=urllib.error.URLError("connection refused"),
+            ),
+            pytest.raises(RuntimeError, match="failed to start"),
+        ):
+            cli_main._rclone_daemon()
+
+        proc.terminate.assert_called_once()
+
+
+class TestFreeLocalAddr:
+    """Tests for _free_local_addr()."""
+
+    def test_port_is_bindable(self):
+        """The returned localhost port can be bound."""
+        host, port = cli_main._free_local_addr().split(":")
+
+        assert host == "127.0.0.1"
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.bind((host, int(port)))
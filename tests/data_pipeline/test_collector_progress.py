@@ -0,0 +1,75 @@
+"""Tests for progress saving in data_pipeline/collectors/base.py."""
+
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pandas as pd
+
+# Add data-pipeline to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "data-pipeline"))
+
+from collectors.base import BaseCollector
+
+
+class FailingCollector(BaseCollector):
+    """Collector whose price phase fails after some tickers were tracked."""
+
+    def get_tickers(self) -> list[str]:
+        return ["AAA", "BBB"]
+
+    async def fetch_prices_phase(
+        self, tickers: list[str]
+    ) -> tuple[dict[str, dict], list[str], str | None]:
+        self.progress_tracker.mark_completed("AAA")
+        raise RuntimeError("429 Too Many Requests")
+
+    async def fetch_metrics_phase(
+        self,
+        tickers: list[str],
+        history: dict[str, pd.DataFrame],
+    ) -> dict[str, dict]:
+        return {}
+
+    def build_company_record(
+        self,
+        ticker: str,
+        metrics: dict,
+        price_data: dict,
+    ) -> dict:
+        return {}
+
+    def build_metrics_record(
+        self,
+        ticker: str,
+        metrics: dict,
+        technicals: dict,
+        price_data: dict,
+    ) -> dict:
+        return {}
+
+    def build_price_record(self, ticker: str, price_data: dict) -> dict:
+        return {}
+
+
+class TestCollectProgress:
+    """Tests for progress flushing in collect()."""
+
+    def test_flushes_progress_on_failure(self):
+        """A failed run still writes its progress so it can resume."""
+        collector = FailingCollector(
+            market="US",
+            data_source=MagicMock(),
+            storage=MagicMock(),
+            settings=MagicMock(),
+            quiet=True,
+        )
+        tracker = MagicMock()
+        collector._progress_tracker = tracker
+
+        result = collector.collect()
+
+        assert result.errors == ["429 Too Many Requests"]
+        assert result.rate_limit_hit
+        tracker.mark_completed.assert_called_once_with("AAA")
+        tracker.save.assert_called_once_with(flush=True)
@@ -8,6 +8,7 @@ import math
 import sys
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -15,17 +16,22 @@ import pytest
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "data-pipeline"))
 
 from common.indicators import (
+    _ewm_mean,
     calculate_52_week_high_low,
+    calculate_52_week_high_low_batch,
     calculate_all_technicals,
     calculate_beta,
+    calculate_beta_batch,
     calculate_bollinger_bands,
     calculate_graham_number,
     calculate_ma_trend,
     calculate_macd,
     calculate_mfi,
     calculate_moving_averages,
+    calculate_moving_averages_batch,
     calculate_price_to_52w_high_pct,
     calculate_rsi,
+    calculate_technicals_batch,
     calculate_volume_change,
 )
 
@@ -397,6 +403,68 @@ class TestCalculateBeta:
         assert result is None
 
 
+class TestCalculateBetaBatch:
+    """Tests for calculate_beta_batch() - vectorized across tickers."""
+
+    def test_matches_per_ticker(
+        self, sample_ohlcv_df, sample_long_df, sample_short_df, sample_market_df
+    ):
+        """Histories of different lengths give the same values as one at a time."""
+        gappy = sample_long_df.drop(sample_long_df.index[[50, 120, 250]])
+        history = {
+            "AAA": sample_ohlcv_df,
+            "BBB": sample_long_df,
+            "CCC": sample_short_df,
+            "DDD": gappy,
+        }
+        result = calculate_beta_batch(history, sample_market_df)
+
+        for ticker, df in history.items():
+            expected = calculate_beta(df, sample_market_df)
+            assert result[ticker] == pytest.approx(expected), ticker
+
+    def test_skips_empty(self, sample_long_df, sample_empty_df, sample_market_df):
+        """Empty histories are left out of the result."""
+        result = calculate_beta_batch(
+            {"AAA": sample_long_df, "EMPTY": sample_empty_df}, sample_market_df
+        )
+        assert list(result) == ["AAA"]
+
+    def test_empty_market_df(self, sample_long_df, sample_empty_df):
+        """Empty market history gives an empty mapping."""
+        assert calculate_beta_batch({"AAA": sample_long_df}, sample_empty_df) == {}
+
+    def test_malformed_frame_isolated(self, sample_long_df, sample_market_df):
+        """A frame that can't be read gives None for that ticker only."""
+        malformed = sample_long_df.astype(object)
+        malformed["Close"] = "n/a"
+        result = calculate_beta_batch(
+            {"AAA": sample_long_df, "BAD": malformed}, sample_market_df
+        )
+
+        assert result["AAA"] == pytest.approx(
+            calculate_beta(sample_long_df, sample_market_df)
+        )
+        assert result["BAD"] is None
+
+
+class TestEwmMean:
+    """Tests for _ewm_mean() kernel used by MACD."""
+
+    def test_matches_pandas(self, sample_ohlcv_df):
+        """Matches pandas ewm(adjust=False).mean()."""
+        close = sample_ohlcv_df["Close"]
+        expected = close.ewm(span=12, adjust=False).mean().to_numpy()
+        result = _ewm_mean(close.to_numpy(dtype=np.float64), 12)
+        np.testing.assert_allclose(result, expected)
+
+    def test_nan_gap_decays_previous_weight(self):
+        """NaNs are skipped but still decay the previous value's weight."""
+        values = np.array([np.nan, 1.0, np.nan, 5.0, np.nan, np.nan, 1.0])
+        result = _ewm_mean(values, 3)
+        np.testing.assert_allclose(result, [np.nan, 1.0, 1.0, 4.0, 4.0, 4.0, 1.375])
+
+
 class TestCalculateAllTechnicals:
     """Tests for calculate_all_technicals() - integration test."""
 
@@ -437,3 +505,134 @@ class TestCalculateAllTechnicals:
         assert result["rsi"] is None
         assert result["macd"] is None
         assert result["bb_upper"] is None
+
+
+class TestCalculateTechnicalsBatch:
+    """Tests for calculate_technicals_batch() - vectorized across tickers."""
+
+    def test_matches_per_ticker(
+        self, sample_ohlcv_df, sample_long_df, sample_short_df, sample_uptrend_df
+    ):
+        """Histories of different lengths give the same values as one at a time."""
+        history = {
+            "AAA": sample_ohlcv_df,
+            "BBB": sample_long_df,
+            "CCC": sample_short_df,
+            "DDD": sample_uptrend_df,
+        }
+        result = calculate_technicals_batch(history)
+
+        for ticker, df in history.items():
+            expected = calculate_all_technicals(df)
+            ma_short, ma_long = calculate_moving_averages(df)
+            expected["fifty_day_average"] = ma_short
+            expected["two_hundred_day_average"] = ma_long
+            assert result[ticker] == pytest.approx(expected), ticker
+
+    def test_skips_empty(self, sample_ohlcv_df, sample_empty_df):
+        """Empty histories are left out of the result."""
+        result = calculate_technicals_batch(
+            {"AAA": sample_ohlcv_df, "EMPTY": sample_empty_df}
+        )
+        assert list(result) == ["AAA"]
+
+    def test_empty_history(self):
+        """No tickers gives an empty mapping."""
+        assert calculate_technicals_batch({}) == {}
+
+    def test_malformed_frame_isolated(self, sample_ohlcv_df):
+        """Frames that can't be stacked are calculated one at a time."""
+        non_numeric = sample_ohlcv_df.astype(object)
+        non_numeric["Close"] = "n/a"
+        multi_index = sample_ohlcv_df.copy()
+        multi_index.columns = pd.MultiIndex.from_product(
+            [sample_ohlcv_df.columns, ["AAA"]]
+        )
+        history = {
+            "AAA": sample_ohlcv_df,
+            "TEXT": non_numeric,
+            "MULTI": multi_index,
+            "NOCLOSE": sample_ohlcv_df.drop(columns="Close"),
+        }
+        result = calculate_technicals_batch(history)
+
+        assert list(result) == list(history)
+        expected = calculate_technicals_batch({"AAA": sample_ohlcv_df})
+        assert result["AAA"] == expected["AAA"]
+        for ticker in ("TEXT", "MULTI", "NOCLOSE"):
+            expected = calculate_all_technicals(history[ticker])
+            assert result[ticker].items() >= expected.items(), ticker
+
+
+class TestCalculateMovingAveragesBatch:
+    """Tests for calculate_moving_averages_batch() - vectorized across tickers."""
+
+    def test_matches_per_ticker(
+        self, sample_ohlcv_df, sample_long_df, sample_short_df, sample_uptrend_df
+    ):
+        """Histories of different lengths give the same values as one at a time."""
+        history = {
+            "AAA": sample_ohlcv_df,
+            "BBB": sample_long_df,
+            "CCC": sample_short_df,
+            "DDD": sample_uptrend_df,
+        }
+        result = calculate_moving_averages_batch(history)
+
+        for ticker, df in history.items():
+            assert result[ticker] == calculate_moving_averages(df), ticker
+
+    def test_skips_empty(self, sample_ohlcv_df, sample_empty_df):
+        """Empty histories are left out of the result."""
+        result = calculate_moving_averages_batch(
+            {"AAA": sample_ohlcv_df, "EMPTY": sample_empty_df}
+        )
+        assert list(result) == ["AAA"]
+
+    def test_malformed_frame_isolated(self, sample_ohlcv_df):
+        """Frames that can't be stacked are calculated one at a time."""
+        non_numeric = sample_ohlcv_df.astype(object)
+        non_numeric["Close"] = "n/a"
+        history = {"AAA": sample_ohlcv_df, "TEXT": non_numeric}
+        result = calculate_moving_averages_batch(history, short_period=20)
+
+        for ticker, df in history.items():
+            assert result[ticker] == calculate_moving_averages(df, 20), ticker
+
+
+class TestCalculate52WeekHighLowBatch:
+    """Tests for calculate_52_week_high_low_batch() - vectorized across tickers."""
+
+    def test_matches_per_ticker(
+        self, sample_ohlcv_df, sample_long_df, sample_short_df, sample_uptrend_df
+    ):
+        """Histories of different lengths give the same values as one at a time."""
+        history = {
+            "AAA": sample_ohlcv_df,
+            "BBB": sample_long_df,
+            "CCC": sample_short_df,
+            "DDD": sample_uptrend_df,
+        }
+        result = calculate_52_week_high_low_batch(history)
+
+        for ticker, df in history.items():
+            assert result[ticker] == calculate_52_week_high_low(df), ticker
+
+    def test_skips_empty(self, sample_ohlcv_df, sample_empty_df):
+        """Empty histories are left out of the result."""
+        result = calculate_52_week_high_low_batch(
+            {"AAA": sample_ohlcv_df, "EMPTY": sample_empty_df}
+        )
+        assert list(result) == ["AAA"]
+
+    def test_malformed_frame_isolated(self, sample_ohlcv_df):
+        """Frames that can't be stacked are calculated one at a time."""
+        history = {
+            "AAA": sample_ohlcv_df,
+            "NOCLOSE": sample_ohlcv_df.drop(columns="Close"),
+        }
+        result = calculate_52_week_high_low_batch(history)
+
+        for ticker, df in history.items():
+            assert result[ticker] == calculate_52_week_high_low(df), ticker
+        assert result["NOCLOSE"][0] is not None
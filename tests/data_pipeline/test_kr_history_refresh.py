@@ -0,0 +1,134 @@
+"""Tests for incremental KR history refresh.
+
+Covers extend_history() in data_pipeline/kr/cache.py and
+KRPipeline._refresh_history(), with the Naver source mocked.
+"""
+
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pandas as pd
+import pytest
+
+# Add data-pipeline to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "data-pipeline"))
+
+from core.types import BatchFetchResult, FetchResult, HistoryData
+from kr.cache import extend_history
+from kr.pipeline import KRPipeline
+
+
+def make_history(index: pd.DatetimeIndex, start: float = 100.0) -> pd.DataFrame:
+    """OHLCV frame whose Close rises by 1 per row."""
+    close = [start + i for i in range(len(index))]
+    return pd.DataFrame(
+        {
+            "Open": close,
+            "High": close,
+            "Low": close,
+            "Close": close,
+            "Volume": [1000] * len(index),
+        },
+        index=index,
+    )
+
+
+@pytest.fixture
+def dates() -> pd.DatetimeIndex:
+    """Fifteen business days ending a few days ago."""
+    return pd.bdate_range(end=date.today() - timedelta(days=3), periods=15)
+
+
+class TestExtendHistory:
+    """Tests for extend_history()."""
+
+    def test_appends_after_settled_row(self, dates):
+        """The last cached row is replaced and newer rows are appended."""
+        full = make_history(dates)
+        base = full.iloc[:10].copy()
+        base.iloc[-1, base.columns.get_loc("Close")] = 0.0  # Partial intraday bar
+        recent = full.iloc[8:]
+
+        merged = extend_history(base, recent, dates[0])
+
+        pd.testing.assert_frame_equal(merged, full)
+
+    def test_changed_settled_close(self, dates):
+        """An adjusted close on the settled day means a full refetch."""
+        full = make_history(dates)
+        base = full.iloc[:10]
+        recent = make_history(dates, start=50.0).iloc[8:]  # e.g. after a split
+
+        assert extend_history(base, recent, dates[0]) is None
+
+    def test_recent_starts_after_settled_row(self, dates):
+        """A gap between the cache and the refetch means a full refetch."""
+        full = make_history(dates)
+
+        assert extend_history(full.iloc[:10], full.iloc[9:], dates[0]) is None
+
+    def test_short_base(self, dates):
+        """A base with fewer than two rows has no settled row to check."""
+        full = make_history(dates)
+
+        assert extend_history(full.iloc[:1], full, dates[0]) is None
+
+    def test_trims_to_window_start(self, dates):
+        """Rows before window_start are dropped."""
+        full = make_history(dates)
+
+        merged = extend_history(full.iloc[:10], full.iloc[8:], dates[5])
+
+        pd.testing.assert_frame_equal(merged, full.iloc[5:])
+
+
+class TestRefreshHistory:
+    """Tests for KRPipeline._refresh_history()."""
+
+    @pytest.mark.asyncio
+    async def test_refresh_and_fallback(self, dates):
+        """Matching entries are extended; the rest are returned as stale."""
+        full = make_history(dates)
+        adjusted = make_history(dates, start=50.0)
+        expired = {
+            "000001": full.iloc[:10],  # Lines up
+            "000002": full.iloc[:10],  # Settled close changed
+            "000003": full.iloc[:10],  # Refetch failed
+            "000004": full.iloc[:1],  # Too short to refresh
+        }
+
+        naver = MagicMock()
+        naver.fetch_history = AsyncMock(
+            return_value=BatchFetchResult(
+                results=[
+                    FetchResult(
+                        ticker="000001",
+                        data=HistoryData(ticker="000001", data=full.iloc[8:]),
+                        source="naver",
+                    ),
+                    FetchResult(
+                        ticker="000002",
+                        data=HistoryData(ticker="000002", data=adjusted.iloc[8:]),
+                        source="naver",
+                    ),
+                    FetchResult(ticker="000003", error=Exception("timeout")),
+                ],
+                source="naver",
+            )
+        )
+        pipeline = KRPipeline()
+        pipeline._naver = naver
+
+        refreshed, stale = await pipeline._refresh_history(expired)
+
+        # One refetch for the tickers sharing a settled day, starting on it
+        naver.fetch_history.assert_awaited_once_with(
+            ["000001", "000002", "000003"],
+            days=(date.today() - dates[8].date()).days,
+        )
+        assert [r.ticker for r in refreshed] == ["000001"]
+        pd.testing.assert_frame_equal(refreshed[0].data.data, full)
+        assert refreshed[0].source == "naver"
+        assert sorted(stale) == ["000002", "000003", "000004"]
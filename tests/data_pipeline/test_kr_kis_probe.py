@@ -0,0 +1,89 @@
+"""Tests for the KIS health probe in data_pipeline/kr/pipeline.py.
+
+The KIS source is mocked; no network calls are made.
+"""
+
+import sys
+from datetime import date
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+# Add data-pipeline to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "data-pipeline"))
+
+from core.errors import DataNotFoundError
+from core.types import BatchFetchResult, FetchResult, MetricsData
+from kr.config import KRConfig
+from kr.pipeline import KRPipeline
+
+PROBE = ("005930", "000660", "035420")
+
+
+def kis_result(ok: list[str], failed: list[str] = ()) -> BatchFetchResult:
+    """KIS BatchFetchResult with the given successes and failures."""
+    results = [
+        FetchResult(
+            ticker=t,
+            data=MetricsData(ticker=t, date=date(2025, 1, 2)),
+            latency_ms=10.0,
+            source="kis",
+        )
+        for t in ok
+    ]
+    results += [
+        FetchResult(ticker=t, error=DataNotFoundError("no data"), source="kis")
+        for t in failed
+    ]
+    return BatchFetchResult(results=results, total_latency_ms=10.0, source="kis")
+
+
+def make_pipeline(*responses: BatchFetchResult) -> tuple[KRPipeline, MagicMock]:
+    """Pipeline whose KIS source returns ``responses`` in order."""
+    kis = MagicMock()
+    kis.fetch_metrics = AsyncMock(side_effect=list(responses))
+    pipeline = KRPipeline(config=KRConfig(kis_probe_tickers=PROBE))
+    pipeline._kis = kis
+    return pipeline, kis
+
+
+class TestProbeKis:
+    """Tests for KRPipeline._probe_kis() and _sweep_kis()."""
+
+    @pytest.mark.asyncio
+    async def test_unhealthy(self):
+        """Most probe tickers failing means KIS is skipped."""
+        pipeline, _ = make_pipeline(kis_result(["005930"], ["000660", "035420"]))
+
+        assert await pipeline._probe_kis(["005930", "111111"]) is None
+
+    @pytest.mark.asyncio
+    async def test_probe_results_reused(self):
+        """The sweep skips probed tickers and keeps their results."""
+        universe = ["005930", "000660", "111111", "222222"]
+        pipeline, kis = make_pipeline(
+            kis_result(["005930", "000660"], ["035420"]),
+            kis_result(["111111"], ["222222"]),
+        )
+
+        probe = await pipeline._probe_kis(universe)
+        result = await pipeline._sweep_kis(universe, probe)
+
+        # 035420 isn't in the universe, so its result is dropped
+        assert kis.fetch_metrics.await_args_list[1].args == (["111111", "222222"],)
+        assert sorted(r.ticker for r in result.results) == sorted(universe)
+        assert [r.ticker for r in result.failed] == ["222222"]
+        assert result.total_latency_ms == 20.0
+
+    @pytest.mark.asyncio
+    async def test_no_probe_tickers(self):
+        """Without probe tickers KIS is assumed healthy and swept in full."""
+        pipeline, kis = make_pipeline(kis_result(["111111"]))
+        pipeline.config = KRConfig(kis_probe_tickers=())
+
+        probe = await pipeline._probe_kis(["111111"])
+        result = await pipeline._sweep_kis(["111111"], probe)
+
+        kis.fetch_metrics.assert_awaited_once_with(["111111"])
+        assert result.success_count == 1
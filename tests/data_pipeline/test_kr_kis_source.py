@@ -0,0 +1,57 @@
+"""Tests for KISSource._fetch_single_metrics() in data_pipeline/kr/sources/kis.py.
+
+The quote and ratio requests are mocked; no network calls are made.
+"""
+
+import asyncio
+import sys
+from datetime import date
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import pytest
+
+# Add data-pipeline to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "data-pipeline"))
+
+from kr.config import KRConfig
+from kr.sources.kis import KISSource
+
+
+class TestFetchSingleMetrics:
+    """Tests for KISSource._fetch_single_metrics()."""
+
+    @pytest.mark.asyncio
+    async def test_merges_quote_and_ratio(self):
+        """Quote and ratio fields are merged into one MetricsData."""
+        source = KISSource(config=KRConfig())
+        source._get_quote = AsyncMock(
+            return_value={"current_price": 53400, "per": 12.5}
+        )
+        source._get_financial_ratio = AsyncMock(return_value={"roe": 8.0})
+
+        result = await source._fetch_single_metrics("005930", date(2025, 1, 2))
+
+        assert result.is_success
+        assert result.data.pe_ratio == 12.5
+        assert result.data.roe == pytest.approx(0.08)
+
+    @pytest.mark.asyncio
+    async def test_failed_quote_waits_for_ratio(self):
+        """A failed quote still lets the ratio request finish first."""
+        finished = []
+
+        async def ratio(ticker):
+            await asyncio.sleep(0.01)
+            finished.append(ticker)
+            return {}
+
+        source = KISSource(config=KRConfig())
+        source._get_quote = AsyncMock(side_effect=ValueError("bad quote"))
+        source._get_financial_ratio = ratio
+
+        result = await source._fetch_single_metrics("005930", date(2025, 1, 2))
+
+        assert not result.is_success
+        assert "bad quote" in str(result.error)
+        assert finished == ["005930"]
@@ -0,0 +1,73 @@
+"""Tests for parsing Naver's siseJson chart response.
+
+Covers NaverSource._parse_chart() in data_pipeline/kr/sources/naver.py with
+canned responses; no network calls are made.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add data-pipeline to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "data-pipeline"))
+
+from kr.config import KRConfig
+from kr.sources.naver import NaverSource
+
+# Shape of a real siseJson response: a single-quoted header row, then one
+# row per day with a trailing foreign ownership ratio
+SISE_JSON = """
+ [['날짜', '시가', '고가', '저가', '종가', '거래량', '외국인소진율'],
+["20250102", 53400, 54000, 52900, 53400, 16630538, 50.12],
+
+["20250103", 52800, 55100, 52800.5, 54400, 18820211, 50.19]
+]
+"""
+
+
+@pytest.fixture
+def source() -> NaverSource:
+    """NaverSource with default config (no session is opened)."""
+    return NaverSource(config=KRConfig())
+
+
+class TestParseChart:
+    """Tests for NaverSource._parse_chart()."""
+
+    def test_parses_rows(self, source):
+        """Daily rows become a date-indexed OHLCV frame; the header is skipped."""
+        df = source._parse_chart(SISE_JSON)
+
+        assert list(df.columns) == ["Open", "High", "Low", "Close", "Volume"]
+        assert list(df.index) == [
+            pd.Timestamp("2025-01-02"),
+            pd.Timestamp("2025-01-03"),
+        ]
+        assert df.index.name == "Date"
+        assert df.iloc[0].tolist() == [53400, 54000, 52900, 53400, 16630538]
+        assert df["Low"].iat[1] == pytest.approx(52800.5)
+
+    def test_downcasts(self, source):
+        """Prices are float32 and volume the smallest fitting integer."""
+        df = source._parse_chart(SISE_JSON)
+
+        assert (df[["Open", "High", "Low", "Close"]].dtypes == np.float32).all()
+        assert df["Volume"].dtype == np.uint32
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "",
+            "[]",
+            " [['날짜', '시가', '고가', '저가', '종가', '거래량', '외국인소진율']]",
+            "<html><body>error</body></html>",
+            '[["2025-01-02", 53400, 54000, 52900, 53400, 16630538]]',
+        ],
+        ids=["empty", "no-rows", "header-only", "html", "malformed-date"],
+    )
+    def test_no_rows(self, source, text):
+        """Bodies without any daily row give None."""
+        assert source._parse_chart(text) is None
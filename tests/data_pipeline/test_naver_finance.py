@@ -6,6 +6,7 @@ TDD approach: Testing Naver Finance client.
 """
 
 import sys
+import time
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -408,6 +409,26 @@ class TestFetchBulk:
         assert "005930" in result
         assert "EMPTY" not in result
 
+    @pytest.mark.asyncio
+    async def test_rate_limited_to_concurrency_over_delay(self):
+        """fetch_bulk starts at most concurrency / delay tickers per second."""
+        client = NaverFinanceClient(concurrency=2, delay_between_requests=0.1)
+
+        async def mock_get_all_data(ticker: str):
+            return {"pe_ratio": 10.0}
+
+        with (
+            patch.object(client, "get_all_data", side_effect=mock_get_all_data),
+            patch.object(client, "_get_session", return_value=MagicMock()),
+        ):
+            start = time.monotonic()
+            result = await client.fetch_bulk([str(i) for i in range(6)])
+            elapsed = time.monotonic() - start
+
+        # 2 tickers burst, then 4 more at 20/s
+        assert len(result) == 6
+        assert elapsed >= 0.19
+
 
 # =============================================================================
 # Client Lifecycle Tests
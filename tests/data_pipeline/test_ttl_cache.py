@@ -0,0 +1,149 @@
+"""Tests for data_pipeline/common/ttl_cache.py and the caches built on it."""
+
+import sys
+from datetime import date
+from pathlib import Path
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+# Add data-pipeline to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "data-pipeline"))
+
+from common.ttl_cache import PICKLE_SERIALIZER, TTLFileCache
+from core.types import MetricsData
+from kr.cache import HistoryCache
+from us.cache import MetricsCache
+
+NOW = 1_700_000_000.0
+
+
+def at(seconds: float):
+    """Patch the cache clock to NOW + seconds."""
+    return patch("common.ttl_cache.time.time", return_value=NOW + seconds)
+
+
+@pytest.fixture(params=["json", "pickle"])
+def make_cache(request, tmp_path):
+    """Factory for a cache in each file format, sharing one path."""
+    suffix = ".json" if request.param == "json" else ".pkl"
+    path = tmp_path / f"cache{suffix}"
+
+    def make(**kwargs) -> TTLFileCache:
+        if request.param == "pickle":
+            kwargs.setdefault("serializer", PICKLE_SERIALIZER)
+        return TTLFileCache(path=path, **kwargs)
+
+    return make
+
+
+class TestTTLFileCache:
+    """Tests for TTLFileCache."""
+
+    def test_round_trip(self, make_cache):
+        """Saved entries are served by a new cache within the TTL."""
+        with at(0):
+            cache = make_cache(ttl=60)
+            cache.put("AAA", {"pe_ratio": 10.0})
+            cache.save()
+
+        with at(59):
+            assert make_cache(ttl=60).get("AAA") == {"pe_ratio": 10.0}
+
+    def test_expires_after_ttl(self, make_cache):
+        """Entries past the TTL are not served."""
+        with at(0):
+            cache = make_cache(ttl=60)
+            cache.put("AAA", 1)
+
+        with at(60):
+            assert cache.get("AAA") is None
+            assert cache.get_expired("AAA") is None
+
+    def test_expired_kept_within_max_age(self, make_cache):
+        """Expired entries are served by get_expired until max_age."""
+        with at(0):
+            cache = make_cache(ttl=60, max_age=3600)
+            cache.put("AAA", 1)
+
+        with at(30):
+            assert cache.get_expired("AAA") is None
+        with at(120):
+            assert cache.get("AAA") is None
+            assert cache.get_expired("AAA") == 1
+        with at(3600):
+            assert cache.get_expired("AAA") is None
+
+    def test_ttl_zero_disables(self, make_cache):
+        """A TTL of 0 neither stores, reads, nor writes entries."""
+        with at(0):
+            cache = make_cache(ttl=60)
+            cache.put("AAA", 1)
+            cache.save()
+
+            disabled = make_cache(ttl=0)
+            assert not disabled.enabled
+            assert disabled.get("AAA") is None
+
+            disabled.put("BBB", 2)
+            assert disabled.get("BBB") is None
+            disabled.save()
+
+            assert make_cache(ttl=60).get("BBB") is None
+
+    def test_corrupt_file(self, make_cache):
+        """A corrupt file is treated as an empty cache and overwritten."""
+        cache = make_cache(ttl=60)
+        cache.path.write_bytes(b"\x80not a cache")
+
+        with at(0):
+            cache = make_cache(ttl=60)
+            assert cache.get("AAA") is None
+
+            cache.put("AAA", 1)
+            cache.save()
+            assert make_cache(ttl=60).get("AAA") == 1
+
+    def test_save_prunes_old_entries(self, make_cache):
+        """Entries past max(ttl, max_age) are not written back."""
+        with at(0):
+            cache = make_cache(ttl=60, max_age=600)
+            cache.put("OLD", 1)
+        with at(500):
+            cache.put("NEW", 2)
+        with at(700):
+            cache.save()
+            reloaded = make_cache(ttl=60, max_age=600)
+
+        assert set(reloaded._entries) == {"NEW"}
+
+
+class TestHistoryCache:
+    """Tests for HistoryCache (pickled DataFrames)."""
+
+    def test_round_trip(self, tmp_path, sample_ohlcv_df):
+        """DataFrames survive a save and reload."""
+        path = tmp_path / "history.pkl"
+        cache = HistoryCache(path=path)
+        cache.put_all([("005930", sample_ohlcv_df)])
+        cache.save()
+
+        pd.testing.assert_frame_equal(
+            HistoryCache(path=path).get("005930"), sample_ohlcv_df
+        )
+
+
+class TestMetricsCache:
+    """Tests for MetricsCache (MetricsData as JSON)."""
+
+    def test_round_trip(self, tmp_path):
+        """MetricsData survives a save and reload."""
+        path = tmp_path / "metrics.json"
+        data = MetricsData(ticker="AAPL", date=date(2025, 1, 2), pe_ratio=30.5)
+        cache = MetricsCache(path=path)
+        cache.put_all_metrics([data])
+        cache.save()
+
+        assert MetricsCache(path=path).get_metrics("AAPL") == data
+        assert MetricsCache(path=path).get_metrics("MSFT") is None
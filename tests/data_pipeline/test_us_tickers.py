@@ -0,0 +1,48 @@
+"""Tests for the US ticker universe in data_pipeline/collectors/us_collector.py."""
+
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pandas as pd
+
+# Add data-pipeline to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "data-pipeline"))
+
+from collectors import us_collector
+from collectors.us_collector import get_all_us_tickers
+
+COMPANIES = pd.DataFrame(
+    {
+        "ticker": ["AAPL", "NA", "SPY"],
+        "name": ["Apple Inc.", "National Bank Holdings", "SPDR S&P 500 ETF"],
+        "market": ["NASDAQ", "US", "US"],
+        "exchange": ["NASDAQ", "NYSE", "NYSE ARCA"],
+        "is_etf": [False, False, True],
+    }
+)
+
+
+class TestGetAllUsTickers:
+    """Tests for get_all_us_tickers()."""
+
+    def test_fresh_csv_excludes_etfs(self, tmp_path):
+        """A fresh companies CSV is reused, without ETFs."""
+        path = tmp_path / "us_companies.csv"
+        COMPANIES.to_csv(path, index=False)
+
+        with patch.object(us_collector, "fetch_us_tickers") as fetch:
+            tickers = get_all_us_tickers(path, ttl_seconds=3600)
+
+        fetch.assert_not_called()
+        assert tickers == {"AAPL": [], "NA": []}
+
+    def test_fetch_excludes_etfs(self, tmp_path):
+        """A missing or stale CSV falls back to NASDAQ FTP, without ETFs."""
+        with patch.object(
+            us_collector, "fetch_us_tickers", return_value=COMPANIES
+        ) as fetch:
+            tickers = get_all_us_tickers(tmp_path / "missing.csv", ttl_seconds=3600)
+
+        fetch.assert_called_once()
+        assert tickers == {"AAPL": [], "NA": []}
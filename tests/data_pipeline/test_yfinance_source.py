@@ -0,0 +1,117 @@
+"""Tests for data_pipeline/sources/yfinance_source.py.
+
+yfinance calls are replaced with mocks; only the batching, backoff and
+timeout handling around them is tested.
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+# Add data-pipeline to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "data-pipeline"))
+
+from sources.yfinance_source import YFinanceSource
+
+
+def make_source(**kwargs) -> YFinanceSource:
+    """Source with no inter-batch delay."""
+    return YFinanceSource(base_delay=0.0, jitter=0.0, **kwargs)
+
+
+def mock_fetch(outcomes: dict):
+    """Mock for _fetch_single_metrics returning or raising per ticker."""
+
+    async def fetch(ticker: str):
+        outcome = outcomes[ticker]
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    return fetch
+
+
+class TestFetchMetrics:
+    """Tests for fetch_metrics() batch handling."""
+
+    @pytest.mark.asyncio
+    async def test_stop_mid_batch_keeps_fetched_results(self):
+        """Stopping at the rate-limit cap keeps the rest of the batch's results."""
+        source = make_source(batch_size=4)
+        source._consecutive_rate_limits = 3
+        outcomes = {
+            "A": None,
+            "B": Exception("429 Too Many Requests"),
+            "C": {"pe_ratio": 10.0},
+            "D": {"pe_ratio": 11.0},
+            "E": {"pe_ratio": 12.0},
+        }
+
+        with (
+            patch.object(
+                source, "_fetch_single_metrics", side_effect=mock_fetch(outcomes)
+            ),
+            patch.object(source, "_handle_rate_limit", new=AsyncMock()) as backoff,
+        ):
+            result = await source.fetch_metrics(list(outcomes))
+
+        assert set(result.succeeded) == {"C", "D"}
+        assert result.failed["A"] == "No metrics data"
+        assert "429" in result.failed["B"]
+        assert result.failed["E"] == "Rate limit - collection stopped"
+        backoff.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_backs_off_once_per_batch(self):
+        """Several rate-limited tickers in one batch back off only once."""
+        source = make_source(batch_size=4)
+        outcomes = {
+            "A": Exception("429 Too Many Requests"),
+            "B": Exception("Rate limit exceeded"),
+            "C": TimeoutError("Timeout fetching metrics for C"),
+            "D": {"pe_ratio": 10.0},
+        }
+
+        with (
+            patch.object(
+                source, "_fetch_single_metrics", side_effect=mock_fetch(outcomes)
+            ),
+            patch.object(source, "_handle_rate_limit", new=AsyncMock()) as backoff,
+        ):
+            result = await source.fetch_metrics(list(outcomes))
+
+        assert list(result.succeeded) == ["D"]
+        assert set(result.failed) == {"A", "B", "C"}
+        backoff.assert_awaited_once()
+
+
+class TestRunInExecutor:
+    """Tests for _run_in_executor() timeouts."""
+
+    @pytest.mark.asyncio
+    async def test_queued_calls_do_not_time_out(self):
+        """Time spent waiting for a free worker doesn't count."""
+        source = make_source(max_workers=1)
+
+        def slow():
+            time.sleep(0.2)
+            return "ok"
+
+        # The second call waits ~0.2s for the single worker, then runs 0.2s
+        results = await asyncio.gather(
+            source._run_in_executor(slow, 0.3),
+            source._run_in_executor(slow, 0.3),
+        )
+        assert results == ["ok", "ok"]
+
+    @pytest.mark.asyncio
+    async def test_times_out_slow_call(self):
+        """A call running longer than the limit raises TimeoutError."""
+        source = make_source(max_workers=1)
+
+        with pytest.raises(TimeoutError):
+            await source._run_in_executor(lambda: time.sleep(0.3), 0.05)